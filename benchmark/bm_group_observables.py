@@ -0,0 +1,94 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmark for partitioning the terms of a Hamiltonian into qubit-wise commuting groups.
+"""
+# pylint: disable=invalid-name
+import time
+import tracemalloc
+
+import numpy as np
+import pennylane as qml
+
+import benchmark_utils as bu
+
+PAULIS = [qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ]
+
+
+def random_pauli_words(n_terms, n_wires, max_weight=4, seed=0):
+    """Create a list of distinct random Pauli words.
+
+    The Pauli words act non-trivially on at most ``max_weight`` wires, similar
+    to the terms of molecular Hamiltonians.
+
+    Args:
+        n_terms (int): number of Pauli words
+        n_wires (int): number of wires the Pauli words act on
+        max_weight (int): maximum number of non-identity factors
+        seed (int): seed for the random number generator
+
+    Returns:
+        list[Observable]: the Pauli words
+    """
+    rng = np.random.default_rng(seed)
+    words = set()
+
+    while len(words) < min(n_terms, 4 ** n_wires - 1):
+        word = np.zeros(n_wires, dtype=int)
+        support = rng.choice(n_wires, size=min(max_weight, n_wires), replace=False)
+        word[support] = rng.integers(0, 4, size=len(support))
+        if word.any():
+            words.add(tuple(word))
+
+    return [
+        qml.operation.Tensor(*[PAULIS[p](w) for w, p in enumerate(word) if p])
+        for word in sorted(words)
+    ]
+
+
+class Benchmark(bu.BaseBenchmark):
+    """Measurement grouping benchmark.
+
+    Partitions ``n`` random Pauli words on the wires of the device into qubit-wise
+    commuting groups using each of the graph colouring methods in ``methods``. Each
+    measurement covers the full :func:`~.group_observables` call, including the
+    construction of the complementary graph. In verbose mode, the runtime, peak memory
+    and number of groups of each method are printed.
+    """
+
+    name = "group observables"
+    min_wires = 2
+    n_vals = range(250, 2001, 250)
+    methods = ("lf", "dsatur", "greedy")
+
+    def benchmark(self, n=1000):
+        # n is the number of Pauli words
+        observables = random_pauli_words(n, self.n_wires)
+
+        for method in self.methods:
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            groups = qml.grouping.group_observables(observables, method=method)
+            runtime = time.perf_counter() - t0
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            if self.verbose:
+                print(
+                    "{}: {} groups in {:.3f} s, peak memory {:.1f} MB".format(
+                        method, len(groups), runtime, peak / 2 ** 20
+                    )
+                )
+
+        return True
@@ -38,6 +38,10 @@ from pennylane import Device
 from pennylane.math import sum as qmlsum
 from pennylane.wires import Wires
 
+_OBSERVABLE_GROUPS_CACHE_SIZE = 32
+"""int: maximum number of observable groupings memoised per device by
+:meth:`QubitDevice.observable_groups`"""
+
 
 class QubitDevice(Device):
     """Abstract base class for PennyLane qubit devices.
@@ -136,6 +140,10 @@ class QubitDevice(Device):
         """OrderedDict[int: Any]: Mapping from hashes of the circuit to results of executing the
         device."""
 
+        self._observable_groups = OrderedDict()
+        """OrderedDict[tuple, list[list[int]]]: Mapping from the measured Pauli words of a circuit
+        to the indices of the observables in each group of qubit-wise commuting observables."""
+
     @classmethod
     def capabilities(cls):
 
@@ -200,15 +208,24 @@ class QubitDevice(Device):
 
         self.check_validity(circuit.operations, circuit.observables)
 
-        # apply all circuit operations
-        self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
+        groups = self.observable_groups(circuit)
+
+        if groups is not None:
+            # measure each group of observables on a copy of the same prepared state
+            results = self.grouped_statistics(
+                circuit.operations, circuit.observables, groups, **kwargs
+            )
+
+        else:
+            # apply all circuit operations
+            self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
 
-        # generate computational basis samples
-        if (not self.analytic) or circuit.is_sampled:
-            self._samples = self.generate_samples()
+            # generate computational basis samples
+            if (not self.analytic) or circuit.is_sampled:
+                self._samples = self.generate_samples()
 
-        # compute the required statistics
-        results = self.statistics(circuit.observables)
+            # compute the required statistics
+            results = self.statistics(circuit.observables)
 
         if circuit.all_sampled or not circuit.is_sampled:
             results = self._asarray(results)
@@ -225,6 +242,69 @@ class QubitDevice(Device):
 
         return results
 
+    def observable_groups(self, circuit):
+        """Returns the groups of qubit-wise commuting observables into which the observables
+        of a circuit are partitioned, if they are to be measured on copies of the same
+        prepared state.
+
+        This is the case if the device supports the ``supports_observable_groups`` capability,
+        and the circuit measures expectation values of Pauli words that act on shared wires
+        and are not already diagonal in the computational basis.
+
+        Args:
+            circuit (~.tape.QuantumTape): circuit to execute on the device
+
+        Returns:
+            list[list[int]] or None: the indices of the observables in each group, or ``None``
+            if the observables are to be measured jointly
+        """
+        if not self.capabilities().get("supports_observable_groups", False):
+            return None
+
+        shared_obs = getattr(circuit, "_obs_sharing_wires", None)
+
+        if not shared_obs or all(len(o.diagonalizing_gates()) == 0 for o in shared_obs):
+            return None
+
+        observables = circuit.observables
+
+        if not all(
+            o.return_type is Expectation and qml.grouping.is_pauli_word(o) for o in observables
+        ):
+            return None
+
+        key = tuple((str(o.name), tuple(o.wires.labels)) for o in observables)
+
+        if key in self._observable_groups:
+            self._observable_groups.move_to_end(key)
+            return self._observable_groups[key]
+
+        _, groups = qml.grouping.group_observables(observables, list(range(len(observables))))
+        self._observable_groups[key] = groups
+
+        if len(self._observable_groups) > _OBSERVABLE_GROUPS_CACHE_SIZE:
+            self._observable_groups.popitem(last=False)
+
+        return groups
+
+    def grouped_statistics(self, operations, observables, groups, **kwargs):
+        """Apply the circuit operations once, and measure each group of qubit-wise commuting
+        observables on a copy of the prepared state.
+
+        Devices that support this should set the ``supports_observable_groups``
+        capability to ``True``.
+
+        Args:
+            operations (list[~.Operation]): operations to apply to the device
+            observables (list[~.Observable]): the observables to be measured
+            groups (list[list[int]]): the indices of the observables in each group of
+                qubit-wise commuting observables
+
+        Returns:
+            list[Any]: the measured value of each observable, in the order of ``observables``
+        """
+        raise NotImplementedError
+
     @property
     def cache(self):
         """int: Number of device executions to store in a cache to speed up subsequent
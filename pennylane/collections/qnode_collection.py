@@ -14,10 +14,29 @@
 """
 Contains the QNodeCollection class.
 """
-# pylint: disable=too-many-arguments,import-outside-toplevel
+# pylint: disable=too-many-arguments,import-outside-toplevel,protected-access
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import warnings
 
+import pennylane as qml
+
+_EXECUTORS = {"threads": ThreadPoolExecutor, "processes": ProcessPoolExecutor}
+"""dict[str, type]: executors available for asynchronous QNodeCollection evaluation"""
+
+
+def _batch_execute(device, tapes):
+    """Execute a batch of tapes on a device.
+
+    Args:
+        device (.Device): the device to execute on
+        tapes (list[.QuantumTape]): the tapes to execute
+
+    Returns:
+        list[array[float]]: the result of each tape
+    """
+    return device.batch_execute(tapes)
+
 
 class QNodeCollection(Sequence):
     """Represents a sequence of independent QNodes that all share the same signature.
@@ -116,16 +135,21 @@ class QNodeCollection(Sequence):
     .. warning::
 
         Asynchronous evaluation is experimental --- please report all bugs and issues
-        to our GitHub page. It currently works with all interfaces, however backpropagation
-        and gradient computation is limited to Autograd and PyTorch. **Quantum gradients
-        using TensorFlow in asynchronous mode is currently not supported**.
+        to our GitHub page. In tape mode, it works with all interfaces, including
+        gradient computation. In non-tape mode, gradient computation is limited to
+        Autograd and PyTorch.
 
     By default, the QNodes within the QNodeCollection are executed sequentially.
+    In tape mode, the circuits of all QNodes that share a device are submitted to
+    that device in a single :meth:`~.Device.batch_execute` call.
 
-    However, experimental asynchronous support is now available using the
-    `Dask <https://dask.org/>`_ parallelism library. This can be activated
-    by passing the ``parallel=True`` keyword argument when evaluating the
-    QNodeCollection.
+    Asynchronous evaluation can be activated by passing the ``parallel=True``
+    keyword argument when evaluating the QNodeCollection. Circuits on different
+    devices are then executed concurrently, using a pool of threads (``scheduler="threads"``,
+    the default) or processes (``scheduler="processes"``). The maximum number of
+    workers can be set via the ``max_workers`` keyword argument.
+    QNodes that are differentiated using backpropagation are always evaluated
+    directly by the calling thread.
 
     For example, let's create the following two QVM simulation devices:
 
@@ -197,41 +221,103 @@ class QNodeCollection(Sequence):
             kwargs (dict): dictionary containing the keyword
                 arguments to pass to all internal QNodes
 
+        Keyword Args:
+            parallel=False (bool): whether to evaluate the QNodes asynchronously
+            scheduler="threads" (str): the pool used for asynchronous evaluation;
+                either ``"threads"`` or ``"processes"``
+            max_workers=None (int): the maximum number of workers used for
+                asynchronous evaluation. If not provided, the default of
+                :mod:`concurrent.futures` is used.
+
         Returns:
             list: the results from each QNode
         """
-        results = []
         parallel = kwargs.pop("parallel", False)
-        _scheduler = kwargs.pop("scheduler", "threads")
-
-        if parallel:
-            try:
-                import dask
-            except ImportError as e:  # pragma: no cover
-                raise ImportError(
-                    "Dask must be installed for parallel evaluation. "
-                    "\nDask can be installed using pip:"
-                    "\n\npip install dask[delayed]"
-                ) from e
+        scheduler = kwargs.pop("scheduler", "threads")
+        max_workers = kwargs.pop("max_workers", None)
+
+        if scheduler not in _EXECUTORS:
+            raise ValueError(f"Unknown scheduler '{scheduler}'. Must be one of {list(_EXECUTORS)}.")
+
+        executor = _EXECUTORS[scheduler](max_workers=max_workers) if parallel else None
+
+        try:
+            if qml.tape_mode_active():
+                return self._evaluate_batched(args, kwargs, executor)
+
+            if executor is None:
+                return [q(*args, **kwargs) for q in self.qnodes]
 
             if self.interface == "tf":
                 warnings.warn(
                     "Parallel execution of QNodeCollections is "
-                    "an experimental feature, and currently doesn't "
+                    "an experimental feature, and in non-tape mode doesn't "
                     "work with TensorFlow backpropagation. Please use "
                     "the PyTorch or Autograd interfaces instead.",
                     UserWarning,
                 )
 
-            for q in self.qnodes:
-                results.append(dask.delayed(q)(*args, **kwargs))
+            futures = [executor.submit(q, *args, **kwargs) for q in self.qnodes]
+            return [f.result() for f in futures]
+
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _evaluate_batched(self, args, kwargs, executor=None):
+        """Evaluate all QNodes in the collection, submitting the circuits of
+        all QNodes sharing a device in a single batch.
+
+        The quantum tapes are constructed and post-processed by each QNode in
+        the calling thread, so that they are recorded by any active
+        automatic differentiation framework; only the device executions
+        are performed by the executor.
 
-            return dask.compute(*results, scheduler=_scheduler)
+        Args:
+            args (list): list containing the arguments
+                to pass to all internal QNodes
+            kwargs (dict): dictionary containing the keyword
+                arguments to pass to all internal QNodes
+            executor (concurrent.futures.Executor or None): the executor used to
+                execute the batches of different devices concurrently. If ``None``,
+                the batches are executed sequentially.
+
+        Returns:
+            list: the results from each QNode
+        """
+        from pennylane.tape.qnode import _executable_tape
+
+        batches = {}
 
         for q in self.qnodes:
-            results.append(q(*args, **kwargs))
+            if q.mutable or q.qtape is None:
+                q.construct(args, kwargs)
 
-        return results
+            tape = _executable_tape(q)
+
+            if tape is not None:
+                batches.setdefault(id(q.device), (q.device, []))[1].append((q, tape))
+
+        batches = [b for b in batches.values() if len(b[1]) > 1 or executor is not None]
+
+        if executor is None:
+            results = [_batch_execute(dev, [t for _, t in b]) for dev, b in batches]
+        else:
+            futures = [
+                executor.submit(_batch_execute, dev, [t for _, t in b]) for dev, b in batches
+            ]
+            results = [f.result() for f in futures]
+
+        for (dev, batch), res in zip(batches, results):
+            for (q, _), r in zip(batch, res):
+                q.qtape._prefetched = (dev, r)
+
+        try:
+            return [q._execute_tape() for q in self.qnodes]
+        finally:
+            # discard any results that were not consumed by the QNode
+            for q in self.qnodes:
+                q.qtape._prefetched = None
 
     @staticmethod
     def convert_results(results, interface):
@@ -32,6 +32,78 @@ ABC_ARRAY = np.array(list(ABC))
 tolerance = 1e-10
 
 
+def _superoperator(kraus):
+    r"""Returns the superoperator of a channel, acting on the vectorized density matrix.
+
+    For Kraus operators :math:`K_i`, the superoperator is :math:`\sum_i K_i\otimes K_i^*`.
+
+    Args:
+        kraus (list[array]): Kraus operators
+
+    Returns:
+        array[complex]: superoperator of shape ``(4 ** num_wires, 4 ** num_wires)``
+    """
+    return sum(np.kron(k, np.conj(k)) for k in kraus)
+
+
+@functools.lru_cache()
+def _channel_superoperator(channel, params):
+    """Returns the superoperator of a channel class for the given parameters. Results are
+    cached, so that repeated applications of a channel do not recompute the superoperator.
+
+    Args:
+        channel (type): subclass of :class:`~.Channel`
+        params (tuple[float]): parameters of the channel
+
+    Returns:
+        array[complex]: superoperator of shape ``(4 ** num_wires, 4 ** num_wires)``
+    """
+    # pylint: disable=protected-access
+    superop = _superoperator(channel._kraus_matrices(*params))
+    superop.flags.writeable = False
+    return superop
+
+
+@functools.lru_cache()
+def _superoperator_indices(num_wires, channel_wires):
+    """Returns the einsum indices contracting a superoperator with a density matrix.
+
+    Args:
+        num_wires (int): number of wires of the density matrix
+        channel_wires (tuple[int]): wire indices the superoperator acts on
+
+    Returns:
+        str: einsum indices, e.g., ``"efac,abcd->ebfd"`` for a single-wire channel
+        acting on the first of two wires
+    """
+    num_ch_wires = len(channel_wires)
+    rho_dim = 2 * num_wires
+
+    # Tensor indices of the state. For each qubit, need an index for rows *and* columns
+    state_indices = ABC[:rho_dim]
+
+    row_indices = "".join(ABC_ARRAY[list(channel_wires)].tolist())
+    col_indices = "".join(ABC_ARRAY[[w + num_wires for w in channel_wires]].tolist())
+
+    new_row_indices = ABC[rho_dim : rho_dim + num_ch_wires]
+    new_col_indices = ABC[rho_dim + num_ch_wires : rho_dim + 2 * num_ch_wires]
+
+    new_state_indices = functools.reduce(
+        lambda old_string, idx_pair: old_string.replace(idx_pair[0], idx_pair[1]),
+        zip(col_indices + row_indices, new_col_indices + new_row_indices),
+        state_indices,
+    )
+
+    return "{}{}{}{},{}->{}".format(
+        new_row_indices,
+        new_col_indices,
+        row_indices,
+        col_indices,
+        state_indices,
+        new_state_indices,
+    )
+
+
 class DefaultMixed(QubitDevice):
     """Default qubit device for performing mixed-state computations in PennyLane.
 
@@ -94,6 +166,14 @@ class DefaultMixed(QubitDevice):
         "QubitChannel",
     }
 
+    _pauli_channels = {
+        "BitFlip": lambda p: (1 - p, p, 0, 0),
+        "PhaseFlip": lambda p: (1 - p, 0, 0, p),
+        "DepolarizingChannel": lambda p: (1 - p, p / 3, p / 3, p / 3),
+    }
+    """dict[str, callable]: Single-qubit Pauli channels, mapping the channel parameters to
+    the probabilities of applying the identity, ``PauliX``, ``PauliY`` and ``PauliZ``."""
+
     def __init__(self, wires, *, shots=1000, analytic=True, cache=0):
         if isinstance(wires, int) and wires > 23:
             raise ValueError(
@@ -203,6 +283,26 @@ class DefaultMixed(QubitDevice):
 
         return [operation.matrix]
 
+    def _get_superoperator(self, operation):  # pylint: disable=no-self-use
+        """Return the superoperator representing a channel.
+
+        Superoperators of channels with scalar parameters are cached.
+
+        Args:
+            operation (.Channel): a PennyLane channel
+
+        Returns:
+            array[complex]: superoperator of shape ``(4 ** num_wires, 4 ** num_wires)``
+        """
+        try:
+            params = tuple(float(p) for p in operation.parameters)
+        except TypeError:
+            # channels with non-scalar parameters, such as the Kraus
+            # operators of a QubitChannel, are not cached
+            return _superoperator(operation.kraus_matrices)
+
+        return _channel_superoperator(type(operation), params)
+
     def _apply_channel(self, kraus, wires):
         r"""Apply a quantum channel specified by a list of Kraus operators to subsystems of the
         quantum state. For a unitary gate, there is a single Kraus operator.
@@ -275,6 +375,56 @@ class DefaultMixed(QubitDevice):
 
         self._state = self._einsum(einsum_indices, kraus, self._state, kraus_dagger)
 
+    def _apply_superoperator(self, superop, wires):
+        r"""Apply a quantum channel specified by its superoperator to subsystems of the
+        quantum state, as a single contraction with the vectorized density matrix.
+
+        Args:
+            superop (array): superoperator of shape ``(4 ** len(wires), 4 ** len(wires))``
+            wires (Wires): target wires
+        """
+        channel_wires = self.map_wires(wires)
+
+        superop = self._reshape(superop, [2] * 4 * len(channel_wires))
+        superop = self._cast(superop, dtype=self.C_DTYPE)
+
+        einsum_indices = _superoperator_indices(self.num_wires, tuple(channel_wires.tolist()))
+        self._state = self._einsum(einsum_indices, superop, self._state)
+
+    def _apply_pauli_channel(self, probs, wires):
+        r"""Apply a single-qubit Pauli channel
+
+        .. math:: \rho \mapsto p_I\rho + p_X X\rho X + p_Y Y\rho Y + p_Z Z\rho Z.
+
+        Conjugating by ``PauliX`` flips the row and column index of the target wire, and
+        conjugating by ``PauliZ`` changes the sign of the elements whose row and column index
+        differ. The channel is therefore applied in closed form as
+        :math:`A\odot\rho + B\odot X\rho X`, where :math:`A` and :math:`B` are
+        :math:`2\times 2` coefficient matrices broadcast over the target wire.
+
+        Args:
+            probs (tuple[float]): probabilities of applying the identity, ``PauliX``,
+                ``PauliY`` and ``PauliZ``
+            wires (Wires): target wire
+        """
+        p_i, p_x, p_y, p_z = probs
+        row = self.map_wires(wires).tolist()[0]
+        col = row + self.num_wires
+
+        # coefficient matrices broadcast over the row and column index of the target wire
+        shape = [1] * 2 * self.num_wires
+        shape[row] = shape[col] = 2
+
+        coeffs = np.array([[p_i + p_z, p_i - p_z], [p_i - p_z, p_i + p_z]])
+        state = self._state * self._cast(np.reshape(coeffs, shape), dtype=self.C_DTYPE)
+
+        if p_x or p_y:
+            coeffs = np.array([[p_x + p_y, p_x - p_y], [p_x - p_y, p_x + p_y]])
+            flipped = self._roll(self._state, 1, (row, col))
+            state = state + flipped * self._cast(np.reshape(coeffs, shape), dtype=self.C_DTYPE)
+
+        self._state = state
+
     def _apply_diagonal_unitary(self, eigvals, wires):
         r"""Apply a diagonal unitary gate specified by a list of eigenvalues. This method uses
         the fact that the unitary is diagonal for a more efficient implementation.
@@ -392,6 +542,15 @@ class DefaultMixed(QubitDevice):
             self._apply_basis_state(operation.parameters[0], wires)
             return
 
+        if operation.name in self._pauli_channels:
+            probs = self._pauli_channels[operation.name](*operation.parameters)
+            self._apply_pauli_channel(probs, wires)
+            return
+
+        if isinstance(operation, Channel):
+            self._apply_superoperator(self._get_superoperator(operation), wires)
+            return
+
         matrices = self._get_kraus(operation)
 
         if isinstance(operation, DiagonalOperation):
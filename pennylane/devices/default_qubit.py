@@ -18,6 +18,7 @@ It implements the necessary :class:`~pennylane._device.Device` methods as well a
 :mod:`qubit operations <pennylane.ops.qubit>`, and provides a very simple pure state
 simulation of a qubit-based quantum circuit architecture.
 """
+import copy
 import itertools
 import functools
 from string import ascii_letters as ABC
@@ -25,6 +26,7 @@ from collections import OrderedDict
 
 import numpy as np
 
+import pennylane as qml
 from pennylane import QubitDevice, DeviceError, QubitStateVector, BasisState
 from pennylane.operation import DiagonalOperation
 from pennylane.wires import WireError
@@ -125,6 +127,11 @@ class DefaultQubit(QubitDevice):
 
     observables = {"PauliX", "PauliY", "PauliZ", "Hadamard", "Hermitian", "Identity"}
 
+    _checkpoint = None
+    """callable or None: For devices supporting backpropagation, transforms a function of the
+    state and gate parameters into a function whose intermediate values are recomputed,
+    rather than stored, for the backward pass."""
+
     def __init__(self, wires, *, shots=1000, analytic=True, cache=0):
         # call QubitDevice init
         super().__init__(wires, shots, analytic, cache=cache)
@@ -134,6 +141,15 @@ class DefaultQubit(QubitDevice):
         self._state = self._create_basis_state(0)
         self._pre_rotated_state = self._state
 
+        # the number of gates between stored states for the backward pass, if checkpointing
+        self._checkpoint_every = None
+
+        # the maximum number of compiled circuit structures, if compiling circuits
+        self._compile_cache_size = 0
+        self._compile_cache = OrderedDict()
+        """OrderedDict[tuple, dict]: Mapping from circuit structures to the compiled
+        functions evaluating circuits of that structure."""
+
         self._apply_ops = {
             "PauliX": self._apply_x,
             "PauliY": self._apply_y,
@@ -170,6 +186,7 @@ class DefaultQubit(QubitDevice):
 
     def apply(self, operations, rotations=None, **kwargs):
         rotations = rotations or []
+        unitaries = []
 
         # apply the circuit operations
         for i, operation in enumerate(operations):
@@ -185,7 +202,9 @@ class DefaultQubit(QubitDevice):
             elif isinstance(operation, BasisState):
                 self._apply_basis_state(operation.parameters[0], operation.wires)
             else:
-                self._state = self._apply_operation(self._state, operation)
+                unitaries.append(operation)
+
+        self._state = self._apply_operations(self._state, unitaries)
 
         # store the pre-rotated state
         self._pre_rotated_state = self._state
@@ -194,6 +213,283 @@ class DefaultQubit(QubitDevice):
         for operation in rotations:
             self._state = self._apply_operation(self._state, operation)
 
+    def _apply_operations(self, state, operations):
+        """Applies a sequence of operations to a state.
+
+        If gate-level checkpointing is enabled, consecutive operations are grouped into
+        segments of at most ``checkpoint_every`` operations. Each segment is applied as a single
+        checkpointed function of the state and its gate parameters, so that only the states
+        between segments are stored for the backward pass, and the states within a segment
+        are recomputed. Operations with parameters but without a differentiable
+        implementation in :attr:`parametric_ops` are applied outside of the segments.
+
+        Args:
+            state (array[complex]): input state
+            operations (list[~.Operation]): operations to apply
+
+        Returns:
+            array[complex]: output state
+        """
+        if not self._checkpoint_every:
+            for operation in operations:
+                state = self._apply_operation(state, operation)
+
+            return state
+
+        parametric_ops = getattr(self, "parametric_ops", {})
+        segment = []
+
+        for operation in operations:
+            if operation.parameters and operation.name not in parametric_ops:
+                state = self._apply_segment(state, segment)
+                state = self._apply_operation(state, operation)
+                segment = []
+                continue
+
+            segment.append(operation)
+
+            if len(segment) == self._checkpoint_every:
+                state = self._apply_segment(state, segment)
+                segment = []
+
+        return self._apply_segment(state, segment)
+
+    def _apply_segment(self, state, operations):
+        """Applies a segment of operations to a state as a single checkpointed function
+        of the state and the gate parameters.
+
+        Args:
+            state (array[complex]): input state
+            operations (list[~.Operation]): operations to apply
+
+        Returns:
+            array[complex]: output state
+        """
+        if not operations:
+            return state
+
+        # the parameters of the copied operations are set by the checkpointed function
+        copies = [copy.copy(op) for op in operations]
+        params = [p for op in operations for p in op.parameters]
+
+        def segment(state, *params):
+            idx = 0
+
+            for op in copies:
+                num_params = len(op.data)
+                op.data = list(params[idx : idx + num_params])
+                idx += num_params
+
+                state = self._apply_operation(state, op)
+
+            return state
+
+        return self._checkpoint(segment)(state, *params)
+
+    def _supports_compilation(self, circuit):
+        """Determines whether a circuit can be compiled into a function of its parameters.
+
+        Only analytic, non-sampled circuits, whose parametrized operations all have a
+        differentiable implementation in :attr:`parametric_ops`, and whose observables
+        have no parameters, are compiled.
+
+        Args:
+            circuit (.QuantumTape): the circuit to execute
+
+        Returns:
+            bool: whether the circuit can be compiled
+        """
+        if not self._compile_cache_size or not isinstance(circuit, qml.tape.QuantumTape):
+            return False
+
+        if not self.analytic or circuit.is_sampled:
+            return False
+
+        if any(m.obs is not None and m.obs.data for m in circuit.measurements):
+            return False
+
+        parametric_ops = getattr(self, "parametric_ops", {})
+        return all(not op.data or op.name in parametric_ops for op in circuit.operations)
+
+    def _compiled(self, circuit, transform, name):
+        """Returns a compiled function evaluating circuits with the same structure as the
+        provided circuit.
+
+        The functions are stored in a least-recently-used cache, keyed by circuit structure,
+        of size ``_compile_cache_size``.
+
+        Args:
+            circuit (.QuantumTape): the circuit to execute
+            transform (callable): compiles a function of the circuit parameters, for example
+                ``jax.jit`` or ``tf.function``
+            name (str): the name under which the compiled function is cached for
+                this structure
+
+        Returns:
+            callable: the compiled function of the circuit parameters, returning the circuit
+            results, the final state, and the pre-rotated state
+        """
+        key = circuit.get_structure()
+
+        if key in self._compile_cache:
+            self._compile_cache.move_to_end(key)
+            compiled = self._compile_cache[key]
+
+        else:
+            # the parameters of the copied circuit are replaced by tracers on compilation
+            template = circuit.copy(copy_operations=True, tape_cls=qml.tape.QuantumTape)
+
+            def fn(*params):
+                template.set_parameters(list(params), trainable_only=False)
+
+                self.reset()
+                results = DefaultQubit.execute(self, template)
+                return results, self._state, self._pre_rotated_state
+
+            compiled = {"fn": fn}
+            self._compile_cache[key] = compiled
+
+            if len(self._compile_cache) > self._compile_cache_size:
+                self._compile_cache.popitem(last=False)
+
+        if name not in compiled:
+            compiled[name] = transform(compiled["fn"])
+
+        return compiled[name]
+
+    def _execute_compiled(self, circuit, params, transform, batched=False):
+        """Executes a circuit using a compiled function of its parameters.
+
+        Args:
+            circuit (.QuantumTape): the circuit to execute
+            params (list[tensor_like]): the values of all parameters of the circuit
+            transform (callable): compiles a function of the circuit parameters; if ``batched``,
+                the compiled function must be vectorized over a leading batch dimension
+            batched (bool): whether ``params`` contain a leading batch dimension
+
+        Returns:
+            tensor_like: the circuit results
+        """
+        self.check_validity(circuit.operations, circuit.observables)
+        fn = self._compiled(circuit, transform, "vmap" if batched else "compiled")
+
+        # executions are counted here, rather than when the function is traced
+        num_executions = self._num_executions
+        results, state, pre_rotated_state = fn(*params)
+
+        if batched:
+            self._num_executions = num_executions + int(state.shape[0] or 0)
+
+            # the device is left in the state of the final set of parameter values
+            state = state[-1]
+            pre_rotated_state = pre_rotated_state[-1]
+
+        else:
+            self._num_executions = num_executions + 1
+
+        self._state = state
+        self._pre_rotated_state = pre_rotated_state
+        return results
+
+    def grouped_statistics(self, operations, observables, groups, **kwargs):
+        self.apply(operations, **kwargs)
+        prepared_state = self._state
+
+        results = [None] * len(observables)
+
+        for indices in groups:
+            rotations, diag_obs = qml.grouping.diagonalize_qwc_pauli_words(
+                [observables[i] for i in indices]
+            )
+
+            self._state = prepared_state
+
+            for operation in rotations:
+                self._state = self._apply_operation(self._state, operation)
+
+            if not self.analytic:
+                self._samples = self.generate_samples()
+
+            for i, obs in zip(indices, diag_obs):
+                obs.return_type = observables[i].return_type
+
+            for i, res in zip(indices, self.statistics(diag_obs)):
+                results[i] = res
+
+        self._state = prepared_state
+        return results
+
+    def metric_tensor(self, tape, diag_approx=False, wrt=None):
+        r"""Computes the block diagonal approximation to the metric tensor of a tape
+        in a single simulation of the circuit.
+
+        Rather than simulating the circuit preceding each parametrized layer separately,
+        as :func:`~.tape.transforms.metric_tensor` does, the operations are applied once
+        in order, and the covariance matrix of the layer generators,
+
+        .. math::
+
+            g_{ij} = s_i s_j (\langle G_i G_j\rangle - \langle G_i\rangle\langle G_j\rangle),
+
+        is evaluated directly on the state at the start of each layer.
+
+        Args:
+            tape (.QuantumTape): the tape to compute the metric tensor of
+            diag_approx (bool): If ``True`` the diagonal approximation to the metric
+                tensor is computed. If ``False``, a block diagonal approximation
+                to the metric tensor is computed.
+            wrt (Sequence[int]): Indices of the tape parameters with which to
+                compute the metric tensor. Defaults to the tape's trainable
+                parameters.
+
+        Returns:
+            array[float]: the metric tensor
+        """
+        tape, layers = qml.tape.transforms.metric_tensor_layers(tape, wrt=wrt)
+        self.reset()
+
+        # State preparations are only supported as the first operation, and are applied
+        # upfront since they need not be an ancestor of the first parametrized layer.
+        applied = set()
+
+        if tape.operations and isinstance(tape.operations[0], (QubitStateVector, BasisState)):
+            applied.add(tape.operations[0])
+            self.apply(tape.operations[:1])
+
+        blocks = []
+
+        for queue, obs, coeffs in layers:
+            # Operations applied for previous layers that are not ancestors of this
+            # layer act on other wires, and so commute with the layer generators.
+            ops = [op for op in queue if op not in applied]
+            applied.update(ops)
+            self.apply(ops)
+
+            psi = self._flatten(self._state)
+            phis = []
+
+            for o in obs:
+                if isinstance(o, qml.operation.Operation) and o.name in self._apply_ops:
+                    phi = self._apply_operation(self._state, o)
+                else:
+                    phi = self._apply_unitary(self._state, o.matrix, o.wires)
+
+                phis.append(self._flatten(phi))
+
+            phis = self._stack(phis)
+            expvals = self._real(self._dot(self._conj(phis), psi))
+            g = self._real(self._dot(self._conj(phis), self._transpose(phis)))
+            g = g - expvals[:, None] * expvals[None, :]
+
+            scale = np.outer(coeffs, coeffs)
+
+            if diag_approx:
+                scale = scale * np.identity(len(coeffs))
+
+            blocks.append(g * scale)
+
+        return qml.math.block_diag(blocks)
+
     def _apply_operation(self, state, operation):
         """Applies operations to the input state.
 
@@ -411,6 +707,7 @@ class DefaultQubit(QubitDevice):
             supports_inverse_operations=True,
             supports_analytic_computation=True,
             returns_state=True,
+            supports_observable_groups=True,
             passthru_devices={
                 "tf": "default.qubit.tf",
                 "autograd": "default.qubit.autograd",
@@ -14,6 +14,9 @@
 """This module contains an autograd implementation of the :class:`~.DefaultQubit`
 reference plugin.
 """
+from autograd import make_vjp
+from autograd.extend import primitive, defvjp_argnums
+
 from pennylane.operation import DiagonalOperation
 from pennylane import numpy as np
 
@@ -21,6 +24,37 @@ from pennylane.devices import DefaultQubit
 from pennylane.devices import autograd_ops
 
 
+def _recompute_grad(fun):
+    """Wraps a function so that its intermediate values are not stored by Autograd,
+    but recomputed when the vector-Jacobian product is evaluated.
+
+    Args:
+        fun (callable): function to wrap
+
+    Returns:
+        callable: Autograd primitive evaluating ``fun``
+    """
+    wrapped = primitive(fun)
+
+    def vjpmaker(argnums, ans, args, kwargs):  # pylint: disable=unused-argument
+        def f(*diff_args):
+            full_args = list(args)
+
+            for i, arg in zip(argnums, diff_args):
+                full_args[i] = arg
+
+            return fun(*full_args, **kwargs)
+
+        def vjp(g):
+            # the forward pass of the wrapped function is recomputed here
+            return make_vjp(f, tuple(range(len(argnums))))(*[args[i] for i in argnums])[0](g)
+
+        return vjp
+
+    defvjp_argnums(wrapped, vjpmaker)
+    return wrapped
+
+
 class DefaultQubitAutograd(DefaultQubit):
     """Simulator plugin based on ``"default.qubit"``, written using Autograd.
 
@@ -67,6 +101,15 @@ class DefaultQubitAutograd(DefaultQubit):
       When instantiating the device with ``analytic=False``, differentiating QNode
       outputs will result in an error.
 
+    **Checkpointing**
+
+    By default, backpropagation stores the state after every gate of the circuit. For
+    circuits with many wires and gates, the memory required can be reduced by
+    storing the state only every ``checkpoint_every`` gates; the states in between are
+    recomputed during the backward pass:
+
+    >>> dev = qml.device("default.qubit.autograd", wires=20, checkpoint_every=10)
+
     Args:
         wires (int): the number of wires to initialize the device with
         shots (int): How many times the circuit should be evaluated (or sampled) to estimate
@@ -78,6 +121,11 @@ class DefaultQubitAutograd(DefaultQubit):
             and variances analytically. In non-analytic mode, the ``diff_method="backprop"``
             QNode differentiation method is not supported and it is recommended to consider
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
+        checkpoint_every (int): If provided, gate-level checkpointing is used to reduce the
+            memory required for backpropagation. The state is stored only every
+            ``checkpoint_every`` gates, and the intermediate states are recomputed from the
+            nearest stored state during the backward pass. Smaller values use more memory and
+            less recomputation. If None, all intermediate states are stored.
     """
 
     name = "Default qubit (Autograd) PennyLane plugin"
@@ -112,6 +160,8 @@ class DefaultQubitAutograd(DefaultQubit):
     _imag = staticmethod(np.imag)
     _roll = staticmethod(np.roll)
     _stack = staticmethod(np.stack)
+    _real = staticmethod(np.real)
+    _checkpoint = staticmethod(_recompute_grad)
 
     @staticmethod
     def _asarray(array, dtype=None):
@@ -122,8 +172,9 @@ class DefaultQubitAutograd(DefaultQubit):
 
         return res
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
+    def __init__(self, wires, *, shots=1000, analytic=True, checkpoint_every=None):
         super().__init__(wires, shots=shots, analytic=analytic, cache=0)
+        self._checkpoint_every = checkpoint_every
 
         # prevent using special apply methods for these gates due to slowdown in Autograd
         # implementation
@@ -15,7 +15,9 @@
 reference plugin.
 """
 
+from collections import OrderedDict
 
+import pennylane as qml
 from pennylane.operation import DiagonalOperation
 from pennylane.devices import DefaultQubit
 from pennylane.devices import jax_ops
@@ -73,6 +75,24 @@ class DefaultQubitJax(DefaultQubit):
 
     .. UsageDetails::
 
+        **Compilation**
+
+        In tape mode, the device compiles each distinct circuit structure into a function of the
+        gate parameters using ``jax.jit``, so that QNodes do not need to be wrapped in ``jax.jit``
+        to benefit from compilation. A circuit is recompiled only if its structure---the
+        operations, wires, parameter shapes and measurements---changes. Compiled functions are
+        stored in a least-recently-used cache, of size ``jit_cache_size``.
+
+        Circuits that are sampled, that are executed with a finite number of shots, or that contain
+        state preparations, observables with parameters, or parametrized operations without a JAX
+        implementation, are executed operation by operation.
+
+        Several parameter values of a single circuit can be evaluated using a single vectorized
+        call with :meth:`~.vmap_execute`, and circuits of the same structure submitted via
+        :meth:`~.batch_execute` are evaluated in this manner.
+
+        **Randomness**
+
         JAX does randomness in a special way when compared to NumPy, in that all randomness needs to
         be seeded. While we handle this for you automatically in op-by-op mode, when using ``jax.jit``,
         the automatically generated seed gets constantant compiled.
@@ -112,9 +132,23 @@ class DefaultQubitJax(DefaultQubit):
             a = keyed_circuit(key1)
             b = keyed_circuit(key2) # b will be different samples now.
 
+        If a ``prng_key`` is provided, it is split on every execution, so that repeated
+        executions on the same device draw new samples, while remaining reproducible.
+        Executions traced by ``jax.jit`` do not update the key of the device; as above,
+        pass a new key to the compiled function to draw new samples.
+
         Check out out the `JAX random documentation <https://jax.readthedocs.io/en/latest/jax.random.html>`__
         for more information.
 
+    **Checkpointing**
+
+    By default, backpropagation stores the state after every gate of the circuit. For
+    circuits with many wires and gates, the memory required can be reduced by
+    storing the state only every ``checkpoint_every`` gates; the states in between are
+    recomputed during the backward pass using ``jax.checkpoint``:
+
+    >>> dev = qml.device("default.qubit.jax", wires=20, checkpoint_every=10)
+
     Args:
         wires (int): The number of wires to initialize the device with.
         shots (int): How many times the circuit should be evaluated (or sampled) to estimate
@@ -128,6 +162,13 @@ class DefaultQubitJax(DefaultQubit):
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
         prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is the key to the
             pseudo random number generator. If None, a random key will be generated.
+        jit_cache_size (int): The maximum number of compiled circuit structures to store.
+            If 0, circuits are always executed operation by operation.
+        checkpoint_every (int): If provided, gate-level checkpointing is used to reduce the
+            memory required for backpropagation. The state is stored only every
+            ``checkpoint_every`` gates, and the intermediate states are recomputed from the
+            nearest stored state during the backward pass. Smaller values use more memory and
+            less recomputation. If None, all intermediate states are stored.
 
     """
 
@@ -167,9 +208,21 @@ class DefaultQubitJax(DefaultQubit):
     _imag = staticmethod(jnp.imag)
     _roll = staticmethod(jnp.roll)
     _stack = staticmethod(jnp.stack)
-
-    def __init__(self, wires, *, shots=1000, analytic=True, prng_key=None):
+    _real = staticmethod(jnp.real)
+    _checkpoint = staticmethod(jax.checkpoint)
+
+    def __init__(
+        self,
+        wires,
+        *,
+        shots=1000,
+        analytic=True,
+        prng_key=None,
+        jit_cache_size=32,
+        checkpoint_every=None,
+    ):
         super().__init__(wires, shots=shots, analytic=analytic, cache=0)
+        self._checkpoint_every = checkpoint_every
 
         # prevent using special apply methods for these gates due to slowdown in jax
         # implementation
@@ -178,6 +231,8 @@ class DefaultQubitJax(DefaultQubit):
         del self._apply_ops["CZ"]
         self._prng_key = prng_key
 
+        self._compile_cache_size = jit_cache_size
+
     @classmethod
     def capabilities(cls):
         capabilities = super().capabilities().copy()
@@ -215,6 +270,96 @@ class DefaultQubitJax(DefaultQubit):
 
         return unitary.matrix
 
+    def execute(self, circuit, **kwargs):
+        if not self._supports_compilation(circuit):
+            return super().execute(circuit, **kwargs)
+
+        params = circuit.get_parameters(trainable_only=False)
+        return self._execute_compiled(circuit, params, jax.jit)
+
+    def vmap_execute(self, circuit, params):
+        """Execute a circuit for a batch of parameter values, using a single vectorized call
+        of the compiled circuit.
+
+        Args:
+            circuit (.QuantumTape): the circuit to execute
+            params (list[array]): The values of all parameters of the circuit, in the order given
+                by :meth:`~.QuantumTape.get_parameters` with ``trainable_only=False``. Each array
+                has a leading batch dimension.
+
+        Returns:
+            array[float]: the results of the circuit for each set of parameter values,
+            with a leading batch dimension
+
+        Raises:
+            DeviceError: if the circuit cannot be compiled
+
+        **Example**
+
+        >>> dev = qml.device("default.qubit.jax", wires=1)
+        >>> with qml.tape.QuantumTape() as tape:
+        ...     qml.RX(0.0, wires=0)
+        ...     qml.expval(qml.PauliZ(0))
+        >>> dev.vmap_execute(tape, [jnp.array([0.1, 0.2, 0.3])])
+        DeviceArray([[0.9950042 ],
+                     [0.9800666 ],
+                     [0.95533645]], dtype=float32)
+        """
+        if not self._supports_compilation(circuit):
+            raise qml.DeviceError(
+                "Only analytic, non-sampled circuits of parametrized operations with a JAX "
+                "implementation can be executed for a batch of parameter values."
+            )
+
+        return self._execute_compiled(
+            circuit, params, lambda fn: jax.jit(jax.vmap(fn)), batched=True
+        )
+
+    def batch_execute(self, circuits):
+        """Execute a batch of quantum circuits on the device.
+
+        Circuits that can be compiled are grouped by structure, and each group with
+        more than one circuit is evaluated using a single call of :meth:`~.vmap_execute`.
+        The remaining circuits are executed one-by-one.
+
+        Args:
+            circuits (list[.tapes.QuantumTape]): circuits to execute on the device
+
+        Returns:
+            list[array[float]]: list of measured value(s)
+        """
+        groups = OrderedDict()
+
+        for i, circuit in enumerate(circuits):
+            if self._supports_compilation(circuit):
+                groups.setdefault(circuit.get_structure(), []).append(i)
+
+        results = [None] * len(circuits)
+        final_state = None
+
+        for indices in groups.values():
+            if len(indices) == 1:
+                continue
+
+            params = zip(*[circuits[i].get_parameters(trainable_only=False) for i in indices])
+            res = self.vmap_execute(circuits[indices[0]], [jnp.stack(p) for p in params])
+
+            for j, i in enumerate(indices):
+                results[i] = res[j]
+
+            if indices[-1] == len(circuits) - 1:
+                final_state = self._state, self._pre_rotated_state
+
+        for i, circuit in enumerate(circuits):
+            if results[i] is None:
+                self.reset()
+                results[i] = self.execute(circuit)
+
+        if final_state is not None:
+            self._state, self._pre_rotated_state = final_state
+
+        return results
+
     def sample_basis_states(self, number_of_states, state_probability):
         """Sample from the computational basis states based on the state
         probability.
@@ -231,7 +376,13 @@ class DefaultQubitJax(DefaultQubit):
             # Assuming op-by-op, so we'll just make one.
             key = jax.random.PRNGKey(np.random.randint(0, 2 ** 31))
         else:
-            key = self._prng_key
+            # split the key, so that each execution draws new samples
+            new_key, key = jax.random.split(self._prng_key)
+
+            # within a traced function, the split key is a tracer, which must not outlive
+            # the trace; the stored key is then left unchanged
+            if not isinstance(new_key, jax.core.Tracer):
+                self._prng_key = new_key
         return jax.random.choice(key, number_of_states, shape=(self.shots,), p=state_probability)
 
     @staticmethod
@@ -17,6 +17,7 @@ reference plugin.
 import numpy as np
 import semantic_version
 
+import pennylane as qml
 from pennylane.operation import DiagonalOperation
 
 try:
@@ -107,6 +108,33 @@ class DefaultQubitTF(DefaultQubit):
       When instantiating the device with ``analytic=False``, differentiating QNode
       outputs will result in ``None``.
 
+    **Graph mode**
+
+    By default, circuits are executed eagerly, operation by operation. Setting
+    ``graph_cache_size`` to a positive integer enables graph mode in tape mode: each distinct
+    circuit structure is traced into a ``tf.function`` taking the circuit parameters as tensor
+    inputs, so that new parameter values of the same structure avoid the per-operation overhead
+    of eager execution. The traced functions are stored in a least-recently-used cache of size
+    ``graph_cache_size``.
+
+    >>> dev = qml.device("default.qubit.tf", wires=2, graph_cache_size=32)
+
+    In graph mode, a circuit can be evaluated for a batch of parameter values using
+    :meth:`~.vmap_execute`. The :class:`~.KerasLayer` uses this to evaluate a batch of
+    inputs with the ``"backprop"`` differentiation method.
+
+    Circuits that are sampled, that are executed with a finite number of shots, or that contain
+    state preparations, observables with parameters, or parametrized operations without a
+    TensorFlow implementation, are always executed eagerly.
+
+    **Checkpointing**
+
+    By default, backpropagation stores the state after every gate of the circuit. For
+    circuits with many wires and gates, the memory required can be reduced by
+    storing the state only every ``checkpoint_every`` gates; the states in between are
+    recomputed during the backward pass using ``tf.recompute_grad``:
+
+    >>> dev = qml.device("default.qubit.tf", wires=20, checkpoint_every=10)
 
     If you wish to use a different machine-learning interface, or prefer to calculate quantum
     gradients using the ``parameter-shift`` or ``finite-diff`` differentiation methods,
@@ -126,6 +154,13 @@ class DefaultQubitTF(DefaultQubit):
             and variances analytically. In non-analytic mode, the ``diff_method="backprop"``
             QNode differentiation method is not supported and it is recommended to consider
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
+        graph_cache_size (int): The maximum number of circuit structures traced into
+            ``tf.function`` graphs. If 0, circuits are executed eagerly.
+        checkpoint_every (int): If provided, gate-level checkpointing is used to reduce the
+            memory required for backpropagation. The state is stored only every
+            ``checkpoint_every`` gates, and the intermediate states are recomputed from the
+            nearest stored state during the backward pass. Smaller values use more memory and
+            less recomputation. If None, all intermediate states are stored.
     """
 
     name = "Default qubit (TensorFlow) PennyLane plugin"
@@ -161,6 +196,7 @@ class DefaultQubitTF(DefaultQubit):
     _imag = staticmethod(tf.math.imag)
     _roll = staticmethod(tf.roll)
     _stack = staticmethod(tf.stack)
+    _real = staticmethod(tf.math.real)
 
     @staticmethod
     def _asarray(array, dtype=None):
@@ -174,8 +210,11 @@ class DefaultQubitTF(DefaultQubit):
 
         return res
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
+    def __init__(
+        self, wires, *, shots=1000, analytic=True, graph_cache_size=0, checkpoint_every=None
+    ):
         super().__init__(wires, shots=shots, analytic=analytic, cache=0)
+        self._checkpoint_every = checkpoint_every
 
         # prevent using special apply method for this gate due to slowdown in TF implementation
         del self._apply_ops["CZ"]
@@ -187,6 +226,13 @@ class DefaultQubitTF(DefaultQubit):
         if not SUPPORTS_APPLY_OPS or self.num_wires > 8:
             self._apply_ops = {}
 
+        self._compile_cache_size = graph_cache_size
+
+    @property
+    def graph_mode(self):
+        """bool: whether circuits are traced into ``tf.function`` graphs"""
+        return bool(self._compile_cache_size)
+
     @classmethod
     def capabilities(cls):
         capabilities = super().capabilities().copy()
@@ -196,6 +242,20 @@ class DefaultQubitTF(DefaultQubit):
         )
         return capabilities
 
+    @classmethod
+    def _checkpoint(cls, fun):
+        fun = tf.recompute_grad(fun)
+
+        def wrapper(state, *params):
+            # constant parameters are converted to tensors of the device precision
+            params = [
+                p if isinstance(p, (tf.Tensor, tf.Variable)) else tf.constant(p, dtype=cls.R_DTYPE)
+                for p in params
+            ]
+            return fun(state, *params)
+
+        return wrapper
+
     @staticmethod
     def _scatter(indices, array, new_dimensions):
         indices = np.expand_dims(indices, 1)
@@ -223,3 +283,61 @@ class DefaultQubitTF(DefaultQubit):
             return unitary.eigvals
 
         return unitary.matrix
+
+    def analytic_probability(self, wires=None):
+        if self._state is None:
+            return None
+
+        # The squared amplitudes are computed from the real and imaginary parts, as
+        # tf.vectorized_map does not preserve the dtype of tf.abs for complex128 tensors
+        state = self._flatten(self._state)
+        return self.marginal_prob(self._real(state) ** 2 + self._imag(state) ** 2, wires)
+
+    def execute(self, circuit, **kwargs):
+        if not self._supports_compilation(circuit):
+            return super().execute(circuit, **kwargs)
+
+        # Python scalars are converted to tensors, to avoid retracing for new values
+        params = [tf.convert_to_tensor(p) for p in circuit.get_parameters(trainable_only=False)]
+        return self._execute_compiled(circuit, params, tf.function)
+
+    def vmap_execute(self, circuit, params):
+        """Execute a circuit for a batch of parameter values, using a single vectorized call
+        of the traced circuit.
+
+        Args:
+            circuit (.QuantumTape): the circuit to execute
+            params (list[tf.Tensor]): The values of all parameters of the circuit, in the order
+                given by :meth:`~.QuantumTape.get_parameters` with ``trainable_only=False``.
+                Each tensor has a leading batch dimension.
+
+        Returns:
+            tf.Tensor[float]: the results of the circuit for each set of parameter values,
+            with a leading batch dimension
+
+        Raises:
+            DeviceError: if graph mode is not enabled, or the circuit cannot be traced
+
+        **Example**
+
+        >>> dev = qml.device("default.qubit.tf", wires=1, graph_cache_size=32)
+        >>> with qml.tape.QuantumTape() as tape:
+        ...     qml.RX(0.0, wires=0)
+        ...     qml.expval(qml.PauliZ(0))
+        >>> dev.vmap_execute(tape, [tf.constant([0.1, 0.2, 0.3])])
+        <tf.Tensor: shape=(3, 1), dtype=float64, numpy=
+        array([[0.99500417],
+               [0.98006658],
+               [0.95533649]])>
+        """
+        if not self._supports_compilation(circuit):
+            raise qml.DeviceError(
+                "Only analytic, non-sampled circuits of parametrized operations with a TensorFlow "
+                "implementation can be executed for a batch of parameter values, in graph mode."
+            )
+
+        def vectorize(fn):
+            return tf.function(lambda *p: tf.vectorized_map(lambda x: fn(*x), p))
+
+        params = [tf.convert_to_tensor(p) for p in params]
+        return self._execute_compiled(circuit, params, vectorize, batched=True)
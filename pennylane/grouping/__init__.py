@@ -19,11 +19,15 @@ functionality used in measurement optimization.
 from . import graph_colouring
 from .group_observables import group_observables, PauliGroupingStrategy
 from .optimize_measurements import optimize_measurements
+from .pauli_sentence import PauliSentence
 from .transformations import (
     qwc_rotation,
     diagonalize_pauli_word,
     diagonalize_qwc_pauli_words,
     diagonalize_qwc_groupings,
+    commuting_rotation,
+    diagonalize_commuting_pauli_words,
+    diagonalize_commuting_groupings,
 )
 from .utils import (
     is_pauli_word,
@@ -32,5 +36,8 @@ from .utils import (
     binary_to_pauli,
     is_qwc,
     observables_to_binary_matrix,
+    binary_matrix_to_observables,
     qwc_complement_adj_matrix,
+    commuting_complement_adj_matrix,
+    anticommuting_complement_adj_matrix,
 )
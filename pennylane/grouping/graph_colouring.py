@@ -28,8 +28,10 @@ corresponding Pauli words. The graph-colouring problem is to assign a colour to
 each vertex such that no vertices of the same colour are connected, using the
 fewest number of colours (lowest "chromatic number") as possible.
 """
+import heapq
 
 import numpy as np
+import scipy.sparse
 
 
 def largest_first(binary_observables, adj):
@@ -149,3 +151,131 @@ def recursive_largest_first(binary_observables, adj):  # pylint:disable=too-many
         coloured |= set(indices)
         uncoloured = set(np.arange(n_terms)) - coloured
     return colours
+
+
+def _adjacency_lists(adj):
+    """Converts a dense or sparse adjacency matrix to a list containing the array of neighbour
+    indices of each vertex."""
+    if scipy.sparse.issparse(adj):
+        adj = adj.tocsr()
+        return [adj.indices[adj.indptr[i] : adj.indptr[i + 1]] for i in range(adj.shape[0])]
+
+    rows, cols = np.nonzero(adj)
+    bounds = np.searchsorted(rows, np.arange(np.shape(adj)[0] + 1))
+    return [cols[bounds[i] : bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+def _smallest_free_colour(used):
+    """Returns the smallest colour (positive integer) not contained in the set ``used``."""
+    colour = 1
+    while colour in used:
+        colour += 1
+    return colour
+
+
+def greedy(binary_observables, adj):
+    """Performs graph-colouring using the Largest Degree First heuristic on adjacency lists.
+
+    Produces the same colour classes as :func:`~.largest_first` up to tie-breaking, but each
+    vertex only inspects its own neighbours, so the runtime is linear in the number of edges
+    after sorting the vertices by degree. The adjacency matrix may be a dense array or a
+    ``scipy.sparse`` matrix.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        adj (array[int] or scipy.sparse.spmatrix): the adjacency matrix of the Pauli graph
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables
+    array([[1., 1., 0.],
+           [1., 0., 0.],
+           [0., 0., 1.],
+           [1., 0., 1.]])
+    >>> adj
+    array([[0., 0., 1.],
+           [0., 0., 1.],
+           [1., 1., 0.]])
+    >>> greedy(binary_observables, adj)
+    {1: [array([0., 0., 1., 1.])],
+     2: [array([1., 0., 0., 0.]), array([1., 1., 0., 1.])]}
+    """
+    neighbours = _adjacency_lists(adj)
+    degrees = np.array([len(n) for n in neighbours], dtype=int)
+    c_vec = np.zeros(len(neighbours), dtype=int)
+    colours = dict()
+
+    for i in np.argsort(-degrees, kind="stable"):
+        colour = _smallest_free_colour(set(c_vec[neighbours[i]]))
+        c_vec[i] = colour
+        colours.setdefault(colour, []).append(binary_observables[i])
+
+    return colours
+
+
+def dsatur(binary_observables, adj):
+    r"""Performs graph-colouring using the DSATUR (degree of saturation) heuristic.
+
+    At each step, the uncoloured vertex with the largest number of distinct colours among its
+    neighbours is coloured with the smallest available colour, breaking ties by degree. The
+    candidate vertices are kept in a priority queue with lazily discarded stale entries, so the
+    runtime is :math:`\mathcal{O}((V + E)\log V)` for :math:`V` vertices and :math:`E` edges.
+    DSATUR typically finds a lower chromatic number than Largest Degree First, and scales to far
+    larger graphs than Recursive Largest Degree First. The adjacency matrix may be a dense array or
+    a ``scipy.sparse`` matrix.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        adj (array[int] or scipy.sparse.spmatrix): the adjacency matrix of the Pauli graph
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation
+
+    **Example**
+
+    >>> binary_observables
+    array([[1., 1., 0.],
+           [1., 0., 0.],
+           [0., 0., 1.],
+           [1., 0., 1.]])
+    >>> adj
+    array([[0., 0., 1.],
+           [0., 0., 1.],
+           [1., 1., 0.]])
+    >>> dsatur(binary_observables, adj)
+    {1: [array([0., 0., 1., 1.])],
+     2: [array([1., 0., 0., 0.]), array([1., 1., 0., 1.])]}
+    """
+    neighbours = _adjacency_lists(adj)
+    n_terms = len(neighbours)
+    c_vec = [0] * n_terms
+    neighbour_colours = [set() for _ in range(n_terms)]
+    colours = dict()
+
+    heap = [(0, -len(neighbours[i]), i) for i in range(n_terms)]
+    heapq.heapify(heap)
+
+    while heap:
+        saturation, _, i = heapq.heappop(heap)
+
+        # skip vertices that are already coloured, or whose entry is out of date
+        if c_vec[i] or -saturation != len(neighbour_colours[i]):
+            continue
+
+        colour = _smallest_free_colour(neighbour_colours[i])
+        c_vec[i] = colour
+        colours.setdefault(colour, []).append(binary_observables[i])
+
+        for j in neighbours[i].tolist():
+            if not c_vec[j] and colour not in neighbour_colours[j]:
+                neighbour_colours[j].add(colour)
+                heapq.heappush(heap, (-len(neighbour_colours[j]), -len(neighbours[j]), j))
+
+    return dict(sorted(colours.items()))
@@ -18,15 +18,27 @@ This module contains the high-level Pauli-word-partitioning functionality used i
 from pennylane.wires import Wires
 from pennylane.grouping.utils import (
     observables_to_binary_matrix,
-    binary_to_pauli,
-    are_identical_pauli_words,
+    binary_matrix_to_observables,
     qwc_complement_adj_matrix,
+    commuting_complement_adj_matrix,
+    anticommuting_complement_adj_matrix,
+)
+from pennylane.grouping.graph_colouring import (
+    dsatur,
+    greedy,
+    largest_first,
+    recursive_largest_first,
 )
-from pennylane.grouping.graph_colouring import largest_first, recursive_largest_first
 import numpy as np
 
 GROUPING_TYPES = frozenset(["qwc", "commuting", "anticommuting"])
-GRAPH_COLOURING_METHODS = {"lf": largest_first, "rlf": recursive_largest_first}
+GRAPH_COLOURING_METHODS = {
+    "lf": largest_first,
+    "rlf": recursive_largest_first,
+    "dsatur": dsatur,
+    "greedy": greedy,
+}
+SPARSE_GRAPH_COLOURING_METHODS = frozenset(["dsatur", "greedy"])
 
 
 class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
@@ -53,8 +65,12 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             the Pauli words, can be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or
             ``'anticommuting'``.
         graph_colourer (str): the heuristic algorithm to employ for graph
-            colouring, can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive
-            Largest First)
+            colouring, can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive
+            Largest First), ``'dsatur'`` (Degree of Saturation), or ``'greedy'``
+            (Largest First on adjacency lists). For ``'dsatur'`` and ``'greedy'``, the
+            complementary graph is stored as a sparse matrix, so that memory scales with its
+            number of edges; all pairs of Pauli words are still compared, which takes
+            quadratic time in the number of Pauli words.
 
     Raises:
         ValueError: if arguments specified for ``grouping_type`` or
@@ -80,6 +96,7 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             )
 
         self.graph_colourer = GRAPH_COLOURING_METHODS[graph_colourer.lower()]
+        self.sparse = graph_colourer.lower() in SPARSE_GRAPH_COLOURING_METHODS
         self.observables = observables
         self._wire_map = None
         self._n_qubits = None
@@ -119,38 +136,24 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
 
         The adjacency matrix for an undirected graph of N vertices is an N by N symmetric binary
         matrix, where matrix elements of 1 denote an edge, and matrix elements of 0 denote no edge.
+        If the graph colouring method works on adjacency lists, the matrix is returned as a
+        ``scipy.sparse`` matrix.
 
         Returns:
-            array[int]: the square and symmetric adjacency matrix
+            array[int] or scipy.sparse.csr_matrix: the square and symmetric adjacency matrix
         """
 
         if self.binary_observables is None:
             self.binary_observables = self.binary_repr()
 
-        n_qubits = int(np.shape(self.binary_observables)[1] / 2)
-
         if self.grouping_type == "qwc":
-            adj = qwc_complement_adj_matrix(self.binary_observables)
-
-        elif self.grouping_type in frozenset(["commuting", "anticommuting"]):
-            symplectic_form = np.block(
-                [
-                    [np.zeros((n_qubits, n_qubits)), np.eye(n_qubits)],
-                    [np.eye(n_qubits), np.zeros((n_qubits, n_qubits))],
-                ]
-            )
-            mat_prod = (
-                self.binary_observables @ symplectic_form @ np.transpose(self.binary_observables)
-            )
-
-            if self.grouping_type == "commuting":
+            adj = qwc_complement_adj_matrix(self.binary_observables, sparse=self.sparse)
 
-                adj = mat_prod % 2
+        elif self.grouping_type == "commuting":
+            adj = commuting_complement_adj_matrix(self.binary_observables, sparse=self.sparse)
 
-            elif self.grouping_type == "anticommuting":
-
-                adj = (mat_prod + 1) % 2
-                np.fill_diagonal(adj, 0)
+        elif self.grouping_type == "anticommuting":
+            adj = anticommuting_complement_adj_matrix(self.binary_observables, sparse=self.sparse)
 
         return adj
 
@@ -168,9 +171,19 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
 
         coloured_binary_paulis = self.graph_colourer(self.binary_observables, self.adj_matrix)
 
+        # convert all coloured Pauli words at once, then split them into their groupings
+        paulis = iter(
+            binary_matrix_to_observables(
+                np.reshape(
+                    [p for grouping in coloured_binary_paulis.values() for p in grouping],
+                    (-1, self.binary_observables.shape[1]),
+                ),
+                wire_map=self._wire_map,
+            )
+        )
+
         self.grouped_paulis = [
-            [binary_to_pauli(pauli_word, wire_map=self._wire_map) for pauli_word in grouping]
-            for grouping in coloured_binary_paulis.values()
+            [next(paulis) for _ in grouping] for grouping in coloured_binary_paulis.values()
         ]
 
         return self.grouped_paulis
@@ -193,7 +206,8 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
         grouping_type (str): The type of binary relation between Pauli words.
             Can be ``'qwc'``, ``'commuting'``, or ``'anticommuting'``.
         method (str): the graph coloring heuristic to use in solving minimum clique cover, which
-            can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive Largest First)
+            can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive Largest First), ``'dsatur'``
+            (Degree of Saturation), or ``'greedy'`` (Largest First on adjacency lists)
 
     Returns:
        tuple:
@@ -235,13 +249,22 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
     if coefficients is None:
         return partitioned_paulis
 
-    partitioned_coeffs = [[0] * len(g) for g in partitioned_paulis]
+    # look up the coefficients by the binary representation of the Pauli words,
+    # with identical Pauli words taking their coefficients in order of appearance
+    indices = {}
+    for i, binary_pauli in enumerate(pauli_grouping.binary_observables):
+        indices.setdefault(binary_pauli.tobytes(), []).append(i)
+
+    binary_partitions = observables_to_binary_matrix(
+        [pauli_word for partition in partitioned_paulis for pauli_word in partition],
+        n_qubits=pauli_grouping.binary_observables.shape[1] // 2,
+        wire_map=pauli_grouping._wire_map,  # pylint: disable=protected-access
+    )
+    partitioned_indices = iter(indices[b.tobytes()].pop(0) for b in binary_partitions)
 
-    for i, partition in enumerate(partitioned_paulis):
-        for j, pauli_word in enumerate(partition):
-            for observable in observables:
-                if are_identical_pauli_words(pauli_word, observable):
-                    partitioned_coeffs[i][j] = coefficients[observables.index(observable)]
-                    break
+    partitioned_coeffs = [
+        [coefficients[next(partitioned_indices)] for _ in partition]
+        for partition in partitioned_paulis
+    ]
 
     return partitioned_paulis, partitioned_coeffs
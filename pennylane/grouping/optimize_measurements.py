@@ -17,7 +17,10 @@ corresponding necessary circuit post-rotations for a given list of Pauli words.
 """
 
 from pennylane.grouping.group_observables import group_observables
-from pennylane.grouping.transformations import diagonalize_qwc_groupings
+from pennylane.grouping.transformations import (
+    diagonalize_qwc_groupings,
+    diagonalize_commuting_groupings,
+)
 
 
 def optimize_measurements(observables, coefficients=None, grouping="qwc", colouring_method="rlf"):
@@ -27,7 +30,8 @@ def optimize_measurements(observables, coefficients=None, grouping="qwc", colour
     The input list of observables are partitioned into mutually qubit-wise commuting (QWC) or
     mutually commuting partitions by approximately solving minimum clique cover on a graph where
     each observable represents a vertex. The unitaries which diagonalize the
-    partitions are then found. See `arXiv:1907.03358
+    partitions are then found; single-qubit rotations for qubit-wise commuting partitions, and
+    Clifford circuits for commuting partitions. See `arXiv:1907.03358
     <https://arxiv.org/abs/1907.03358>`_ and `arXiv:1907.09386
     <https://arxiv.org/abs/1907.09386>`_ for technical details of the QWC and
     fully-commuting measurement-partitioning approaches respectively.
@@ -37,7 +41,9 @@ def optimize_measurements(observables, coefficients=None, grouping="qwc", colour
             instances thereof)
         coefficients (list[float]): a list of float coefficients, for instance the weights of
             the Pauli words comprising a Hamiltonian
-        grouping (str): the binary symmetric relation to use for operator partitioning
+        grouping (str): the binary symmetric relation to use for operator partitioning, can be
+            ``'qwc'`` or ``'commuting'``. The ``'commuting'`` grouping requires
+            ``coefficients`` to be specified.
         colouring_method (str): the graph-colouring heuristic to use in obtaining the operator
             partitions
 
@@ -54,6 +60,11 @@ def optimize_measurements(observables, coefficients=None, grouping="qwc", colour
               corresponding coefficients.  Only output if coefficients are
               specified.
 
+    Raises:
+        ValueError: if coefficients are not specified for ``'commuting'`` grouping. The
+            diagonalized Pauli words of commuting partitions are only equal to the rotated Pauli
+            words up to a sign, which is absorbed into the coefficients.
+
     **Example**
 
     >>> obs = [qml.PauliY(0), qml.PauliX(0) @ qml.PauliX(1), qml.PauliZ(1)]
@@ -66,7 +77,27 @@ def optimize_measurements(observables, coefficients=None, grouping="qwc", colour
     [[Tensor(PauliZ(wires=[0]), PauliZ(wires=[1]))], [PauliZ(wires=[0]), PauliZ(wires=[1])]]
     >>> print(grouped_coeffs)
     [[4.21], [1.43, 0.97]]
+
+    Fully commuting partitions are often fewer than qubit-wise commuting ones, at the cost of
+    entangling post-rotations:
+
+    >>> obs = [qml.PauliX(0) @ qml.PauliX(1),
+    ...        qml.PauliZ(0) @ qml.PauliZ(1),
+    ...        qml.PauliY(0) @ qml.PauliY(1)]
+    >>> coeffs = [0.5, 0.2, 0.1]
+    >>> rotations, groupings, grouped_coeffs = optimize_measurements(obs, coeffs, 'commuting')
+    >>> print(rotations)
+    [[CNOT(wires=[0, 1]), Hadamard(wires=[0])]]
+    >>> print(groupings)
+    [[PauliZ(wires=[0]), PauliZ(wires=[1]), PauliZ(wires=[0]) @ PauliZ(wires=[1])]]
+    >>> print(grouped_coeffs)
+    [[0.5, 0.2, -0.1]]
     """
+    if grouping.lower() == "commuting" and coefficients is None:
+        raise ValueError(
+            "Coefficients must be specified for 'commuting' grouping, since the signs of the "
+            "diagonalized Pauli words are absorbed into the coefficients."
+        )
 
     if coefficients is None:
         grouped_obs = group_observables(
@@ -82,6 +113,16 @@ def optimize_measurements(observables, coefficients=None, grouping="qwc", colour
             post_rotations,
             diagonalized_groupings,
         ) = diagonalize_qwc_groupings(grouped_obs)
+    elif grouping.lower() == "commuting":
+        (
+            post_rotations,
+            diagonalized_groupings,
+            grouped_signs,
+        ) = diagonalize_commuting_groupings(grouped_obs)
+        grouped_coeffs = [
+            [s * c for s, c in zip(signs, coeffs)]
+            for signs, coeffs in zip(grouped_signs, grouped_coeffs)
+        ]
     else:
         raise NotImplementedError(
             "Measurement reduction by '{}' grouping not implemented.".format(grouping.lower())
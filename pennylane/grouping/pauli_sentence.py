@@ -0,0 +1,312 @@
+# Copyright 2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the :class:`~.PauliSentence` class, an array-backed representation
+of linear combinations of Pauli words.
+"""
+import numbers
+
+import numpy as np
+
+import pennylane as qml
+from pennylane import PauliX, PauliY, PauliZ, Identity
+from pennylane.operation import Tensor
+from pennylane.wires import Wires
+
+PAULI_BITS = {"Identity": (0, 0), "PauliX": (1, 0), "PauliY": (1, 1), "PauliZ": (0, 1)}
+"""dict[str, tuple[int]]: the X and Z bits of each single-qubit Pauli observable"""
+
+BITS_PAULI = {(1, 0): PauliX, (1, 1): PauliY, (0, 1): PauliZ}
+"""dict[tuple[int], type]: the single-qubit Pauli observables corresponding to non-zero bits"""
+
+
+class PauliSentence:
+    r"""Array-backed representation of a linear combination of Pauli words
+    :math:`\sum_k c_k P_k`.
+
+    Each Pauli word is stored in the binary symplectic representation, as a row of
+    an X bit matrix and a Z bit matrix whose columns correspond to wires. A wire
+    with only the X (Z) bit set carries a :class:`~.PauliX` (:class:`~.PauliZ`), and
+    a wire with both bits set carries a :class:`~.PauliY`. Arithmetic acts on the bit
+    matrices and the coefficient vector directly, without constructing observables.
+
+    Args:
+        x (array[bool]): X bits of the Pauli words, of shape ``(num_terms, num_wires)``
+        z (array[bool]): Z bits of the Pauli words, of shape ``(num_terms, num_wires)``
+        coeffs (array[complex]): coefficients of the Pauli words, of shape ``(num_terms,)``
+        wires (Iterable): wire labels corresponding to the columns of ``x`` and ``z``
+
+    **Example**
+
+    A Pauli sentence can be created from a :class:`~.Hamiltonian` consisting of Pauli words:
+
+    >>> H = qml.Hamiltonian([0.5, -0.2], [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliY(1)])
+    >>> ps = qml.grouping.PauliSentence.from_hamiltonian(H)
+    >>> ps.x
+    array([[ True, False],
+           [False,  True]])
+    >>> ps.z
+    array([[False,  True],
+           [False,  True]])
+
+    Pauli sentences support addition, subtraction, scalar multiplication, and
+    operator products via ``@``, tracking the phases of the Pauli word products:
+
+    >>> print((ps @ ps).to_hamiltonian())
+    (0.29000000000000004) [I0]
+
+    Like-terms are combined after each arithmetic operation.
+    """
+
+    def __init__(self, x, z, coeffs, wires):
+        self._x = np.asarray(x, dtype=bool)
+        self._z = np.asarray(z, dtype=bool)
+        self._coeffs = np.asarray(coeffs)
+        self._wires = Wires(wires)
+
+        if self._x.ndim != 2 or self._x.shape != self._z.shape:
+            raise ValueError(
+                "The X and Z bits must be two-dimensional arrays of the same shape, "
+                "instead got shapes {} and {}.".format(self._x.shape, self._z.shape)
+            )
+
+        if self._coeffs.shape != (self._x.shape[0],):
+            raise ValueError(
+                "Expected {} coefficients, instead got coefficients of shape {}.".format(
+                    self._x.shape[0], self._coeffs.shape
+                )
+            )
+
+        if len(self._wires) != self._x.shape[1]:
+            raise ValueError(
+                "Expected {} wires, instead got {}.".format(self._x.shape[1], len(self._wires))
+            )
+
+    @property
+    def x(self):
+        """array[bool]: the X bits of the Pauli words, of shape ``(num_terms, num_wires)``"""
+        return self._x
+
+    @property
+    def z(self):
+        """array[bool]: the Z bits of the Pauli words, of shape ``(num_terms, num_wires)``"""
+        return self._z
+
+    @property
+    def coeffs(self):
+        """array[complex]: the coefficients of the Pauli words"""
+        return self._coeffs
+
+    @property
+    def wires(self):
+        """Wires: the wires corresponding to the columns of the bit matrices"""
+        return self._wires
+
+    def __len__(self):
+        return len(self._coeffs)
+
+    def __repr__(self):
+        return "<PauliSentence: terms={}, wires={}>".format(len(self), self.wires.tolist())
+
+    @classmethod
+    def from_hamiltonian(cls, hamiltonian, wires=None):
+        """Create a Pauli sentence from a Hamiltonian consisting of Pauli words.
+
+        Args:
+            hamiltonian (~.Hamiltonian): the Hamiltonian to convert
+            wires (Iterable): the wires of the Pauli sentence. If not provided,
+                the wires of the Hamiltonian are used.
+
+        Returns:
+            PauliSentence: the Pauli sentence representing the Hamiltonian
+
+        Raises:
+            ValueError: if the Hamiltonian contains observables that are not Pauli words,
+                or acts on wires that are not contained in ``wires``
+        """
+        wires = hamiltonian.wires if wires is None else Wires(wires)
+        wire_map = {w: i for i, w in enumerate(wires.labels)}
+
+        num_terms = len(hamiltonian.ops)
+        x = np.zeros((num_terms, len(wires)), dtype=bool)
+        z = np.zeros((num_terms, len(wires)), dtype=bool)
+
+        for i, op in enumerate(hamiltonian.ops):
+            obs = op.obs if isinstance(op, Tensor) else [op]
+
+            for ob in obs:
+                bits = PAULI_BITS.get(ob.name, None)
+
+                if bits is None:
+                    raise ValueError(
+                        "Expected a Hamiltonian of Pauli words, instead got {}.".format(op)
+                    )
+
+                if ob.wires.labels[0] not in wire_map:
+                    raise ValueError(
+                        "The wires {} do not contain {}.".format(wires.tolist(), ob.wires)
+                    )
+
+                col = wire_map[ob.wires.labels[0]]
+                x[i, col], z[i, col] = bits
+
+        return cls(x, z, np.array(hamiltonian.coeffs), wires)
+
+    def to_hamiltonian(self, tol=1e-8):
+        """Convert the Pauli sentence to a Hamiltonian.
+
+        Args:
+            tol (float): tolerance for the imaginary parts of the coefficients
+
+        Returns:
+            ~.Hamiltonian: the Hamiltonian represented by the Pauli sentence
+
+        Raises:
+            ValueError: if a coefficient is not real-valued
+        """
+        if np.any(np.abs(np.imag(self.coeffs)) > tol):
+            raise ValueError(
+                "Could not convert to a Hamiltonian; coefficients are not real-valued."
+            )
+
+        ops = []
+
+        # identity terms act on the first wire, or on wire 0 if the sentence has no wires
+        identity_wire = self.wires[0] if len(self.wires) > 0 else 0
+
+        for x, z in zip(self.x, self.z):
+            obs = [
+                BITS_PAULI[(int(b_x), int(b_z))](wires=self.wires[i])
+                for i, (b_x, b_z) in enumerate(zip(x, z))
+                if b_x or b_z
+            ]
+
+            if not obs:
+                ops.append(Identity(wires=identity_wire))
+            elif len(obs) == 1:
+                ops.append(obs[0])
+            else:
+                ops.append(Tensor(*obs))
+
+        return qml.Hamiltonian(list(np.real(self.coeffs)), ops)
+
+    def _bits_on(self, wires):
+        """Returns the X and Z bits of the Pauli words with columns corresponding to ``wires``,
+        which must contain the wires of the Pauli sentence."""
+        if wires == self.wires:
+            return self.x, self.z
+
+        cols = [wires.index(w) for w in self.wires]
+        x = np.zeros((len(self), len(wires)), dtype=bool)
+        z = np.zeros((len(self), len(wires)), dtype=bool)
+        x[:, cols] = self.x
+        z[:, cols] = self.z
+        return x, z
+
+    def simplify(self, tol=1e-8):
+        """Simplifies the Pauli sentence in place by combining like-terms, and
+        removing terms whose coefficients are smaller than ``tol`` in absolute value.
+
+        Args:
+            tol (float): tolerance below which coefficients are considered to be zero
+        """
+        if len(self) == 0:
+            return
+
+        words, inverse = np.unique(np.hstack([self.x, self.z]), axis=0, return_inverse=True)
+        coeffs = np.zeros(len(words), dtype=self.coeffs.dtype)
+        np.add.at(coeffs, inverse.ravel(), self.coeffs)
+
+        keep = np.abs(coeffs) > tol
+        num_wires = len(self.wires)
+
+        self._x = words[keep, :num_wires]
+        self._z = words[keep, num_wires:]
+        self._coeffs = coeffs[keep]
+
+    def __add__(self, other):
+        if isinstance(other, qml.Hamiltonian):
+            other = PauliSentence.from_hamiltonian(other)
+
+        if not isinstance(other, PauliSentence):
+            raise ValueError("Cannot add PauliSentence and {}".format(type(other)))
+
+        wires = Wires.all_wires([self.wires, other.wires])
+        x1, z1 = self._bits_on(wires)
+        x2, z2 = other._bits_on(wires)  # pylint: disable=protected-access
+
+        res = PauliSentence(
+            np.vstack([x1, x2]), np.vstack([z1, z2]), np.hstack([self.coeffs, other.coeffs]), wires
+        )
+        res.simplify()
+        return res
+
+    def __sub__(self, other):
+        if isinstance(other, qml.Hamiltonian):
+            other = PauliSentence.from_hamiltonian(other)
+
+        if not isinstance(other, PauliSentence):
+            raise ValueError("Cannot subtract {} from PauliSentence".format(type(other)))
+
+        return self.__add__(other * -1)
+
+    def __mul__(self, a):
+        if not isinstance(a, numbers.Number):
+            raise ValueError("Cannot multiply PauliSentence by {}".format(type(a)))
+
+        return PauliSentence(self.x, self.z, self.coeffs * a, self.wires)
+
+    __rmul__ = __mul__
+
+    def __matmul__(self, other):
+        r"""The operator product of two Pauli sentences.
+
+        The product of two single-qubit Pauli operators :math:`\sigma_1 \sigma_2` is given by
+        :math:`i^{g} \sigma_3`, where the bits of :math:`\sigma_3` are the sums modulo two of
+        the bits of :math:`\sigma_1` and :math:`\sigma_2`, and the exponent :math:`g` is
+        determined from the bits as in `Aaronson and Gottesman (2004)
+        <https://arxiv.org/abs/quant-ph/0406196>`__. The phase of a product of Pauli words
+        is the product of the phases on each wire.
+        """
+        if isinstance(other, qml.Hamiltonian):
+            other = PauliSentence.from_hamiltonian(other)
+
+        if not isinstance(other, PauliSentence):
+            raise ValueError("Cannot multiply PauliSentence and {}".format(type(other)))
+
+        wires = Wires.all_wires([self.wires, other.wires])
+        x1, z1 = self._bits_on(wires)
+        x2, z2 = other._bits_on(wires)  # pylint: disable=protected-access
+
+        x1, z1 = x1[:, None, :].astype(np.int8), z1[:, None, :].astype(np.int8)
+        x2, z2 = x2[None, :, :].astype(np.int8), z2[None, :, :].astype(np.int8)
+
+        g = np.where(
+            x1 & z1,
+            z2 - x2,
+            np.where(x1, z2 * (2 * x2 - 1), np.where(z1, x2 * (1 - 2 * z2), 0)),
+        )
+        phases = np.array([1, 1j, -1, -1j])[np.sum(g, axis=-1) % 4]
+
+        coeffs = self.coeffs[:, None] * other.coeffs[None, :] * phases
+        num_wires = len(wires)
+
+        res = PauliSentence(
+            (x1 ^ x2).reshape(-1, num_wires),
+            (z1 ^ z2).reshape(-1, num_wires),
+            coeffs.ravel(),
+            wires,
+        )
+        res.simplify()
+        return res
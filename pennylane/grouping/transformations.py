@@ -21,9 +21,12 @@ from pennylane.wires import Wires
 from pennylane.templates import template
 from pennylane.grouping.utils import (
     pauli_to_binary,
+    binary_matrix_to_observables,
     are_identical_pauli_words,
     is_qwc,
     is_pauli_word,
+    observables_to_binary_matrix,
+    commuting_complement_adj_matrix,
 )
 import numpy as np
 
@@ -225,3 +228,200 @@ def diagonalize_qwc_groupings(qwc_groupings):
         diag_groupings.append(diag_grouping)
 
     return post_rotations, diag_groupings
+
+
+def _clifford_diagonalization(x, z):
+    r"""Finds a Clifford circuit :math:`U` such that :math:`U P U^\dagger` is diagonal for each of
+    a set of mutually commuting Pauli words :math:`P`.
+
+    The Pauli words are processed in turn. The X bits of a word that is not yet diagonal are
+    moved onto a single pivot qubit using ``CNOT`` gates, a ``Y`` on the pivot is mapped to an
+    ``X`` using an ``S`` gate, and a Hadamard on the pivot makes the word diagonal. These gates
+    map diagonal words to diagonal words, and the Hadamard acts trivially on the previously
+    diagonalized words since they commute with the current one. At most :math:`n` words for
+    :math:`n` qubits need to be processed, since all products of diagonal words are diagonal.
+    The signs of the words are tracked using the update rules of `Aaronson and Gottesman (2004)
+    <https://arxiv.org/abs/quant-ph/0406196>`__.
+
+    Args:
+        x (array[int]): X bits of the Pauli words, of shape ``(num_words, num_qubits)``
+        z (array[int]): Z bits of the Pauli words, of shape ``(num_words, num_qubits)``
+
+    Returns:
+        tuple[list[tuple[str, tuple[int]]], array[int], array[int]]: the gates of the circuit as
+        pairs of gate names and qubit indices, the Z bits of the diagonalized Pauli words, and
+        their signs
+    """
+    x = np.array(x, dtype=np.int8)
+    z = np.array(z, dtype=np.int8)
+    r = np.zeros(len(x), dtype=np.int8)
+    gates = []
+
+    def h(q):
+        nonlocal r
+        r ^= x[:, q] & z[:, q]
+        x[:, q], z[:, q] = z[:, q].copy(), x[:, q].copy()
+        gates.append(("Hadamard", (q,)))
+
+    def s(q):
+        nonlocal r
+        r ^= x[:, q] & z[:, q]
+        z[:, q] ^= x[:, q]
+        gates.append(("S", (q,)))
+
+    def cnot(c, t):
+        nonlocal r
+        r ^= x[:, c] & z[:, t] & (x[:, t] ^ z[:, c] ^ 1)
+        x[:, t] ^= x[:, c]
+        z[:, c] ^= z[:, t]
+        gates.append(("CNOT", (c, t)))
+
+    for i in range(len(x)):
+        if not x[i].any():
+            continue
+
+        q = int(np.flatnonzero(x[i])[0])
+
+        for t in np.flatnonzero(x[i])[1:]:
+            cnot(q, int(t))
+
+        if z[i, q]:
+            s(q)
+
+        h(q)
+
+    return gates, z, r
+
+
+def _commuting_binary_matrix(pauli_words):
+    """Returns the binary matrix and wire map of a list of mutually commuting Pauli words."""
+    all_wires = Wires.all_wires([pauli_word.wires for pauli_word in pauli_words])
+    wire_map = {label: ind for ind, label in enumerate(all_wires)}
+    binary = observables_to_binary_matrix(pauli_words, len(all_wires), wire_map)
+
+    if np.any(commuting_complement_adj_matrix(binary)):
+        raise ValueError("The Pauli words {} are not mutually commuting.".format(pauli_words))
+
+    return binary, wire_map
+
+
+@template
+def commuting_rotation(pauli_words):
+    """Performs circuit implementation of a Clifford unitary that simultaneously diagonalizes a
+    list of mutually commuting Pauli words.
+
+    The circuit consists of ``Hadamard``, ``S``, and ``CNOT`` gates. See
+    :func:`~.diagonalize_commuting_pauli_words` for the corresponding diagonal observables.
+
+    Args:
+        pauli_words (list[Observable]): mutually commuting Pauli words
+
+    Raises:
+        ValueError: if any two elements of ``pauli_words`` do not commute
+
+    **Example**
+
+    >>> commuting_rotation([qml.PauliX(0) @ qml.PauliX(1), qml.PauliZ(0) @ qml.PauliZ(1)])
+    [CNOT(wires=[0, 1]), Hadamard(wires=[0])]
+    """
+    binary, wire_map = _commuting_binary_matrix(pauli_words)
+    wires = list(wire_map)
+    n_qubits = len(wires)
+
+    gates, _, _ = _clifford_diagonalization(binary[:, :n_qubits], binary[:, n_qubits:])
+
+    for name, qubits in gates:
+        getattr(qml, name)(wires=[wires[q] for q in qubits])
+
+
+def diagonalize_commuting_pauli_words(commuting_grouping):
+    r"""Diagonalizes a list of mutually commuting Pauli words using a Clifford circuit.
+
+    Unlike qubit-wise commuting Pauli words, fully commuting Pauli words can in general not be
+    diagonalized by single-qubit rotations. Instead, a Clifford unitary :math:`U` is found such
+    that :math:`U P U^\dagger = \pm D` for each Pauli word :math:`P`, where :math:`D` is a
+    product of :class:`~.PauliZ` operators. The signs cannot in general be removed, since the
+    products of commuting Pauli words are preserved by :math:`U`.
+
+    Args:
+        commuting_grouping (list[Observable]): a list of observables containing mutually
+            commuting Pauli words
+
+    Returns:
+        tuple:
+
+            * list[Operation]: an instance of the commuting_rotation template which
+              diagonalizes the commuting grouping
+            * list[Observable]: list of Pauli string observables diagonal in
+              the computational basis
+            * list[int]: the signs :math:`\pm 1` relating the rotated Pauli words to the
+              diagonal observables
+
+    Raises:
+        ValueError: if any 2 elements in the input grouping are not commutative
+
+    **Example**
+
+    >>> grouping = [qml.PauliX(0) @ qml.PauliX(1),
+    ...             qml.PauliZ(0) @ qml.PauliZ(1),
+    ...             qml.PauliY(0) @ qml.PauliY(1)]
+    >>> unitary, diag_terms, signs = diagonalize_commuting_pauli_words(grouping)
+    >>> unitary
+    [CNOT(wires=[0, 1]), Hadamard(wires=[0])]
+    >>> diag_terms
+    [PauliZ(wires=[0]), PauliZ(wires=[1]), PauliZ(wires=[0]) @ PauliZ(wires=[1])]
+    >>> signs
+    [1, 1, -1]
+    """
+    binary, wire_map = _commuting_binary_matrix(commuting_grouping)
+    n_qubits = len(wire_map)
+
+    _, diag_z, r = _clifford_diagonalization(binary[:, :n_qubits], binary[:, n_qubits:])
+
+    unitary = commuting_rotation(commuting_grouping)
+    diag_terms = binary_matrix_to_observables(
+        np.hstack([np.zeros_like(diag_z), diag_z]), wire_map=wire_map
+    )
+    signs = [int(1 - 2 * sign) for sign in r]
+
+    return unitary, diag_terms, signs
+
+
+def diagonalize_commuting_groupings(commuting_groupings):
+    """Diagonalizes a list of commutative groupings of Pauli strings using Clifford circuits.
+
+    Args:
+        commuting_groupings (list[list[Observable]]): a list of mutually commutative groupings
+            of Pauli string observables
+
+    Returns:
+        tuple:
+
+            * list[list[Operation]]: a list of instances of the commuting_rotation
+              template which diagonalizes the commuting grouping,
+              order corresponding to commuting_groupings
+            * list[list[Observable]]: a list of commuting groupings diagonalized in the
+              computational basis, order corresponding to commuting_groupings
+            * list[list[int]]: a list of the signs relating the rotated Pauli words to
+              the diagonal observables, order corresponding to commuting_groupings
+
+    **Example**
+
+    >>> groupings = [[qml.PauliX(0) @ qml.PauliX(1), qml.PauliZ(0) @ qml.PauliZ(1)],
+    ...              [qml.PauliY(0)]]
+    >>> diagonalize_commuting_groupings(groupings)
+    ([[CNOT(wires=[0, 1]), Hadamard(wires=[0])], [S(wires=[0]), Hadamard(wires=[0])]],
+     [[PauliZ(wires=[0]), PauliZ(wires=[1])], [PauliZ(wires=[0])]],
+     [[1, 1], [-1]])
+    """
+    post_rotations = []
+    diag_groupings = []
+    sign_groupings = []
+
+    for grouping in commuting_groupings:
+        diagonalizing_unitary, diag_grouping, signs = diagonalize_commuting_pauli_words(grouping)
+        post_rotations.append(diagonalizing_unitary)
+        diag_groupings.append(diag_grouping)
+        sign_groupings.append(signs)
+
+    return post_rotations, diag_groupings, sign_groupings
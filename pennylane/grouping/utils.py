@@ -23,8 +23,12 @@ representation of Pauli words and applications, see:
 
 from pennylane import PauliX, PauliY, PauliZ, Identity
 from pennylane.operation import Observable, Tensor
-from pennylane.wires import Wires
+from pennylane.wires import Wires, WireError
 import numpy as np
+import scipy.sparse
+
+_PAULI_BITS = {"Identity": (), "PauliX": (0,), "PauliY": (0, 1), "PauliZ": (1,)}
+"""dict[str, tuple[int]]: the X (0) and Z (1) components set by each single-qubit Pauli"""
 
 
 def is_pauli_word(observable):
@@ -419,7 +423,8 @@ def observables_to_binary_matrix(observables, n_qubits=None, wire_map=None):
     of the binary vectors.
 
     The dimension of the binary vectors will be implied from the highest wire being acted on
-    non-trivially by the Pauli words in observables.
+    non-trivially by the Pauli words in observables. All Pauli words are converted in a single
+    pass using a shared wire map, and the matrix is filled in a single assignment.
 
     Args:
         observables (list[Union[Identity, PauliX, PauliY, PauliZ, Tensor]]): the list of Pauli
@@ -432,6 +437,11 @@ def observables_to_binary_matrix(observables, n_qubits=None, wire_map=None):
     Returns:
         array[array[int]]: a matrix whose rows are Pauli words in binary vector representation
 
+    Raises:
+        TypeError: if an element of ``observables`` is not a Pauli word
+        ValueError: if ``n_qubits`` does not support the highest mapped wire index
+        WireError: if a wire of the Pauli words is not contained in ``wire_map``
+
     **Example**
 
     >>> observables_to_binary_matrix([PauliX(0) @ PauliY(2), PauliZ(0) @ PauliZ(1) @ PauliZ(2)])
@@ -439,8 +449,6 @@ def observables_to_binary_matrix(observables, n_qubits=None, wire_map=None):
            [0., 0., 0., 1., 1., 1.]])
     """
 
-    m_cols = len(observables)
-
     if wire_map is None:
         all_wires = Wires.all_wires([pauli_word.wires for pauli_word in observables])
         wire_map = {i: c for c, i in enumerate(all_wires)}
@@ -454,15 +462,171 @@ def observables_to_binary_matrix(observables, n_qubits=None, wire_map=None):
             " instead got n_qubits={}.".format(n_qubits_min, n_qubits)
         )
 
-    binary_mat = np.zeros((m_cols, 2 * n_qubits))
+    # the row, column, and Z offset of each non-identity factor, written in a single assignment
+    rows, cols, z_offsets = [], [], []
+
+    for i, pauli_word in enumerate(observables):
+        factors = pauli_word.obs if isinstance(pauli_word, Tensor) else [pauli_word]
+
+        for factor in factors:
+            bits = _PAULI_BITS.get(factor.name, None)
+
+            if bits is None:
+                raise TypeError(
+                    "Expected a Pauli word Observable instance, instead got {}.".format(pauli_word)
+                )
+
+            wire = wire_map.get(factor.wires.labels[0], None)
 
-    for i in range(m_cols):
-        binary_mat[i, :] = pauli_to_binary(observables[i], n_qubits=n_qubits, wire_map=wire_map)
+            if wire is None:
+                raise WireError(
+                    "No mapping for wire label {} specified in wire map {}.".format(
+                        factor.wires.labels[0], wire_map
+                    )
+                )
+            for z_offset in bits:
+                rows.append(i)
+                cols.append(wire)
+                z_offsets.append(z_offset)
+
+    binary_mat = np.zeros((len(observables), 2 * n_qubits))
+    binary_mat[rows, np.array(cols, dtype=int) + n_qubits * np.array(z_offsets, dtype=int)] = 1
 
     return binary_mat
 
 
-def qwc_complement_adj_matrix(binary_observables):
+def binary_matrix_to_observables(binary_matrix, wire_map=None):
+    """Converts a row matrix of binary vectors to a list of Pauli words.
+
+    This is the inverse of :func:`~.observables_to_binary_matrix`, and is equivalent to
+    applying :func:`~.binary_to_pauli` to each row, with the input validated once for the whole
+    matrix and each Pauli word constructed in a single step.
+
+    Args:
+        binary_matrix (array[int]): a matrix whose rows are Pauli words in binary vector
+            representation
+        wire_map (dict): dictionary containing all wire labels used in the Pauli words as keys, and
+            unique integer labels as their values
+
+    Returns:
+        list[Observable]: the Pauli words corresponding to the rows of the input matrix. Rows with
+        a single non-identity factor are converted to Pauli operations, and zero rows to an
+        :class:`~.Identity` instance.
+
+    Raises:
+        ValueError: if the binary vectors are not of even dimension, do not have strictly binary
+            components, or do not match the values of ``wire_map``
+
+    **Example**
+
+    >>> binary_matrix_to_observables([[1, 1, 0, 0, 1, 0], [0, 0, 0, 1, 1, 1]])
+    [Tensor(PauliX(wires=[0]), PauliY(wires=[1])), Tensor(PauliZ(wires=[0]), PauliZ(wires=[1]),
+     PauliZ(wires=[2]))]
+    """
+    binary_matrix = np.asarray(binary_matrix)
+
+    if binary_matrix.ndim != 2 or binary_matrix.shape[1] % 2 != 0:
+        raise ValueError(
+            "Expected a matrix of binary vectors of even dimension, instead got a matrix of "
+            "shape {}.".format(binary_matrix.shape)
+        )
+
+    if not np.array_equal(binary_matrix, binary_matrix.astype(bool)):
+        raise ValueError("Input matrix must have strictly binary components.")
+
+    n_qubits = binary_matrix.shape[1] // 2
+
+    if wire_map is not None:
+        if set(wire_map.values()) != set(range(n_qubits)):
+            raise ValueError(
+                "The values of wire_map must be integers 0 to N, for 2N-dimensional binary vectors."
+                " Instead got wire_map values: {}".format(wire_map.values())
+            )
+        label_map = {explicit_index: wire_label for wire_label, explicit_index in wire_map.items()}
+    else:
+        label_map = {i: i for i in range(n_qubits)}
+
+    x = binary_matrix[:, :n_qubits].astype(bool)
+    z = binary_matrix[:, n_qubits:].astype(bool)
+    paulis = (x & ~z) * 1 + (x & z) * 2 + (~x & z) * 3
+    pauli_ops = (None, PauliX, PauliY, PauliZ)
+    identity_label = list(label_map.values())[0]
+
+    observables = []
+
+    for row in paulis:
+        factors = [pauli_ops[p](wires=label_map[i]) for i, p in enumerate(row) if p]
+
+        if not factors:
+            observables.append(Identity(wires=identity_label))
+        elif len(factors) == 1:
+            observables.append(factors[0])
+        else:
+            observables.append(Tensor(*factors))
+
+    return observables
+
+
+def _binary_blocks(binary_observables):
+    """Validates a matrix of Pauli words in the binary vector representation, and splits it
+    into its X and Z blocks.
+
+    Args:
+        binary_observables (array[array[int]]): a matrix whose rows are the Pauli words in the
+            binary vector representation
+
+    Returns:
+        tuple[array[float]]: the X and Z blocks of the binary matrix
+
+    Raises:
+        ValueError: if input binary observables contain components which are not strictly binary
+    """
+    if isinstance(binary_observables, (list, tuple)):
+        binary_observables = np.asarray(binary_observables)
+
+    if not np.array_equal(binary_observables, binary_observables.astype(bool)):
+        raise ValueError("Expected a binary array, instead got {}".format(binary_observables))
+
+    binary_observables = np.asarray(binary_observables, dtype=float)
+    n_qubits = np.shape(binary_observables)[1] // 2
+
+    return binary_observables[:, :n_qubits], binary_observables[:, n_qubits:]
+
+
+def _assemble_adj_matrix(block, m_terms, chunk_size, sparse):
+    """Assembles an adjacency matrix from blocks of ``chunk_size`` rows.
+
+    Args:
+        block (function): computes the rows of the adjacency matrix selected by a slice
+        m_terms (int): number of vertices of the graph
+        chunk_size (int): number of rows of the adjacency matrix computed at a time
+        sparse (bool): whether to return a ``scipy.sparse`` matrix
+
+    Returns:
+        array[array[int]] or scipy.sparse.csr_matrix: the adjacency matrix
+    """
+    if sparse:
+        # only the edges of each block are kept, as booleans, so that memory scales
+        # with the number of edges rather than the number of pairs of vertices
+        blocks = [
+            scipy.sparse.csr_matrix(block(slice(start, start + chunk_size)), dtype=bool)
+            for start in range(0, m_terms, chunk_size)
+        ]
+        if not blocks:
+            return scipy.sparse.csr_matrix((0, 0), dtype=bool)
+
+        return scipy.sparse.vstack(blocks, format="csr")
+
+    adj = np.zeros((m_terms, m_terms))
+
+    for start in range(0, m_terms, chunk_size):
+        rows = slice(start, start + chunk_size)
+        adj[rows] = block(rows)
+
+    return adj
+
+
+def qwc_complement_adj_matrix(binary_observables, chunk_size=1000, sparse=False):
     """Obtains the adjacency matrix for the complementary graph of the qubit-wise commutativity
     graph for a given set of observables in the binary representation.
 
@@ -470,12 +634,21 @@ def qwc_complement_adj_matrix(binary_observables):
     and two nodes are connected if and only if the corresponding Pauli words are qubit-wise
     commuting.
 
+    Two Pauli words are not qubit-wise commuting if they act with different Pauli operators on
+    at least one common wire, that is, if the number of wires acted on non-trivially by
+    both Pauli words exceeds the number of wires on which they act with the same Pauli
+    operator. Both counts are obtained for all pairs at once from matrix products, evaluated
+    for ``chunk_size`` rows of the adjacency matrix at a time to bound memory.
+
     Args:
         binary_observables (array[array[int]]): a matrix whose rows are the Pauli words in the
             binary vector representation
+        chunk_size (int): number of rows of the adjacency matrix computed at a time
+        sparse (bool): whether to return the adjacency matrix as a ``scipy.sparse`` matrix
 
     Returns:
-        array[array[int]]: the adjacency matrix for the complement of the qubit-wise commutativity graph
+        array[array[int]] or scipy.sparse.csr_matrix: the adjacency matrix for the complement
+        of the qubit-wise commutativity graph
 
     Raises:
         ValueError: if input binary observables contain components which are not strictly binary
@@ -492,19 +665,98 @@ def qwc_complement_adj_matrix(binary_observables):
            [1., 0., 0.],
            [1., 0., 0.]])
     """
+    x, z = _binary_blocks(binary_observables)
 
-    if isinstance(binary_observables, (list, tuple)):
-        binary_observables = np.asarray(binary_observables)
+    # one-hot encoding of the PauliX, PauliY and PauliZ operators acting on each wire
+    paulis = np.hstack([x * (1 - z), x * z, (1 - x) * z])
+    support = np.maximum(x, z)
 
-    if not np.array_equal(binary_observables, binary_observables.astype(bool)):
-        raise ValueError("Expected a binary array, instead got {}".format(binary_observables))
+    def block(rows):
+        return support[rows] @ support.T != paulis[rows] @ paulis.T
 
-    m_terms = np.shape(binary_observables)[0]
-    adj = np.zeros((m_terms, m_terms))
+    return _assemble_adj_matrix(block, len(x), chunk_size, sparse)
 
-    for i in range(m_terms):
-        for j in range(i + 1, m_terms):
-            adj[i, j] = int(not is_qwc(binary_observables[i], binary_observables[j]))
-            adj[j, i] = adj[i, j]
 
-    return adj
+def commuting_complement_adj_matrix(binary_observables, chunk_size=1000, sparse=False):
+    """Obtains the adjacency matrix for the complementary graph of the commutativity graph
+    for a given set of observables in the binary representation.
+
+    The commutativity graph for a set of Pauli words has a vertex for each Pauli word,
+    and two nodes are connected if and only if the corresponding Pauli words are commuting,
+    that is, if the symplectic inner product of their binary vectors vanishes. The inner
+    products of all pairs are obtained from matrix products, evaluated for ``chunk_size``
+    rows of the adjacency matrix at a time to bound memory.
+
+    Args:
+        binary_observables (array[array[int]]): a matrix whose rows are the Pauli words in the
+            binary vector representation
+        chunk_size (int): number of rows of the adjacency matrix computed at a time
+        sparse (bool): whether to return the adjacency matrix as a ``scipy.sparse`` matrix
+
+    Returns:
+        array[array[int]] or scipy.sparse.csr_matrix: the adjacency matrix for the complement
+        of the commutativity graph
+
+    Raises:
+        ValueError: if input binary observables contain components which are not strictly binary
+
+    **Example**
+
+    >>> binary_observables
+    array([[1., 0., 1., 0., 0., 1.],
+           [0., 1., 1., 1., 0., 1.],
+           [0., 0., 0., 1., 0., 0.]])
+
+    >>> commuting_complement_adj_matrix(binary_observables)
+    array([[0., 1., 1.],
+           [1., 0., 0.],
+           [1., 0., 0.]])
+    """
+    x, z = _binary_blocks(binary_observables)
+
+    def block(rows):
+        return (x[rows] @ z.T + z[rows] @ x.T) % 2
+
+    return _assemble_adj_matrix(block, len(x), chunk_size, sparse)
+
+
+def anticommuting_complement_adj_matrix(binary_observables, chunk_size=1000, sparse=False):
+    """Obtains the adjacency matrix for the complementary graph of the anticommutativity graph
+    for a given set of observables in the binary representation.
+
+    Two distinct Pauli words are connected in the complementary graph if and only if they
+    commute, that is, if the symplectic inner product of their binary vectors vanishes.
+
+    Args:
+        binary_observables (array[array[int]]): a matrix whose rows are the Pauli words in the
+            binary vector representation
+        chunk_size (int): number of rows of the adjacency matrix computed at a time
+        sparse (bool): whether to return the adjacency matrix as a ``scipy.sparse`` matrix
+
+    Returns:
+        array[array[int]] or scipy.sparse.csr_matrix: the adjacency matrix for the complement
+        of the anticommutativity graph
+
+    Raises:
+        ValueError: if input binary observables contain components which are not strictly binary
+
+    **Example**
+
+    >>> binary_observables
+    array([[1., 0., 1., 0., 0., 1.],
+           [0., 1., 1., 1., 0., 1.],
+           [0., 0., 0., 1., 0., 0.]])
+
+    >>> anticommuting_complement_adj_matrix(binary_observables)
+    array([[0., 0., 0.],
+           [0., 0., 1.],
+           [0., 1., 0.]])
+    """
+    x, z = _binary_blocks(binary_observables)
+
+    def block(rows):
+        commuting = (x[rows] @ z.T + z[rows] @ x.T) % 2 == 0
+        commuting[np.arange(len(commuting)), np.arange(len(x))[rows]] = False
+        return commuting
+
+    return _assemble_adj_matrix(block, len(x), chunk_size, sparse)
@@ -362,7 +362,12 @@ def cov_matrix(prob, obs, wires=None, diag_approx=False):
 
         l1 = cast(o1.eigvals, dtype=np.float64)
         l2 = cast(o2.eigvals, dtype=np.float64)
-        l12 = cast(np.kron(l1, l2), dtype=np.float64)
+
+        # the marginal probabilities are ordered by wire, so the joint
+        # eigenvalues must be permuted into the same order
+        l12 = np.reshape(np.kron(o1.eigvals, o2.eigvals), [2] * len(shared_wires))
+        l12 = np.transpose(l12, np.argsort(list(o1wires) + list(o2wires)))
+        l12 = cast(np.reshape(l12, [-1]), dtype=np.float64)
 
         p1 = marginal_prob(prob, o1wires)
         p2 = marginal_prob(prob, o2wires)
@@ -21,6 +21,7 @@ from .adagrad import AdagradOptimizer
 from .adam import AdamOptimizer
 from .gradient_descent import GradientDescentOptimizer
 from .momentum import MomentumOptimizer
+from .multi_start import MultiStartOptimizer
 from .nesterov_momentum import NesterovMomentumOptimizer
 from .rms_prop import RMSPropOptimizer
 from .qng import QNGOptimizer
@@ -34,6 +35,7 @@ __all__ = [
     "AdamOptimizer",
     "GradientDescentOptimizer",
     "MomentumOptimizer",
+    "MultiStartOptimizer",
     "NesterovMomentumOptimizer",
     "RMSPropOptimizer",
     "QNGOptimizer",
@@ -0,0 +1,289 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Multi-start optimizer"""
+import copy
+
+import numpy as np
+
+import pennylane as qml
+from pennylane.numpy import tensor
+from pennylane.tape.qnode import _get_classical_jacobian
+from pennylane.tape.tapes.jacobian_tape import _batch_execute_unique
+
+from .gradient_descent import GradientDescentOptimizer
+from .qng import QNGOptimizer
+
+
+def _supports_batching(objective_fn):
+    """Determines whether the forward passes and gradients of an objective function
+    can be evaluated for several parameter sets in a single device batch.
+
+    Args:
+        objective_fn (function): the objective function
+
+    Returns:
+        bool: whether the objective function is a tape-mode QNode using the NumPy
+        interface and a differentiation method that evaluates tapes on the device
+    """
+    if not isinstance(objective_fn, qml.tape.QNode):
+        return False
+
+    return objective_fn.interface == "autograd" and objective_fn.diff_options["method"] in (
+        "best",
+        "analytic",
+        "numeric",
+    )
+
+
+def _batch_grad(qnode, xs, kwargs):
+    """Evaluates a QNode and its gradient at several parameter sets, submitting all required
+    tapes to the device in a single batch.
+
+    Args:
+        qnode (.tape.QNode): a QNode returning a single expectation value
+        xs (list[array]): the parameter sets
+        kwargs (dict): keyword arguments for the QNode
+
+    Returns:
+        tuple[list[array], list[float]] or None: the gradient and the QNode output at each
+        parameter set, or ``None`` if the QNode does not return a single expectation value
+        or has no trainable gate parameters
+    """
+    classical_jacobian = _get_classical_jacobian(qnode)
+
+    tapes = []
+    processing = []
+
+    for x in xs:
+        qnode.construct((x,), kwargs)
+
+        measurements = qnode.qtape.measurements
+
+        if len(measurements) != 1 or measurements[0].return_type is not qml.operation.Expectation:
+            return None
+
+        if not qnode.qtape.trainable_params:
+            return None
+
+        t, fn = qnode.qtape.jacobian_tapes(qnode.device, include_forward=True, **qnode.diff_options)
+
+        # the QNode reuses its tape for the next parameter set, and the generated tapes may
+        # share its operations (as for reversible differentiation), so they are copied
+        tapes.extend(tape.copy(copy_operations=True) for tape in t)
+
+        # the Jacobian of the gate parameters with respect to x
+        c_jac = classical_jacobian(x, **kwargs)
+        processing.append((len(t), fn, c_jac))
+
+    results = _batch_execute_unique(qnode.device, tapes)
+
+    grads = []
+    costs = []
+    start = 0
+
+    for num_tapes, fn, c_jac in processing:
+        res = results[start : start + num_tapes]
+        start += num_tapes
+
+        # chain rule through the classical processing of the QNode
+        grads.append(np.tensordot(fn(res)[0], c_jac, axes=1))
+        costs.append(float(np.squeeze(res[0])))
+
+    return grads, costs
+
+
+class MultiStartOptimizer:
+    r"""Optimizer advancing a population of parameter sets simultaneously.
+
+    Multi-start optimization runs the same optimizer from many initial parameter sets,
+    to reduce the chance of converging to a poor local minimum. Rather than optimizing each
+    parameter set in turn, this optimizer advances the whole population one step at a time.
+    The parameter sets are stacked along the first dimension of a single array.
+
+    Each member of the population is updated by its own copy of the provided optimizer,
+    so that optimizers with internal state (such as the :class:`~.AdamOptimizer`) track each
+    member independently. If the objective function is a QNode in tape mode, using the NumPy
+    interface and the parameter-shift or finite-difference method, the tapes required to evaluate
+    the objective function and its gradient for all members are submitted to the device in a
+    single batch. Otherwise, the members are evaluated one after the other.
+
+    Members whose gradient norm falls below the tolerance ``tol`` are considered
+    converged, and are no longer evaluated or updated. For the :class:`~.QNGOptimizer`,
+    the norm of the natural gradient is used instead.
+
+    Args:
+        optimizer (GradientDescentOptimizer): the optimizer used to update each member of the
+            population. The :class:`~.QNGOptimizer` is supported, but the members are
+            then evaluated one after the other.
+        tol (float): Tolerance for the Euclidean norm of the gradient, below which a member is
+            considered converged. If ``None``, the members are never considered converged.
+
+    **Example**
+
+    Consider a QNode depending on a single array of parameters, and a set of
+    random initial parameters drawn using :mod:`pennylane.init`:
+
+    .. code-block:: python
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(params):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        starts = np.stack(
+            [qml.init.basic_entangler_layers_uniform(1, 2, seed=s)[0] for s in range(50)]
+        )
+
+    All 50 parameter sets are advanced together, with the forward passes and
+    gradients of every step evaluated in a single device batch:
+
+    >>> opt = qml.MultiStartOptimizer(qml.GradientDescentOptimizer(0.4), tol=1e-4)
+    >>> for _ in range(100):
+    ...     starts, costs = opt.step_and_cost(circuit, starts)
+    >>> best = starts[np.argmin(costs)]
+    >>> opt.converged.sum()
+    50
+    """
+
+    def __init__(self, optimizer, tol=None):
+        if not isinstance(optimizer, GradientDescentOptimizer):
+            raise ValueError(
+                "The multi-start optimizer requires a gradient-based optimizer, "
+                "instead got {}.".format(type(optimizer))
+            )
+
+        self.optimizer = optimizer
+        self.tol = tol
+        self.reset()
+
+    def reset(self):
+        """Reset the optimizer state of each member of the population."""
+        self._optimizers = None
+        self._converged = None
+        self._costs = None
+
+    @property
+    def converged(self):
+        """array[bool]: whether each member of the population has converged, or ``None``
+        if no step has been taken"""
+        return self._converged
+
+    def _init_population(self, num_members):
+        """Initialize the optimizer state for a population of the given size."""
+        self._optimizers = [copy.deepcopy(self.optimizer) for _ in range(num_members)]
+        self._converged = np.zeros(num_members, dtype=bool)
+        self._costs = np.full(num_members, np.nan)
+
+    @staticmethod
+    def _compute_grads(objective_fn, xs, kwargs):
+        """Compute the gradients and objective function values of a list of parameter sets.
+
+        Args:
+            objective_fn (function): the objective function for optimization
+            xs (list[array]): the parameter sets
+            kwargs (dict): keyword arguments for the objective function
+
+        Returns:
+            tuple[list[array], list[float]]: the gradient and objective function value
+            of each parameter set
+        """
+        if _supports_batching(objective_fn):
+            res = _batch_grad(objective_fn, xs, kwargs)
+
+            if res is not None:
+                return res
+
+        grads = []
+        costs = []
+
+        for x in xs:
+            g, forward = GradientDescentOptimizer.compute_grad(objective_fn, (x,), kwargs)
+
+            if forward is None:
+                forward = objective_fn(x, **kwargs)
+
+            grads.append(np.reshape(g, np.shape(x)))
+            costs.append(float(forward))
+
+        return grads, costs
+
+    def step_and_cost(self, objective_fn, X, **kwargs):
+        """Update each member of the population with one step of the optimizer, and return
+        the corresponding objective function values prior to the step.
+
+        Args:
+            objective_fn (function): The objective function for optimization. It must take
+                the parameters of a single member as its only positional argument.
+            X (array): the parameters of the population, stacked along the first dimension
+            **kwargs: variable length of keyword arguments for the objective function
+
+        Returns:
+            tuple[array, array[float]]: the new parameters of the population, and the objective
+            function value of each member prior to the step. For converged members, the
+            parameters are left unchanged, and the last computed objective function
+            value is returned.
+        """
+        X = np.asarray(X)
+
+        if self._optimizers is None or len(self._optimizers) != len(X):
+            self._init_population(len(X))
+
+        active = np.flatnonzero(~self._converged)
+        X_new = X.copy()
+
+        if isinstance(self.optimizer, QNGOptimizer):
+            for i in active:
+                opt = self._optimizers[i]
+                X_new[i], self._costs[i] = opt.step_and_cost(objective_fn, tensor(X[i]), **kwargs)
+
+                # the norm of the natural gradient
+                # pylint: disable=protected-access
+                norm = np.linalg.norm(X_new[i] - X[i]) / opt._stepsize
+
+                if self.tol is not None and norm <= self.tol:
+                    self._converged[i] = True
+
+            return X_new, self._costs.copy()
+
+        grads, costs = self._compute_grads(objective_fn, [tensor(X[i]) for i in active], kwargs)
+
+        for i, g, cost in zip(active, grads, costs):
+            self._costs[i] = cost
+
+            if self.tol is not None and np.linalg.norm(g) <= self.tol:
+                self._converged[i] = True
+                continue
+
+            X_new[i] = self._optimizers[i].apply_grad((g,), (tensor(X[i]),))[0]
+
+        return X_new, self._costs.copy()
+
+    def step(self, objective_fn, X, **kwargs):
+        """Update each member of the population with one step of the optimizer.
+
+        Args:
+            objective_fn (function): The objective function for optimization. It must take
+                the parameters of a single member as its only positional argument.
+            X (array): the parameters of the population, stacked along the first dimension
+            **kwargs: variable length of keyword arguments for the objective function
+
+        Returns:
+            array: the new parameters of the population
+        """
+        X_new, _ = self.step_and_cost(objective_fn, X, **kwargs)
+        return X_new
@@ -15,6 +15,7 @@
 # pylint: disable=too-many-branches
 
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve
 
 import pennylane as qml
 from pennylane.utils import _flatten, unflatten
@@ -67,6 +68,15 @@ class QNGOptimizer(GradientDescentOptimizer):
     rule to optimize a variational circuit with :math:`d` parameters and :math:`L` layers,
     a total of :math:`2d+L` quantum evaluations are required per optimization step.
 
+    In tape mode, on state-vector simulators such as ``default.qubit``, the metric tensor
+    is instead computed by simulating the circuit once, and evaluating the covariances
+    of the generators on the state prior to each layer.
+
+    Since the metric tensor typically varies slowly over the course of an optimization,
+    its evaluation can be amortized over several steps using the ``recompute_every`` and
+    ``recompute_tol`` arguments. The factorization of the metric tensor used to compute
+    the natural gradient is reused until the metric tensor is recomputed.
+
     For more details, see:
 
         James Stokes, Josh Izaac, Nathan Killoran, Giuseppe Carleo.
@@ -147,13 +157,52 @@ class QNGOptimizer(GradientDescentOptimizer):
             time taken per optimization step.
         lam (float): metric tensor regularization :math:`G_{ij}+\lambda I`
             to be applied at each optimization step
+        recompute_every (int or None): the number of optimization steps after which
+            the metric tensor is recomputed. If ``None``, the metric tensor is only
+            recomputed when required by ``recompute_tol``.
+        recompute_tol (float or None): if provided, the metric tensor is also recomputed
+            once the Euclidean distance between the variables and their values at the
+            last evaluation of the metric tensor exceeds this tolerance
     """
 
-    def __init__(self, stepsize=0.01, diag_approx=False, lam=0):
+    def __init__(
+        self, stepsize=0.01, diag_approx=False, lam=0, recompute_every=1, recompute_tol=None
+    ):
         super().__init__(stepsize)
         self.diag_approx = diag_approx
         self.metric_tensor = None
         self.lam = lam
+        self.recompute_every = recompute_every
+        self.recompute_tol = recompute_tol
+
+        self._steps_since_recompute = 0
+        self._x_recompute = None
+
+    @property
+    def metric_tensor(self):
+        """array: the regularized metric tensor used by the optimization steps"""
+        return self._metric_tensor
+
+    @metric_tensor.setter
+    def metric_tensor(self, value):
+        self._metric_tensor = value
+        # the cached factorization corresponds to the previous metric tensor
+        self._factorization = None
+
+    def _recompute_required(self, x):
+        """Whether the metric tensor should be recomputed at the variables ``x``,
+        according to ``recompute_every`` and ``recompute_tol``."""
+        if self.metric_tensor is None:
+            return True
+
+        if self.recompute_every is not None and self._steps_since_recompute >= self.recompute_every:
+            return True
+
+        if self.recompute_tol is not None and self._x_recompute is not None:
+            x_flat = np.array(list(_flatten(x)))
+            return np.linalg.norm(x_flat - self._x_recompute) > self.recompute_tol
+
+        return False
 
     def step_and_cost(self, qnode, x, recompute_tensor=True, metric_tensor_fn=None):
         """Update the parameter array :math:`x` with one step of the optimizer and return the
@@ -163,8 +212,8 @@ class QNGOptimizer(GradientDescentOptimizer):
             qnode (QNode): the QNode for optimization
             x (array): NumPy array containing the current values of the variables to be updated
             recompute_tensor (bool): Whether or not the metric tensor should
-                be recomputed. If not, the metric tensor from the previous
-                optimization step is used.
+                be recomputed, as determined by ``recompute_every`` and ``recompute_tol``.
+                If not, the metric tensor from the previous optimization step is used.
             metric_tensor_fn (function): Optional metric tensor function
                 with respect to the variables ``x``.
                 If ``None``, the metric tensor function is computed automatically.
@@ -184,14 +233,21 @@ class QNGOptimizer(GradientDescentOptimizer):
                 "Otherwise, metric_tensor_fn must be explicitly provided to the optimizer."
             )
 
-        if recompute_tensor or self.metric_tensor is None:
+        if (recompute_tensor and self._recompute_required(x)) or self.metric_tensor is None:
             if metric_tensor_fn is None:
                 # pseudo-inverse metric tensor
-                self.metric_tensor = qml.metric_tensor(qnode, diag_approx=self.diag_approx)(x)
+                self.metric_tensor = qml.metric_tensor(
+                    qnode, diag_approx=self.diag_approx, differentiable=False
+                )(x)
             else:
                 self.metric_tensor = metric_tensor_fn(x)
             self.metric_tensor += self.lam * np.identity(self.metric_tensor.shape[0])
 
+            self._steps_since_recompute = 0
+            self._x_recompute = np.array(list(_flatten(x)))
+
+        self._steps_since_recompute += 1
+
         # The QNGOptimizer.step does not permit passing an external gradient function.
         # Autograd will always calculate the gradient and `forward` will never be `None`.
         g, forward = self.compute_grad(qnode, (x,), dict())
@@ -206,8 +262,8 @@ class QNGOptimizer(GradientDescentOptimizer):
             qnode (QNode): the QNode for optimization
             x (array): NumPy array containing the current values of the variables to be updated
             recompute_tensor (bool): Whether or not the metric tensor should
-                be recomputed. If not, the metric tensor from the previous
-                optimization step is used.
+                be recomputed, as determined by ``recompute_every`` and ``recompute_tol``.
+                If not, the metric tensor from the previous optimization step is used.
             metric_tensor_fn (function): Optional metric tensor function
                 with respect to the variables ``x``.
                 If ``None``, the metric tensor function is computed automatically.
@@ -234,5 +290,36 @@ class QNGOptimizer(GradientDescentOptimizer):
         """
         grad_flat = np.array(list(_flatten(grad)))
         x_flat = np.array(list(_flatten(x)))
-        x_new_flat = x_flat - self._stepsize * np.linalg.solve(self.metric_tensor, grad_flat)
+        x_new_flat = x_flat - self._stepsize * self._solve(grad_flat)
         return unflatten(x_new_flat, x)
+
+    def _solve(self, b):
+        """Solves the linear system defined by the metric tensor for the vector ``b``.
+
+        The factorization of the metric tensor is cached, and reused by subsequent
+        optimization steps until the metric tensor is recomputed.
+        """
+        if self._factorization is None:
+            metric_tensor = np.asarray(self.metric_tensor)
+
+            try:
+                self._factorization = ("cholesky", cho_factor(metric_tensor))
+            except np.linalg.LinAlgError:
+                # without regularization, the metric tensor is only positive semi-definite
+                w, v = np.linalg.eigh(metric_tensor)
+
+                # treat eigenvalues that are zero up to floating point error as zero
+                tol = np.abs(w).max() * len(w) * np.finfo(w.dtype).eps
+
+                if np.any(np.abs(w) <= tol):
+                    raise np.linalg.LinAlgError("Singular matrix")
+
+                self._factorization = ("eigh", (w, v))
+
+        method, factors = self._factorization
+
+        if method == "cholesky":
+            return cho_solve(factors, b)
+
+        w, v = factors
+        return v @ ((v.T @ b) / w)
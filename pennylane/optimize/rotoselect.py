@@ -13,11 +13,15 @@
 # limitations under the License.
 """Rotoselect gradient free optimizer"""
 
+import itertools
+
 import numpy as np
 
 import pennylane as qml
 from pennylane.utils import _flatten, unflatten
 
+from .rotosolve import _evaluate, _optimal_angle
+
 
 class RotoselectOptimizer:
     r"""Rotoselect gradient-free optimizer.
@@ -47,10 +51,19 @@ class RotoselectOptimizer:
     The algorithm is described in further detail in
     `Ostaszewski et al. (2019) <https://arxiv.org/abs/1905.09692>`_.
 
+    By default, the parameters and generators are updated sequentially (a Gauss-Seidel
+    sweep). Alternatively, all of them can be updated simultaneously from the objective
+    function values at the current parameters and generators (a Jacobi sweep). If the
+    objective function is a QNode in tape mode, or an :class:`~.ExpvalCost` in tape mode with
+    ``optimize=False``, the circuits required for each update are submitted to the device in
+    batches; for a Jacobi sweep, two batches are required per step. Other objective functions
+    are evaluated one circuit at a time.
+
     Args:
         possible_generators (list[~.Operation]): List containing the possible
             ``pennylane.ops.qubit`` operators that are allowed in the circuit.
             Default is the set of Pauli rotations :math:`\{R_x, R_y, R_z\}`.
+        jacobi (bool): whether to update all parameters and generators simultaneously
 
     **Example:**
 
@@ -90,8 +103,9 @@ class RotoselectOptimizer:
     """
     # pylint: disable=too-few-public-methods
 
-    def __init__(self, possible_generators=None):
+    def __init__(self, possible_generators=None, jacobi=False):
         self.possible_generators = possible_generators or [qml.RX, qml.RY, qml.RZ]
+        self.jacobi = jacobi
 
     def step_and_cost(self, objective_fn, x, generators, **kwargs):
         """Update trainable arguments with one step of the optimizer and return the corresponding
@@ -132,9 +146,11 @@ class RotoselectOptimizer:
             array: The new variable values :math:`x^{(t+1)}` as well as the new generators.
         """
         x_flat = np.fromiter(_flatten(x), dtype=float)
-        # wrap the objective function so that it accepts the flattened parameter array
-        objective_fn_flat = lambda x_flat, gen: objective_fn(
-            unflatten(x_flat, x), generators=gen, **kwargs
+        # wrap the objective function so that it accepts a list of flattened
+        # parameter arrays and generators
+        objective_fn_flat = lambda points: _evaluate(
+            objective_fn,
+            [((unflatten(x_p, x),), {"generators": gen, **kwargs}) for x_p, gen in points],
         )
 
         try:
@@ -144,82 +160,83 @@ class RotoselectOptimizer:
                 "Number of parameters {} must be equal to the number of generators.".format(x)
             ) from e
 
-        for d, _ in enumerate(x_flat):
-            x_flat[d], generators[d] = self._find_optimal_generators(
-                objective_fn_flat, x_flat, generators, d
+        if self.jacobi:
+            positions = [list(range(len(x_flat)))]
+        else:
+            positions = [[d] for d in range(len(x_flat))]
+
+        for pos in positions:
+            params_opt, generators_opt = self._find_optimal_generators(
+                objective_fn_flat, x_flat, generators, pos
             )
 
+            for d, param, generator in zip(pos, params_opt, generators_opt):
+                x_flat[d], generators[d] = param, generator
+
         return unflatten(x_flat, x), generators
 
-    def _find_optimal_generators(self, objective_fn, x, generators, d):
+    def _find_optimal_generators(self, objective_fn, x, generators, positions):
         r"""Optimizer for the generators.
 
-        Optimizes for the best generator at position ``d``.
+        Optimizes for the best generator at each of the given positions, with the
+        parameters and generators at all other positions held fixed.
 
         Args:
-            objective_fn (function): The objective function for optimization. It must have the
-                signature ``objective_fn(x, generators=None)`` with a sequence of the values ``x``
-                and a list of the gates ``generators`` as inputs, returning a single value.
+            objective_fn (function): The objective function for optimization. It must take a
+                list of tuples containing a sequence of the values ``x`` and a list of the gates
+                ``generators``, returning the list of corresponding objective function values.
             x (Union[Sequence[float], float]): sequence containing the initial values of the
                 variables to be optimized over or a single float with the initial value
             generators (list[~.Operation]): list containing the initial ``pennylane.ops.qubit``
                 operators to be used in the circuit and optimized over
-            d (int): the position in the input sequence ``x`` containing the value to be optimized
+            positions (list[int]): the positions in the input sequence ``x`` containing the
+                values to be optimized
 
         Returns:
-            tuple: tuple containing the parameter value and generator that, at position ``d`` in
-            ``x`` and ``generators``, optimizes the objective function
+            tuple[list[float], list[~.Operation]]: the parameter values and generators that,
+            at each of the positions in ``x`` and ``generators``, optimize the objective function
         """
-        params_opt_d = x[d]
-        generators_opt_d = generators[d]
-        params_opt_cost = objective_fn(x, generators)
 
-        for generator in self.possible_generators:
-            generators[d] = generator
+        def insert(d, theta, generator):
+            x_new = x.copy()
+            x_new[d] = theta
+            generators_new = list(generators)
+            generators_new[d] = generator
+            return x_new, generators_new
 
-            x = self._rotosolve(objective_fn, x, generators, d)
-            params_cost = objective_fn(x, generators)
+        candidates = list(itertools.product(positions, self.possible_generators))
+        shifts = [0, np.pi / 2, -np.pi / 2]
 
-            # save the best paramter and generator for position d
-            if params_cost <= params_opt_cost:
-                params_opt_d = x[d]
-                params_opt_cost = params_cost
-                generators_opt_d = generator
-        return params_opt_d, generators_opt_d
+        # the current cost, and the shifted evaluations determining the optimal
+        # parameter value for each position and generator
+        values = objective_fn(
+            [(x, generators)] + [insert(d, s, gen) for d, gen in candidates for s in shifts]
+        )
+        current_cost, values = values[0], iter(values[1:])
 
-    @staticmethod
-    def _rotosolve(objective_fn, x, generators, d):
-        r"""The rotosolve step for one parameter and one set of generators.
+        thetas = [_optimal_angle(*[next(values) for _ in shifts]) for _ in candidates]
+        costs = iter(objective_fn([insert(d, t, gen) for (d, gen), t in zip(candidates, thetas)]))
+        thetas = iter(thetas)
 
-        Updates the parameter :math:`\theta_d` based on Equation 1 in
-        `Ostaszewski et al. (2019) <https://arxiv.org/abs/1905.09692>`_.
+        params_opt = []
+        generators_opt = []
 
-        Args:
-            objective_fn (function): The objective function for optimization. It must have the
-                signature ``objective_fn(x, generators=None)`` with a sequence of the values ``x``
-                and a list of the gates ``generators`` as inputs, returning a single value.
-            x (Union[Sequence[float], float]): sequence containing the initial values of the
-                variables to be optimized overs or a single float with the initial value
-            generators (list[~.Operation]): list containing the initial ``pennylane.ops.qubit``
-                operators to be used in the circuit and optimized over
-            d (int): the position in the input sequence ``x`` containing the value to be optimized
-
-        Returns:
-            array: the input sequence ``x`` with the value at position ``d`` optimized
-        """
-        # helper function for x[d] = theta
-        def insert(x, d, theta):
-            x[d] = theta
-            return x
+        for d in positions:
+            params_opt_d = x[d]
+            generators_opt_d = generators[d]
+            params_opt_cost = current_cost
 
-        H_0 = float(objective_fn(insert(x, d, 0), generators))
-        H_p = float(objective_fn(insert(x, d, np.pi / 2), generators))
-        H_m = float(objective_fn(insert(x, d, -np.pi / 2), generators))
+            for generator in self.possible_generators:
+                params_d = next(thetas)
+                params_cost = next(costs)
 
-        a = np.arctan2(2 * H_0 - H_p - H_m, H_p - H_m)
+                # save the best paramter and generator for position d
+                if params_cost <= params_opt_cost:
+                    params_opt_d = params_d
+                    params_opt_cost = params_cost
+                    generators_opt_d = generator
 
-        x[d] = -np.pi / 2 - a
+            params_opt.append(params_opt_d)
+            generators_opt.append(generators_opt_d)
 
-        if x[d] <= -np.pi:
-            x[d] += 2 * np.pi
-        return x
+        return params_opt, generators_opt
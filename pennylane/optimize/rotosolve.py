@@ -14,9 +14,141 @@
 """Rotosolve gradient free optimizer"""
 
 import numpy as np
+
+import pennylane as qml
+from pennylane.tape.qnode import _executable_tape
 from pennylane.utils import _flatten, unflatten
 
 
+def _batchable_qnodes(objective_fn):
+    """Returns the tape-mode QNodes evaluated by an objective function, and the coefficients
+    with which their outputs are summed, if the objective function can be evaluated in batches.
+
+    Args:
+        objective_fn (function): the objective function
+
+    Returns:
+        tuple[list[.tape.QNode], list[float]] or None: the QNodes and their coefficients, or
+        ``None`` if the objective function is neither a tape-mode QNode nor an
+        :class:`~.ExpvalCost` measuring each Hamiltonian term with a separate QNode
+    """
+    if isinstance(objective_fn, qml.tape.QNode):
+        return [objective_fn], [1.0]
+
+    # pylint: disable=protected-access
+    if isinstance(objective_fn, qml.ExpvalCost) and not objective_fn._optimize:
+        qnodes = list(objective_fn.qnodes)
+
+        if all(isinstance(q, qml.tape.QNode) for q in qnodes):
+            return qnodes, objective_fn.hamiltonian.coeffs
+
+    return None
+
+
+def _construct(qnodes, calls):
+    """Constructs the tapes of a list of QNodes for each of a list of arguments.
+
+    Args:
+        qnodes (list[.tape.QNode]): the QNodes
+        calls (list[tuple[tuple, dict]]): the positional and keyword arguments
+            of each evaluation
+
+    Returns:
+        list[tuple] or None: for each evaluation and QNode, the QNode, its constructed tape,
+        quantum function output and tape parameters, and an executable copy of the tape;
+        or ``None`` if a QNode must execute its tapes itself
+    """
+    constructed = []
+
+    for args, kwargs in calls:
+        for q in qnodes:
+            q.construct(args, kwargs)
+            tape = _executable_tape(q)
+
+            if tape is None:
+                return None
+
+            # QNodes reuse their tape when the circuit structure is unchanged,
+            # so the parameters of each evaluation are recorded separately
+            params = q.qtape.get_parameters(trainable_only=False)
+            constructed.append((q, q.qtape, q.qfunc_output, params, tape))
+
+    return constructed
+
+
+def _evaluate(objective_fn, calls):
+    """Evaluates an objective function for a list of arguments.
+
+    If the objective function is a tape-mode QNode, or an :class:`~.ExpvalCost` without
+    measurement optimization, the tapes of all evaluations are constructed first, and the
+    tapes of each device are submitted to it in a single batch. The results are then
+    post-processed by the QNodes, as if they had executed each tape themselves. QNodes
+    that must execute their tapes themselves, for example if they are differentiated
+    via backpropagation, are evaluated point by point.
+
+    Args:
+        objective_fn (function): the objective function, returning a single value
+        calls (list[tuple[tuple, dict]]): the positional and keyword arguments
+            of each evaluation
+
+    Returns:
+        list[float]: the objective function values
+    """
+    batchable = _batchable_qnodes(objective_fn)
+    constructed = _construct(batchable[0], calls) if batchable is not None else None
+
+    if constructed is None:
+        return [float(objective_fn(*args, **kwargs)) for args, kwargs in calls]
+
+    batches = {}
+
+    for q, *_, tape in constructed:
+        batches.setdefault(id(q.device), (q.device, []))[1].append(tape)
+
+    results = {k: iter(dev.batch_execute(tapes)) for k, (dev, tapes) in batches.items()}
+    constructed = iter(constructed)
+    values = []
+
+    # pylint: disable=protected-access
+    for _ in calls:
+        value = 0.0
+
+        for c in batchable[1]:
+            q, q.qtape, q.qfunc_output, params, _ = next(constructed)
+            q.qtape.set_parameters(params, trainable_only=False)
+            q.qtape._prefetched = (q.device, next(results[id(q.device)]))
+
+            try:
+                value += c * float(q._execute_tape())
+            finally:
+                # discard the result if it was not consumed by the QNode
+                q.qtape._prefetched = None
+
+        values.append(value)
+
+    return values
+
+
+def _optimal_angle(H_0, H_p, H_m):
+    r"""The value of a parameter minimizing a sinusoidal objective function, given the
+    objective function values at :math:`0`, :math:`\pi/2`, and :math:`-\pi/2`.
+
+    Args:
+        H_0 (float): the objective function value at :math:`\theta_d=0`
+        H_p (float): the objective function value at :math:`\theta_d=\pi/2`
+        H_m (float): the objective function value at :math:`\theta_d=-\pi/2`
+
+    Returns:
+        float: the minimizing parameter value in the interval :math:`(-\pi, \pi]`
+    """
+    a = np.arctan2(2 * H_0 - H_p - H_m, H_p - H_m)
+    theta = -np.pi / 2 - a
+
+    if theta <= -np.pi:
+        theta += 2 * np.pi
+    return theta
+
+
 class RotosolveOptimizer:
     r"""Rotosolve gradient free optimizer.
 
@@ -38,6 +170,20 @@ class RotosolveOptimizer:
 
     The algorithm is described in further detail in `Ostaszewski et al. (2019) <https://arxiv.org/abs/1905.09692>`_
 
+    By default, the parameters are updated sequentially, with each update taking the
+    previously updated parameters into account (a Gauss-Seidel sweep). Alternatively, all
+    parameters can be updated simultaneously from the objective function values at the
+    current parameters (a Jacobi sweep). If the objective function is a QNode in tape mode,
+    or an :class:`~.ExpvalCost` in tape mode with ``optimize=False``, the circuits required
+    for each update are submitted to the device in a single batch; for a Jacobi sweep, this
+    is a single batch of :math:`3D` circuits per step and Hamiltonian term. Other objective
+    functions, such as Python functions combining the outputs of QNodes, an
+    :class:`~.ExpvalCost` with ``optimize=True``, or QNodes differentiated via
+    backpropagation, are evaluated one circuit at a time.
+
+    Args:
+        jacobi (bool): whether to update all parameters simultaneously
+
     **Example:**
 
     Initialize the optimizer, set the initial values of ``x`` to be used and set the number of
@@ -76,6 +222,9 @@ class RotosolveOptimizer:
     """
     # pylint: disable=too-few-public-methods
 
+    def __init__(self, jacobi=False):
+        self.jacobi = jacobi
+
     def step_and_cost(self, objective_fn, *args, **kwargs):
         r"""Update args with one step of the optimizer and return the corresponding objective
         function value prior to the step.
@@ -112,6 +261,14 @@ class RotosolveOptimizer:
             list [array]: the new variable values :math:`x^{(t+1)}`.
             If single arg is provided, list [array] is replaced by array.
         """
+        if self.jacobi:
+            args_new = self._jacobi_sweep(objective_fn, args, kwargs)
+
+            # unwrap arguments if only one, backward compatible and cleaner
+            if len(args_new) == 1:
+                return args_new[0]
+            return args_new
+
         # will single out one variable to change at a time
         # these hold the arguments not getting updated
         before_args = []
@@ -128,9 +285,11 @@ class RotosolveOptimizer:
                 x_flat = np.fromiter(_flatten(arg), dtype=float)
 
                 # version of objective function that depends on a flattened version of
-                # just the one argument.  All others held constant.
-                objective_fn_flat = lambda x_flat, arg_kw=arg: objective_fn(
-                    *before_args, unflatten(x_flat, arg_kw), *after_args, **kwargs
+                # just the one argument, evaluated for a list of its values.
+                # All others held constant.
+                objective_fn_flat = lambda xs, arg_kw=arg: _evaluate(
+                    objective_fn,
+                    [((*before_args, unflatten(x, arg_kw), *after_args), kwargs) for x in xs],
                 )
 
                 # updating each parameter in current arg
@@ -147,6 +306,46 @@ class RotosolveOptimizer:
             return args_new[0]
         return args_new
 
+    @staticmethod
+    def _jacobi_sweep(objective_fn, args, kwargs):
+        r"""Updates all trainable parameters simultaneously, based on the objective function
+        values at the current parameters.
+
+        Args:
+            objective_fn (function): the objective function for optimization
+            args (tuple): the current values of the variables to be optimized over
+            kwargs (dict): keyword arguments for the objective function
+
+        Returns:
+            list [array]: the new variable values
+        """
+        x_flat = {
+            index: np.fromiter(_flatten(arg), dtype=float)
+            for index, arg in enumerate(args)
+            if getattr(arg, "requires_grad", True)
+        }
+
+        calls = []
+
+        for index, x in x_flat.items():
+            for d in range(len(x)):
+                for theta in [0, np.pi / 2, -np.pi / 2]:
+                    x_shifted = x.copy()
+                    x_shifted[d] = theta
+
+                    args_shifted = list(args)
+                    args_shifted[index] = unflatten(x_shifted, args[index])
+                    calls.append((tuple(args_shifted), kwargs))
+
+        values = iter(_evaluate(objective_fn, calls))
+        args_new = list(args)
+
+        for index, x in x_flat.items():
+            x_new = np.array([_optimal_angle(*[next(values) for _ in range(3)]) for _ in x])
+            args_new[index] = unflatten(x_new, args[index])
+
+        return args_new
+
     @staticmethod
     def _rotosolve(objective_fn, x, d):
         r"""The rotosolve step for one parameter.
@@ -156,8 +355,8 @@ class RotosolveOptimizer:
 
         Args:
             objective_fn (function): the objective function for optimization. It should take a
-                sequence of the values ``x`` and a list of the gates ``generators`` as inputs, and
-                return a single value.
+                list of sequences of values ``x`` as input, and return the list of
+                corresponding objective function values.
             x (Union[Sequence[float], float]): sequence containing the initial values of the
                 variables to be optimized over or a single float with the initial value.
             d (int): the position in the input sequence ``x`` containing the value to be optimized.
@@ -165,19 +364,15 @@ class RotosolveOptimizer:
         Returns:
             array: the input sequence ``x`` with the value at position ``d`` optimized.
         """
-        # helper function for x[d] = theta
+        # helper function for a copy of x with x[d] = theta
         def insert(x, d, theta):
+            x = x.copy()
             x[d] = theta
             return x
 
-        H_0 = float(objective_fn(insert(x, d, 0)))
-        H_p = float(objective_fn(insert(x, d, np.pi / 2)))
-        H_m = float(objective_fn(insert(x, d, -np.pi / 2)))
-
-        a = np.arctan2(2 * H_0 - H_p - H_m, H_p - H_m)
-
-        x[d] = -np.pi / 2 - a
+        H_0, H_p, H_m = objective_fn(
+            [insert(x, d, 0), insert(x, d, np.pi / 2), insert(x, d, -np.pi / 2)]
+        )
 
-        if x[d] <= -np.pi:
-            x[d] += 2 * np.pi
+        x[d] = _optimal_angle(H_0, H_p, H_m)
         return x
@@ -15,9 +15,10 @@
 API."""
 import functools
 import inspect
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Optional
 import pennylane as qml
+from pennylane.operation import State
 
 try:
     import tensorflow as tf
@@ -127,6 +128,18 @@ class KerasLayer(Layer):
         If ``weight_specs`` is not specified, weights will be added using the Keras default
         initialization and without any regularization or constraints.
 
+        **Batched evaluation**
+
+        In tape mode, unless the QNode uses the ``"backprop"`` differentiation method, the
+        circuits for all datapoints of a batch are submitted to the device in a single batch,
+        as are the circuits required for their gradients. With the ``"backprop"`` method,
+        a batch is evaluated using a single vectorized call if the ``default.qubit.tf``
+        device is in graph mode. This assumes that the structure of the circuit does not
+        depend on the value of the input data. Batched evaluation can also be traced by
+        :func:`tf.function`; to train a model in graph mode, the layer can be created with
+        ``dynamic=False``. QNodes returning samples or the state are evaluated for each
+        datapoint separately, and require eager execution.
+
         **Additional example**
 
         The code block below shows how a circuit composed of templates from the
@@ -223,7 +236,8 @@ class KerasLayer(Layer):
 
         self.qnode_weights = {}
 
-        super().__init__(dynamic=True, **kwargs)
+        kwargs.setdefault("dynamic", True)
+        super().__init__(**kwargs)
 
     def _signature_validation_tape_mode(self, qnode, weight_shapes):
         sig = inspect.signature(qnode.func).parameters
@@ -307,6 +321,12 @@ class KerasLayer(Layer):
         Returns:
             tensor: output data
         """
+        if qml.tape_mode_active() and (
+            self.qnode.diff_options["method"] != "backprop"
+            or getattr(self.qnode.device, "graph_mode", False)
+        ):
+            return self._evaluate_qnode_batch_tape_mode(inputs)
+
         outputs = []
         for x in inputs:  # iterate over batch
 
@@ -344,6 +364,81 @@ class KerasLayer(Layer):
         kwargs = {**{self.input_arg: x}, **{k: 1.0 * w for k, w in self.qnode_weights.items()}}
         return self.qnode(**kwargs)
 
+    def _evaluate_qnode_batch_tape_mode(self, inputs):
+        """Evaluates a tape-mode QNode for a batch of input datapoints.
+
+        The circuits for all datapoints are submitted to the device in a single batch,
+        as are the circuits required for their gradients. With the ``"backprop"``
+        differentiation method, the circuits are instead evaluated using a single
+        vectorized call of the device.
+
+        Args:
+            inputs (tensor): the batch of datapoints
+
+        Returns:
+            tensor: the batch of output datapoints
+        """
+        # pylint: disable=import-outside-toplevel
+        from pennylane.tape.interfaces.tf import batch_execute
+
+        # the circuit is constructed in Python when tracing, and must not be converted by AutoGraph
+        @tf.autograph.experimental.do_not_convert
+        def gate_params(x):
+            kwargs = {**{self.input_arg: x}, **{k: 1.0 * w for k, w in self.qnode_weights.items()}}
+            self.qnode.construct([], kwargs)
+            return self.qnode.qtape.get_parameters(trainable_only=False)
+
+        # the structure of the circuit is determined from the first datapoint
+        params = gate_params(inputs[0])
+        tape = self.qnode.qtape
+
+        # all tensor-valued gate parameters depend on the inputs or the weights
+        trainable = [i for i, p in enumerate(params) if isinstance(p, (tf.Tensor, tf.Variable))]
+
+        if (
+            tape.is_sampled
+            or any(m.return_type is State for m in tape.measurements)
+            or any(params[i].shape.rank != 0 for i in trainable)
+        ):
+            # sampled and state outputs, and non-scalar gate parameters, are not batched
+            return tf.stack([self._evaluate_qnode_tape_mode(x) for x in inputs])
+
+        backprop = self.qnode.diff_options["method"] == "backprop"
+        dtype = tf.keras.backend.floatx() if backprop else tape.dtype
+
+        if trainable:
+            batch_params = tf.map_fn(
+                lambda x: tf.stack([tf.cast(gate_params(x)[i], dtype) for i in trainable]),
+                inputs,
+                fn_output_signature=dtype,
+            )
+        else:
+            batch_params = tf.zeros([tf.shape(inputs)[0], 0], dtype=dtype)
+
+        tape = self.qnode.qtape
+
+        if backprop:
+            # batch all gate parameters, repeating the constant parameters
+            columns = dict(zip(trainable, tf.unstack(batch_params, num=len(trainable), axis=1)))
+            all_params = [
+                columns[i] if i in columns else tf.repeat([p], tf.shape(inputs)[0], axis=0)
+                for i, p in enumerate(params)
+            ]
+
+            try:
+                res = self.qnode.device.vmap_execute(tape, all_params)
+            except qml.DeviceError:
+                return tf.stack([self._evaluate_qnode_tape_mode(x) for x in inputs])
+        else:
+            tape.trainable_params = set(trainable)
+            res = batch_execute(tape, batch_params, self.qnode.device)
+
+        if not isinstance(self.qnode.qfunc_output, Sequence) and tape.output_dim == 1:
+            # a single scalar output per datapoint
+            res = res[:, 0]
+
+        return res
+
     def compute_output_shape(self, input_shape):
         """Computes the output shape after passing data of shape ``input_shape`` through the
         QNode.
@@ -16,7 +16,7 @@ API."""
 import functools
 import inspect
 import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Callable, Optional
 
 try:
@@ -35,6 +35,7 @@ except ImportError:
 
 
 import pennylane as qml
+from pennylane.operation import State
 
 
 class TorchLayer(Module):
@@ -312,6 +313,9 @@ class TorchLayer(Module):
         if len(inputs.shape) == 1:
             return self._evaluate_qnode(inputs)
 
+        if qml.tape_mode_active() and self.qnode.diff_options["method"] != "backprop":
+            return self._evaluate_qnode_batch_tape_mode(inputs)
+
         return torch.stack([self._evaluate_qnode(x) for x in inputs])
 
     def _evaluate_qnode(self, x):
@@ -355,6 +359,47 @@ class TorchLayer(Module):
         }
         return self.qnode(**kwargs).type(x.dtype)
 
+    def _evaluate_qnode_batch_tape_mode(self, inputs):
+        """Evaluates a tape-mode QNode for a batch of input datapoints.
+
+        The circuits for all datapoints are submitted to the device in a single batch,
+        as are the circuits required for their Jacobians on the backward pass.
+
+        Args:
+            inputs (tensor): the batch of datapoints
+
+        Returns:
+            tensor: the batch of output datapoints
+        """
+        # pylint: disable=import-outside-toplevel
+        from pennylane.tape.interfaces.torch import batch_execute
+
+        tapes = []
+        params = []
+
+        for x in inputs:
+            kwargs = {
+                **{self.input_arg: x},
+                **{arg: weight.to(x) for arg, weight in self.qnode_weights.items()},
+            }
+            self.qnode.construct([], kwargs)
+            tape = self.qnode.qtape
+
+            if tape.is_sampled or any(m.return_type is State for m in tape.measurements):
+                # sampled and state outputs are not batched
+                return torch.stack([self._evaluate_qnode_tape_mode(x) for x in inputs])
+
+            tapes.append(tape)
+            params.append(tape.get_parameters(trainable_only=False))
+
+        res = batch_execute(tapes, params, self.qnode.device)
+
+        if not isinstance(self.qnode.qfunc_output, Sequence) and res.shape[1] == 1:
+            # a single scalar output per datapoint
+            res = res[:, 0]
+
+        return res.type(inputs.dtype)
+
     def __str__(self):
         detail = "<Quantum Torch Layer: func={}>"
         return detail.format(self.qnode.func.__name__)
@@ -55,6 +55,10 @@ class TapeCircuitGraph(CircuitGraph):
 
         super().__init__(ops + obs, variable_deps={}, wires=wires)
 
+        # Lazily computed reachability index; maps each node to an integer bitmask
+        # over ``self.observables`` (bit ``k`` is set iff observable ``k`` is reachable)
+        self._reachability = None
+
         # For computing depth; want only a graph with the operations, not
         # including the observables
         self._operation_graph = None
@@ -73,6 +77,49 @@ class TapeCircuitGraph(CircuitGraph):
         super().update_node(old, new)
         self._operations = self.operations_in_order
         self._observables = self.observables_in_order
+        self._reachability = None
+
+    @property
+    def reachability(self):
+        """Reachability index of the observables in the circuit.
+
+        The index is computed once, via a single sweep over the graph
+        in reverse topological order, and cached for subsequent calls.
+
+        Returns:
+            dict[Operator, int]: dictionary mapping each node in the graph to an integer
+            bitmask, where bit ``k`` is set if and only if there is a directed path from the
+            node to the observable ``self.observables[k]`` (nodes are considered to reach
+            themselves)
+        """
+        if self._reachability is None:
+            bits = {ob: 1 << k for k, ob in enumerate(self.observables)}
+            reach = {}
+
+            for node in reversed(list(nx.topological_sort(self._graph))):
+                mask = bits.get(node, 0)
+
+                for succ in self._graph.successors(node):
+                    mask |= reach[succ]
+
+                reach[node] = mask
+
+            self._reachability = reach
+
+        return self._reachability
+
+    def observables_reachable(self, op):
+        """Observables in the circuit that the given operator is an ancestor of.
+
+        Args:
+            op (Operator): operator in the circuit
+
+        Returns:
+            list[Operator]: the observables reachable from ``op``, in the order they
+            appear in :attr:`observables`
+        """
+        mask = self.reachability[op]
+        return [ob for k, ob in enumerate(self.observables) if mask >> k & 1]
 
     @property
     def parametrized_layers(self):
@@ -162,7 +162,17 @@ class AutogradInterface(AnnotatedQueue):
 
         # evaluate the tape
         self.set_parameters(self._all_params_unwrapped, trainable_only=False)
-        res = self.execute_device(params, device=device)
+
+        if any(isinstance(p, ArrayBox) for p in self._all_parameter_values):
+            # The tape is being differentiated; evaluate the tape and
+            # compute the Jacobian in a single batch.
+            res, self._forward_jacobian = self._cached_execute_and_jacobian(
+                device, params=params, **self.jacobian_options
+            )
+        else:
+            res = self.execute_device(params, device=device)
+            self._forward_jacobian = None
+
         self.set_parameters(self._all_parameter_values, trainable_only=False)
 
         if self.is_sampled:
@@ -195,12 +205,18 @@ class AutogradInterface(AnnotatedQueue):
             gradient output vector, and computes the vector-Jacobian product
         """
 
+        # the Jacobian computed alongside the forward pass, if available
+        cache = {"jacobian": self._forward_jacobian}
+
         def gradient_product(g):
-            # In autograd, the forward pass is always performed prior to the backwards
-            # pass, so we do not need to re-unwrap the parameters.
-            self.set_parameters(self._all_params_unwrapped, trainable_only=False)
-            jac = self.jacobian(device, params=params, **self.jacobian_options)
-            self.set_parameters(self._all_parameter_values, trainable_only=False)
+            if cache["jacobian"] is None:
+                # In autograd, the forward pass is always performed prior to the backwards
+                # pass, so we do not need to re-unwrap the parameters.
+                self.set_parameters(self._all_params_unwrapped, trainable_only=False)
+                cache["jacobian"] = self.jacobian(device, params=params, **self.jacobian_options)
+                self.set_parameters(self._all_parameter_values, trainable_only=False)
+
+            jac = cache["jacobian"]
 
             # only flatten g if all parameters are single values
             if all(np.ndim(p) == 0 for p in params):
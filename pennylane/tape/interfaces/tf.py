@@ -26,6 +26,7 @@ except ImportError:
 
 
 from pennylane.tape.queuing import AnnotatedQueue
+from pennylane.tape.tapes.jacobian_tape import _batch_execute_params, _batch_jacobian
 
 
 class TFInterface(AnnotatedQueue):
@@ -134,18 +135,36 @@ class TFInterface(AnnotatedQueue):
         all_params = self.get_parameters(trainable_only=False)
         all_params_unwrapped = self.convert_to_numpy(all_params)
 
+        # the Jacobian is computed on the first gradient evaluation, and reused
+        # for subsequent gradient evaluations of the same result
+        cache = {}
+
         self.set_parameters(all_params_unwrapped, trainable_only=False)
-        res = self.execute_device(args, input_kwargs["device"])
+
+        if self.jacobian_options.get("eager_jacobian", False) and self.trainable_params:
+            # evaluate the tape and compute the Jacobian in a single batch
+            res, jacobian = self._cached_execute_and_jacobian(
+                input_kwargs["device"], params=args, **self.jacobian_options
+            )
+
+            if jacobian is not None:
+                cache["jacobian"] = jacobian
+        else:
+            res = self.execute_device(args, input_kwargs["device"])
+
         self.set_parameters(all_params, trainable_only=False)
 
         def grad(grad_output, **tfkwargs):
             variables = tfkwargs.get("variables", None)
 
-            self.set_parameters(all_params_unwrapped, trainable_only=False)
-            jacobian = self.jacobian(input_kwargs["device"], params=args, **self.jacobian_options)
-            self.set_parameters(all_params, trainable_only=False)
+            if "jacobian" not in cache:
+                self.set_parameters(all_params_unwrapped, trainable_only=False)
+                cache["jacobian"] = self._cached_jacobian(
+                    input_kwargs["device"], params=args, **self.jacobian_options
+                )
+                self.set_parameters(all_params, trainable_only=False)
 
-            jacobian = tf.constant(jacobian, dtype=self.dtype)
+            jacobian = tf.constant(cache["jacobian"], dtype=self.dtype)
 
             # Reshape gradient output array as a 2D row-vector.
             grad_output_row = tf.reshape(grad_output, [1, -1])
@@ -190,3 +209,112 @@ class TFInterface(AnnotatedQueue):
         tape.__class__ = type("TFQuantumTape", (cls, tape_class), {"dtype": dtype})
         tape._update_trainable_params()
         return tape
+
+
+def batch_execute(tape, params, device):
+    """Evaluate a TensorFlow quantum tape for a batch of trainable parameter values.
+
+    The circuits for all rows of ``params`` are submitted to the device in a single batch.
+    On the backward pass, the circuits required for the Jacobians of all rows are likewise
+    submitted to the device in a single batch.
+
+    Device execution is wrapped in :func:`tf.numpy_function`, so that this function can be
+    traced by :func:`tf.function`, including for an unknown batch size.
+
+    Args:
+        tape (.JacobianTape): tape with the TensorFlow interface applied. Its non-trainable
+            parameters are kept fixed, and must not be symbolic tensors.
+        params (tf.Tensor): the values of the trainable parameters of the tape, as determined
+            by :attr:`~.JacobianTape.trainable_params`, of shape ``(batch_size, num_trainable)``
+        device (.Device): the device to execute on
+
+    Returns:
+        tf.Tensor: the flattened result of the tape for each row of ``params``,
+        of shape ``(batch_size, output_dim)``
+
+    **Example**
+
+    >>> dev = qml.device("default.qubit", wires=1)
+    >>> with TFInterface.apply(QubitParamShiftTape()) as tape:
+    ...     qml.RX(0.1, wires=0)
+    ...     qml.RY(0.2, wires=0)
+    ...     expval(qml.PauliZ(0))
+    >>> tape.trainable_params = {0}
+    >>> x = tf.Variable([[0.1], [0.2], [0.3]], dtype=tf.float64)
+    >>> with tf.GradientTape() as g:
+    ...     res = batch_execute(tape, x, dev)
+    >>> res
+    <tf.Tensor: shape=(3, 1), dtype=float64, numpy=
+    array([[0.97517033],
+           [0.9605305 ],
+           [0.93629336]])>
+    >>> g.gradient(res, x)
+    <tf.Tensor: shape=(3, 1), dtype=float64, numpy=
+    array([[-0.0978434 ],
+           [-0.19470917],
+           [-0.28962948]])>
+    """
+    trainable = sorted(tape.trainable_params)
+    dtype = tape.dtype
+
+    # the non-trainable parameters are fixed when the computation is traced
+    constants = tape.get_parameters(trainable_only=False)
+    constants = TFInterface.convert_to_numpy(
+        [None if i in trainable else p for i, p in enumerate(constants)]
+    )
+
+    def _all_params(rows):
+        """Insert each row of trainable parameter values into the constant parameters."""
+        all_params = []
+
+        for row in rows:
+            p = list(constants)
+
+            for idx, value in zip(trainable, row):
+                p[idx] = value
+
+            all_params.append(p)
+
+        return all_params
+
+    def _execute(rows):
+        saved_trainable = tape.trainable_params
+        tape.trainable_params = set(trainable)
+
+        try:
+            res = _batch_execute_params(device, [tape] * len(rows), _all_params(rows))
+        finally:
+            tape.trainable_params = saved_trainable
+
+        res = np.stack([np.hstack(r) for r in res]) if res else np.zeros([0, tape.output_dim])
+        return res.astype(dtype.as_numpy_dtype)
+
+    def _vjp(rows, dy):
+        saved_trainable = tape.trainable_params
+        tape.trainable_params = set(trainable)
+
+        try:
+            jacs = _batch_jacobian(device, [tape] * len(rows), _all_params(rows))
+        finally:
+            tape.trainable_params = saved_trainable
+
+        if not jacs:
+            return np.zeros([0, len(trainable)], dtype=dtype.as_numpy_dtype)
+
+        # the vector-Jacobian product of each row
+        jacs = np.reshape(jacs, [len(rows), -1, len(trainable)])
+        return np.einsum("bo,bop->bp", dy, jacs).astype(dtype.as_numpy_dtype)
+
+    @tf.custom_gradient
+    def _batch_execute(params):
+        res = tf.numpy_function(_execute, [params], dtype)
+        res.set_shape([params.shape[0], tape.output_dim])
+
+        def grad(grad_output):
+            grad_input = tf.numpy_function(_vjp, [params, tf.cast(grad_output, dtype)], dtype)
+            grad_input.set_shape(params.shape)
+            return grad_input
+
+        return res, grad
+
+    return _batch_execute(tf.convert_to_tensor(params, dtype=dtype))
@@ -24,6 +24,7 @@ from pennylane import QuantumFunctionError
 from pennylane.interfaces.torch import args_to_numpy
 
 from pennylane.tape.queuing import AnnotatedQueue
+from pennylane.tape.tapes.jacobian_tape import _batch_execute_params, _batch_jacobian
 
 COMPLEX_SUPPORT = semantic_version.match(">=1.6.0", torch.__version__)
 
@@ -44,9 +45,21 @@ class _TorchInterface(torch.autograd.Function):
         ctx.all_params = tape.get_parameters(trainable_only=False)
         ctx.all_params_unwrapped = args_to_numpy(ctx.all_params)
 
+        # the Jacobian is computed on the first backward pass, and reused
+        # for subsequent backward passes through the same graph
+        ctx.jacobian = None
+
         # evaluate the tape
         tape.set_parameters(ctx.all_params_unwrapped, trainable_only=False)
-        res = tape.execute_device(ctx.args, device)
+
+        if tape.jacobian_options.get("eager_jacobian", False) and any(ctx.needs_input_grad[1:]):
+            # evaluate the tape and compute the Jacobian in a single batch
+            res, ctx.jacobian = tape._cached_execute_and_jacobian(
+                device, params=ctx.args, **tape.jacobian_options
+            )
+        else:
+            res = tape.execute_device(ctx.args, device)
+
         tape.set_parameters(ctx.all_params, trainable_only=False)
 
         if hasattr(res, "numpy"):
@@ -75,11 +88,12 @@ class _TorchInterface(torch.autograd.Function):
         tape = ctx.kwargs["tape"]
         device = ctx.kwargs["device"]
 
-        tape.set_parameters(ctx.all_params_unwrapped, trainable_only=False)
-        jacobian = tape.jacobian(device, params=ctx.args, **tape.jacobian_options)
-        tape.set_parameters(ctx.all_params, trainable_only=False)
+        if ctx.jacobian is None:
+            tape.set_parameters(ctx.all_params_unwrapped, trainable_only=False)
+            ctx.jacobian = tape._cached_jacobian(device, params=ctx.args, **tape.jacobian_options)
+            tape.set_parameters(ctx.all_params, trainable_only=False)
 
-        jacobian = torch.as_tensor(jacobian, dtype=grad_output.dtype).to(grad_output)
+        jacobian = torch.as_tensor(ctx.jacobian, dtype=grad_output.dtype).to(grad_output)
 
         vjp = grad_output.view(1, -1) @ jacobian
         grad_input_list = torch.unbind(vjp.flatten())
@@ -204,3 +218,98 @@ class TorchInterface(AnnotatedQueue):
         tape.__class__ = type("TorchQuantumTape", (cls, tape_class), {"dtype": dtype})
         tape._update_trainable_params()
         return tape
+
+
+class _TorchBatchInterface(torch.autograd.Function):
+    @staticmethod
+    def forward(ctx, input_kwargs, *input_):
+        """Implements the forward pass of a batch of tape evaluations"""
+        ctx.kwargs = input_kwargs
+        ctx.save_for_backward(*input_)
+
+        tapes = ctx.kwargs["tapes"]
+        device = ctx.kwargs["device"]
+
+        # unwrap all parameters, including constant parameters
+        ctx.all_params_unwrapped = [args_to_numpy(p) for p in ctx.kwargs["params"]]
+
+        res = _batch_execute_params(device, tapes, ctx.all_params_unwrapped)
+        res = np.stack([np.hstack(r) for r in res])
+
+        for i in input_:
+            if isinstance(i, torch.Tensor) and i.is_cuda:  # pragma: no cover
+                return torch.as_tensor(res, device=i.get_device(), dtype=tapes[0].dtype)
+
+        return torch.as_tensor(res, dtype=tapes[0].dtype)
+
+    @staticmethod
+    def backward(ctx, grad_output):  # pragma: no cover
+        """Implements the backwards pass of a batch of tape evaluations, computing
+        the Jacobians of all tapes in a single batch"""
+        tapes = ctx.kwargs["tapes"]
+        device = ctx.kwargs["device"]
+
+        jacs = _batch_jacobian(device, tapes, ctx.all_params_unwrapped)
+        vjp = []
+
+        for g, jac in zip(grad_output, jacs):
+            jac = torch.as_tensor(jac, dtype=grad_output.dtype).to(grad_output)
+            vjp.extend(torch.unbind((g.view(1, -1) @ jac).flatten()))
+
+        grad_input = []
+
+        # match the type and device of the input tensors
+        for i, j in zip(vjp, ctx.saved_tensors):
+            res = torch.as_tensor(i, dtype=tapes[0].dtype)
+            if j.is_cuda:  # pragma: no cover
+                cuda_device = j.get_device()
+                res = torch.as_tensor(res, device=cuda_device)
+            grad_input.append(res)
+
+        return (None,) + tuple(grad_input)
+
+
+def batch_execute(tapes, params, device):
+    """Evaluate a batch of Torch quantum tapes with the provided parameter values.
+
+    All tapes are submitted to the device in a single batch. On the backward pass,
+    the tapes required for the Jacobians of all tapes are likewise submitted to the
+    device in a single batch.
+
+    The same tape may occur several times in the batch, evaluated with different
+    parameter values. This allows a QNode, which reuses its tape for circuits of the
+    same structure, to be evaluated for a batch of inputs.
+
+    Args:
+        tapes (list[.JacobianTape]): tapes with the Torch interface applied
+        params (list[list[torch.Tensor]]): the values of all (trainable and non-trainable)
+            parameters of each tape; the trainable parameters of each tape are
+            determined by :attr:`~.JacobianTape.trainable_params`
+        device (.Device): the device to execute on
+
+    Returns:
+        torch.Tensor: the flattened results of all tapes, of shape ``(len(tapes), output_dim)``
+
+    **Example**
+
+    >>> dev = qml.device("default.qubit", wires=1)
+    >>> with TorchInterface.apply(QubitParamShiftTape()) as tape:
+    ...     qml.RX(torch.tensor(0.1, requires_grad=True), wires=0)
+    ...     expval(qml.PauliZ(0))
+    >>> x = torch.tensor([0.1, 0.2, 0.3], requires_grad=True)
+    >>> res = batch_execute([tape] * 3, [[x[0]], [x[1]], [x[2]]], dev)
+    >>> res
+    tensor([[0.9950],
+            [0.9801],
+            [0.9553]], dtype=torch.float64, grad_fn=<_TorchBatchInterfaceBackward>)
+    >>> res.sum().backward()
+    >>> x.grad
+    tensor([-0.0998, -0.1987, -0.2955])
+    """
+    trainable = []
+
+    for tape, p in zip(tapes, params):
+        trainable.extend(p[i] for i in sorted(tape.trainable_params))
+
+    kwargs = {"tapes": tapes, "params": params, "device": device}
+    return _TorchBatchInterface.apply(kwargs, *trainable)
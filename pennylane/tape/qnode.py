@@ -15,10 +15,12 @@
 This module contains the QNode class and qnode decorator.
 """
 # pylint: disable=import-outside-toplevel
+from collections import Counter
 from collections.abc import Sequence
 from functools import lru_cache, update_wrapper, wraps
 import warnings
 
+from autograd.numpy.numpy_boxes import ArrayBox
 import numpy as np
 
 import pennylane as qml
@@ -106,12 +108,17 @@ class QNode:
             quantum structure will only be constructed on the *first* evaluation of the QNode,
             and is stored and re-used for further quantum evaluations. Only set this to False
             if it is known that the underlying quantum structure is **independent of QNode input**.
+            Note that mutable QNodes reuse the previously constructed tape if the recorded
+            quantum circuit has an unchanged structure, updating only its parameters.
 
     Keyword Args:
         h=1e-7 (float): step size for the finite difference method
         order=1 (int): The order of the finite difference method to use. ``1`` corresponds
             to forward finite differences, ``2`` to centered finite differences.
         shift=pi/2 (float): the size of the shift for two-term parameter-shift gradient computations
+        eager_jacobian=False (bool): If True, the Torch and TensorFlow interfaces compute
+            the Jacobian during the forward pass whenever the output requires gradients,
+            rather than on the first backward pass.
 
     **Example**
 
@@ -144,6 +151,7 @@ class QNode:
         self._original_device = device
         self.qtape = None
         self.qfunc_output = None
+        self._cached_tape = None
         # store the user-specified differentiation method
         self.diff_method = diff_method
 
@@ -456,6 +464,15 @@ class QNode:
         with self.qtape:
             self.qfunc_output = self.func(*args, **kwargs)
 
+        recorded_params = self.qtape.get_parameters(trainable_only=False)
+        structure = (
+            self.interface,
+            self._tape,
+            self.max_expansion,
+            self.diff_options["method"],
+            self.qtape.get_structure(),
+        )
+
         if not isinstance(self.qfunc_output, Sequence):
             measurement_processes = (self.qfunc_output,)
         else:
@@ -467,6 +484,18 @@ class QNode:
                 "or a nonempty sequence of measurements."
             )
 
+        if not all(ret == m for ret, m in zip(measurement_processes, self.qtape.measurements)):
+            raise qml.QuantumFunctionError(
+                "All measurements must be returned in the order they are measured."
+            )
+
+        if self._cached_tape is not None and self._cached_tape[0] == structure:
+            # The quantum function has the same structure as the previous evaluation;
+            # reuse the previously validated and expanded tape, and simply update
+            # its parameters.
+            self._update_cached_tape(recorded_params)
+            return
+
         state_returns = any([m.return_type is State for m in measurement_processes])
 
         # apply the interface (if any)
@@ -479,11 +508,6 @@ class QNode:
             else:
                 self.INTERFACE_MAP[self.interface](self)
 
-        if not all(ret == m for ret, m in zip(measurement_processes, self.qtape.measurements)):
-            raise qml.QuantumFunctionError(
-                "All measurements must be returned in the order they are measured."
-            )
-
         for obj in self.qtape.operations + self.qtape.observables:
             if getattr(obj, "num_wires", None) is qml.operation.WiresEnum.AllWires:
                 # check here only if enough wires
@@ -503,6 +527,13 @@ class QNode:
             for op in self.qtape.operations
         )
 
+        if obs_on_same_wire and not ops_not_supported:
+            # Observables on the same wire that are not qubit-wise commuting can be measured
+            # by devices that evaluate each group of commuting observables on a copy of the
+            # same prepared state; they must not be diagonalized jointly.
+            groups = self._observable_groups()
+            obs_on_same_wire = groups is None or len(groups) == 1
+
         # expand out the tape, if nested tapes are present, any operations are not supported on the
         # device, or multiple observables are measured on the same wire
         if ops_not_supported or obs_on_same_wire:
@@ -512,12 +543,92 @@ class QNode:
                 and self.device.supports_operation(obj.name),
             )
 
+        self._cache_tape(structure, recorded_params)
+
+    def _observable_groups(self):
+        """Returns the groups of qubit-wise commuting observables into which the device
+        partitions the observables of the constructed tape.
+
+        Returns:
+            list[list[int]] or None: the indices of the observables in each group, or ``None``
+            if the device measures the observables jointly
+        """
+        if not self.device.capabilities().get("supports_observable_groups", False):
+            return None
+
+        return self.device.observable_groups(self.qtape)
+
+    def _cache_tape(self, structure, recorded_params):
+        """Cache the constructed tape, alongside a mapping from the parameters
+        recorded by the quantum function to the parameters of the (possibly expanded)
+        constructed tape.
+
+        The mapping is determined by object identity. If a parameter of the
+        constructed tape cannot be unambiguously traced back to a recorded parameter,
+        or a recorded parameter is consumed during expansion (for example, by a
+        decomposition that performs classical processing), the tape is not cached.
+
+        Args:
+            structure (tuple): hashable structure of the recorded quantum function
+            recorded_params (list[Any]): the parameters recorded by the quantum function
+        """
+        self._cached_tape = None
+
+        if not self.mutable:
+            return
+
+        ids = Counter(id(p) for p in recorded_params)
+        slots = {id(p): idx for idx, p in enumerate(recorded_params)}
+        ambiguous = {i for i, count in ids.items() if count > 1}
+
+        param_map = []
+
+        for p in self.qtape.get_parameters(trainable_only=False, return_arraybox=True):
+            if id(p) not in slots or id(p) in ambiguous:
+                return
+
+            param_map.append(slots[id(p)])
+
+        if set(param_map) != set(range(len(recorded_params))):
+            return
+
+        self._cached_tape = (structure, self.qtape, param_map)
+
+    # pylint: disable=protected-access
+    def _update_cached_tape(self, recorded_params):
+        """Update the parameters of the cached tape with newly recorded parameters,
+        and restore it as the QNode tape.
+
+        Args:
+            recorded_params (list[Any]): the parameters recorded by the quantum function
+        """
+        _, self.qtape, param_map = self._cached_tape
+        self.qtape.set_parameters([recorded_params[i] for i in param_map], trainable_only=False)
+
+        # the trainability of the new parameters may differ
+        trainable_params = self.qtape.trainable_params
+        self.qtape._update_trainable_params()
+
+        if self.qtape.trainable_params != trainable_params:
+            # gradient information must be regenerated
+            for info in self.qtape._par_info.values():
+                info.pop("grad_method", None)
+
+        self.qtape.jacobian_options = self.diff_options
+
     def __call__(self, *args, **kwargs):
         if self.mutable or self.qtape is None:
             # construct the tape
             self.construct(args, kwargs)
 
-        # execute the tape
+        return self._execute_tape()
+
+    def _execute_tape(self):
+        """Execute the constructed tape on the device.
+
+        Returns:
+            Any: the QNode output
+        """
         res = self.qtape.execute(device=self.device)
 
         # FIX: If the qnode swapped the device, increase the num_execution value on the original device.
@@ -540,7 +651,9 @@ class QNode:
 
         return qml.math.squeeze(res)
 
-    def metric_tensor(self, *args, diag_approx=False, only_construct=False, **kwargs):
+    def metric_tensor(
+        self, *args, diag_approx=False, only_construct=False, differentiable=True, **kwargs
+    ):
         """Evaluate the value of the metric tensor.
 
         Args:
@@ -549,13 +662,19 @@ class QNode:
             diag_approx (bool): iff True, use the diagonal approximation
             only_construct (bool): Iff True, construct the circuits used for computing
                 the metric tensor but do not execute them, and return the tapes.
+            differentiable (bool): If ``False``, and the device supports it, the metric
+                tensor is computed in a single simulation of the circuit. The result is
+                not guaranteed to be differentiable.
 
         Returns:
             array[float]: metric tensor
         """
-        return metric_tensor(self, diag_approx=diag_approx, only_construct=only_construct)(
-            *args, **kwargs
-        )
+        return metric_tensor(
+            self,
+            diag_approx=diag_approx,
+            only_construct=only_construct,
+            differentiable=differentiable,
+        )(*args, **kwargs)
 
     def draw(
         self, charset="unicode", wire_order=None, show_all_wires=False, **kwargs
@@ -841,11 +960,16 @@ def qnode(device, interface="autograd", diff_method="best", mutable=True, **diff
             quantum structure will only be constructed on the *first* evaluation of the QNode,
             and is stored and re-used for further quantum evaluations. Only set this to False
             if it is known that the underlying quantum structure is **independent of QNode input**.
+            Note that mutable QNodes reuse the previously constructed tape if the recorded
+            quantum circuit has an unchanged structure, updating only its parameters.
 
     Keyword Args:
         h=1e-7 (float): Step size for the finite difference method.
         order=1 (int): The order of the finite difference method to use. ``1`` corresponds
             to forward finite differences, ``2`` to centered finite differences.
+        eager_jacobian=False (bool): If True, the Torch and TensorFlow interfaces compute
+            the Jacobian during the forward pass whenever the output requires gradients,
+            rather than on the first backward pass.
 
     **Example**
 
@@ -872,6 +996,42 @@ def qnode(device, interface="autograd", diff_method="best", mutable=True, **diff
     return qfunc_decorator
 
 
+def _executable_tape(qnode):
+    """Returns a copy of the constructed tape of a QNode with all parameters
+    unwrapped to NumPy arrays, suitable for submitting to its device as part of a batch.
+
+    Args:
+        qnode (.tape.QNode): a constructed QNode
+
+    Returns:
+        .QuantumTape or None: the executable tape, or ``None`` if the QNode must
+        execute its tape itself, for example if the tape is being differentiated
+        via backpropagation
+    """
+    tape = qnode.qtape
+
+    if qnode.diff_options["method"] == "backprop" or tape.is_sampled:
+        return None
+
+    # pylint: disable=protected-access
+    if not all(len(o.diagonalizing_gates()) == 0 for o in tape._obs_sharing_wires):
+        return None
+
+    params = []
+
+    for p in tape.get_parameters(trainable_only=False):
+        if isinstance(p, ArrayBox):
+            # The QNode is being differentiated by Autograd; the interface evaluates
+            # the tape together with its Jacobian
+            return None
+
+        params.append(qml.math.toarray(p))
+
+    tape = tape.copy(copy_operations=True, tape_cls=qml.tape.QuantumTape)
+    tape.set_parameters(params, trainable_only=False)
+    return tape
+
+
 def _get_classical_jacobian(_qnode):
     """Helper function to extract the Jacobian
     matrix of the classical part of a QNode"""
@@ -911,8 +1071,8 @@ def _get_classical_jacobian(_qnode):
         return _jacobian
 
 
-def metric_tensor(_qnode, diag_approx=False, only_construct=False):
-    """metric_tensor(qnode, diag_approx=False, only_construct=False)
+def metric_tensor(_qnode, diag_approx=False, only_construct=False, differentiable=True):
+    """metric_tensor(qnode, diag_approx=False, only_construct=False, differentiable=True)
     Returns a function that returns the value of the metric tensor
     of a given QNode.
 
@@ -927,6 +1087,10 @@ def metric_tensor(_qnode, diag_approx=False, only_construct=False):
         diag_approx (bool): iff True, use the diagonal approximation
         only_construct (bool): Iff True, construct the circuits used for computing
             the metric tensor but do not execute them, and return the tapes.
+        differentiable (bool): If ``False``, and the device supports it, the metric
+            tensor is computed from the device state in a single simulation of the
+            circuit, rather than by executing a circuit per parametrized layer.
+            The resulting metric tensor is not guaranteed to be differentiable.
 
     Returns:
         func: Function which accepts the same arguments as the QNode. When called, this
@@ -975,6 +1139,18 @@ def metric_tensor(_qnode, diag_approx=False, only_construct=False):
     >>> grad_fn(weights)
     array([[ 0.04867729, -0.00049502,  0.        ],
            [ 0.        ,  0.        ,  0.        ]])
+
+    If differentiability is not required, for example when the metric tensor is
+    used to precondition an optimization step, state-vector simulators such as
+    ``default.qubit`` can compute it by simulating the circuit once, and evaluating
+    the generator covariances directly on the state at the start of each layer:
+
+    >>> met_fn = qml.metric_tensor(circuit, differentiable=False)
+    >>> met_fn(weights)
+    array([[0.25  , 0.    , 0.    , 0.    ],
+           [0.    , 0.25  , 0.    , 0.    ],
+           [0.    , 0.    , 0.0025, 0.0024],
+           [0.    , 0.    , 0.0024, 0.0123]])
     """
     if _qnode.__class__.__name__ == "ExpvalCost":
         if _qnode._multiple_devices:  # pylint: disable=protected-access
@@ -999,18 +1175,27 @@ def metric_tensor(_qnode, diag_approx=False, only_construct=False):
         perm = np.argsort(np.argsort(perm))
 
         _qnode.construct(args, kwargs)
+        wrt = wrt.tolist() if _qnode.diff_options["method"] == "backprop" else None
 
-        metric_tensor_tapes, processing_fn = qml.tape.transforms.metric_tensor(
-            _qnode.qtape,
-            diag_approx=diag_approx,
-            wrt=wrt.tolist() if _qnode.diff_options["method"] == "backprop" else None,
-        )
+        if (
+            not differentiable
+            and not only_construct
+            and hasattr(_qnode.device, "metric_tensor")
+            and _qnode.device.analytic
+        ):
+            # the device computes the metric tensor in a single pass over the circuit
+            mt = _qnode.device.metric_tensor(_qnode.qtape, diag_approx=diag_approx, wrt=wrt)
+
+        else:
+            metric_tensor_tapes, processing_fn = qml.tape.transforms.metric_tensor(
+                _qnode.qtape, diag_approx=diag_approx, wrt=wrt
+            )
 
-        if only_construct:
-            return metric_tensor_tapes
+            if only_construct:
+                return metric_tensor_tapes
 
-        res = [t.execute(device=_qnode.device) for t in metric_tensor_tapes]
-        mt = processing_fn(res)
+            res = [t.execute(device=_qnode.device) for t in metric_tensor_tapes]
+            mt = processing_fn(res)
 
         # permute rows ad columns
         mt = qml.math.gather(mt, perm)
@@ -121,6 +121,7 @@ class CVParamShiftTape(QubitParamShiftTape):
         # Create an empty list to store the 'best' partial derivative method
         # for each observable
         best = []
+        reachable = self.graph.observables_reachable(op)
 
         for m in self.measurements:
 
@@ -129,15 +130,15 @@ class CVParamShiftTape(QubitParamShiftTape):
                 best.append("F")
                 continue
 
-            # get the set of operations betweens the operation and the observable
-            ops_between = self.graph.nodes_between(op, m.obs)
-
-            if not ops_between:
+            if not any(m.obs is ob for ob in reachable):
                 # if there is no path between the operation and the observable,
                 # the operator has a zero gradient.
                 best.append("0")
                 continue
 
+            # get the set of operations betweens the operation and the observable
+            ops_between = self.graph.nodes_between(op, m.obs)
+
             # For parameter-shift compatible CV gates, we need to check both the
             # intervening gates, and the type of the observable.
             best_method = "A"
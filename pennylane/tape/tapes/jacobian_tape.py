@@ -17,7 +17,9 @@ to the ``QuantumTape`` class.
 """
 # pylint: disable=too-many-branches
 
+from collections import OrderedDict
 import itertools
+
 import numpy as np
 
 import pennylane as qml
@@ -40,6 +42,200 @@ STATE_PREP_OPS = (
     # qml.GaussianState,
 )
 
+_JACOBIAN_CACHE_SIZE = 16
+"""int: maximum number of Jacobians memoised per tape by :meth:`JacobianTape._cached_jacobian`"""
+
+
+def _tape_hash(tape):
+    """Returns a hashable key that uniquely identifies the circuit recorded by a tape,
+    including both its structure and its parameter values.
+
+    Parameter values are read directly from the recorded operations and observables,
+    so that the key remains correct for tapes whose measurements have been modified
+    in-place after construction.
+
+    Args:
+        tape (.QuantumTape): the quantum tape
+
+    Returns:
+        tuple or None: the hashable key, or ``None`` if the tape contains parameters
+        that cannot be reliably compared by value
+    """
+    params = []
+
+    for obj in tape.operations + tape.measurements:
+        if isinstance(obj, QuantumTape):
+            key = _tape_hash(obj)
+
+            if key is None:
+                return None
+
+            params.append(key[1])
+            continue
+
+        if isinstance(obj, qml.tape.MeasurementProcess):
+            data = [] if obj.obs is None else obj.obs.data
+        else:
+            data = obj.data
+
+        data = _values_key(data)
+
+        if data is None:
+            return None
+
+        params.append(data)
+
+    return tape.get_structure(), tuple(params)
+
+
+def _values_key(values):
+    """Returns a hashable key representing a sequence of numeric parameter values.
+
+    Args:
+        values (Sequence[Any]): parameter values
+
+    Returns:
+        tuple or None: the hashable key, or ``None`` if any of the values cannot be
+        reliably compared by value
+    """
+    key = []
+
+    for p in values:
+        p = np.asarray(p)
+
+        if p.dtype.kind not in "biufc":
+            return None
+
+        key.append((p.dtype.str, p.shape, p.tobytes()))
+
+    return tuple(key)
+
+
+def _batch_execute_unique(device, tapes):
+    """Execute a batch of tapes on a device, evaluating each distinct circuit only once.
+
+    Tapes that record identical circuits with identical parameter values (for example, the
+    unshifted tape generated by several gradient recipes) are submitted to
+    :meth:`~.Device.batch_execute` a single time, and the result is fanned back out
+    to every position at which the circuit occurs in ``tapes``.
+
+    Results estimated from finite samples are not shared, so that the estimates of
+    identical tapes remain independent; on non-analytic devices, or for tapes returning
+    samples, every tape is executed.
+
+    Args:
+        device (.Device): the device to execute on
+        tapes (list[.QuantumTape]): the tapes to execute
+
+    Returns:
+        list[array[float]]: the result of each tape, in the same order as ``tapes``
+    """
+    if not getattr(device, "analytic", True):
+        return device.batch_execute(tapes)
+
+    unique_tapes = []
+    positions = []
+    seen = {}
+
+    for tape in tapes:
+        key = None if tape.is_sampled else _tape_hash(tape)
+
+        if key is None:
+            # cannot determine if this tape is a duplicate, or its result is
+            # estimated from samples; always execute it
+            positions.append(len(unique_tapes))
+            unique_tapes.append(tape)
+            continue
+
+        if key not in seen:
+            seen[key] = len(unique_tapes)
+            unique_tapes.append(tape)
+
+        positions.append(seen[key])
+
+    results = device.batch_execute(unique_tapes)
+    return [results[k] for k in positions]
+
+
+def _batch_execute_params(device, tapes, params):
+    """Execute a batch of tapes with the provided parameter values on a device.
+
+    The same tape may occur several times in the batch, evaluated with different
+    parameter values; for example, when a QNode is evaluated for several inputs
+    with the same circuit structure.
+
+    Args:
+        device (.Device): the device to execute on
+        tapes (list[.QuantumTape]): the tapes to execute
+        params (list[list[Any]]): the values of all (trainable and non-trainable)
+            parameters of each tape
+
+    Returns:
+        list[array[float]]: the result of each tape, in the same order as ``tapes``
+    """
+    executed = []
+
+    for tape, p in zip(tapes, params):
+        saved_parameters = tape.get_parameters(trainable_only=False)
+        tape.set_parameters(p, trainable_only=False)
+        executed.append(tape.copy(copy_operations=True, tape_cls=QuantumTape))
+        tape.set_parameters(saved_parameters, trainable_only=False)
+
+    return _batch_execute_unique(device, executed)
+
+
+def _batch_jacobian(device, tapes, params):
+    """Compute the Jacobians of a batch of tapes with the provided parameter values,
+    executing the tapes required for all Jacobians on the device in a single batch.
+
+    The Jacobians are computed with respect to the trainable parameters of each tape,
+    using the options stored in :attr:`~.JacobianTape.jacobian_options`. Tapes containing
+    variances, or using the device method, are differentiated separately.
+
+    Args:
+        device (.Device): the device to execute on
+        tapes (list[.JacobianTape]): the tapes to differentiate
+        params (list[list[Any]]): the values of all (trainable and non-trainable)
+            parameters of each tape
+
+    Returns:
+        list[array[float]]: the Jacobian of each tape, in the same order as ``tapes``
+    """
+    jacs = [None] * len(tapes)
+    all_tapes = []
+    processing = []
+
+    for i, (tape, p) in enumerate(zip(tapes, params)):
+        saved_parameters = tape.get_parameters(trainable_only=False)
+        tape.set_parameters(p, trainable_only=False)
+
+        try:
+            if tape.jacobian_options.get("method", "best") == "device" or any(
+                m.return_type is qml.operation.Variance for m in tape.measurements
+            ):
+                # the post-processing of these Jacobians depends on the tape state
+                jacs[i] = tape.jacobian(device, **tape.jacobian_options)
+                continue
+
+            jac_tapes, fn = tape.jacobian_tapes(device, **tape.jacobian_options)
+            processing.append((i, len(jac_tapes), fn))
+
+            # the generated tapes may share operations with the tape (as for reversible
+            # differentiation), so they are copied before its parameters are restored
+            all_tapes.extend(t.copy(copy_operations=True) for t in jac_tapes)
+
+        finally:
+            tape.set_parameters(saved_parameters, trainable_only=False)
+
+    results = _batch_execute_unique(device, all_tapes) if all_tapes else []
+    start = 0
+
+    for i, num_tapes, fn in processing:
+        jacs[i] = fn(results[start : start + num_tapes])
+        start += num_tapes
+
+    return jacs
+
 
 # pylint: disable=too-many-public-methods
 class JacobianTape(QuantumTape):
@@ -90,6 +286,12 @@ class JacobianTape(QuantumTape):
     def __init__(self, name=None):
         super().__init__(name=name)
         self.jacobian_options = {}
+        self._jacobian_cache = OrderedDict()
+
+        # If True, the next call to jacobian() includes the unshifted tape in the batch
+        # submitted to the device, storing its result in self._forward_result
+        self._include_forward = False
+        self._forward_result = None
 
     def _grad_method(self, idx, use_graph=True, default_method="F"):
         """Determine the correct partial derivative computation method for each gate parameter.
@@ -131,19 +333,9 @@ class JacobianTape(QuantumTape):
             return None
 
         if (self._graph is not None) or use_graph:
-            # an empty list to store the 'best' partial derivative method
-            # for each observable
-            best = []
-
-            # loop over all observables
-            for ob in self.observables:
-                # check if op is an ancestor of ob
-                has_path = self.graph.has_path(op, ob)
-
-                # Use finite differences if there is a path, else the gradient is zero
-                best.append(default_method if has_path else "0")
-
-            if all(k == "0" for k in best):
+            # The reachability index of the circuit graph is computed once per tape;
+            # if op is not an ancestor of any observable, the gradient is zero
+            if not self.graph.reachability[op]:
                 return "0"
 
         return default_method
@@ -271,7 +463,9 @@ class JacobianTape(QuantumTape):
             tapes.append(shifted)
 
             if y0 is None:
-                tapes.append(self)
+                unshifted = self.copy(copy_operations=True, tape_cls=QuantumTape)
+                unshifted.set_parameters(params)
+                tapes.append(unshifted)
 
             def processing_fn(results):
                 """Computes the gradient of the parameter at index idx via first-order
@@ -488,6 +682,68 @@ class JacobianTape(QuantumTape):
         >>> tape.jacobian(dev)
         array([], shape=(4, 0), dtype=float64)
         """
+        tapes, processing_fn = self.jacobian_tapes(
+            device, params=params, include_forward=self._include_forward, **options
+        )
+
+        if not tapes:
+            # the Jacobian is determined without executing any tapes
+            return processing_fn([])
+
+        # execute all tapes at once, evaluating duplicate tapes only once
+        results = _batch_execute_unique(device, tapes)
+
+        if self._include_forward:
+            self._forward_result = results[0]
+
+        return processing_fn(results)
+
+    def jacobian_tapes(self, device, params=None, include_forward=False, **options):
+        """Generate the quantum tapes and classical post-processing function required to
+        compute the Jacobian of the tape.
+
+        Generating the tapes separately from their execution allows the tapes required for
+        the Jacobians of several quantum tapes to be submitted to a device in a single batch.
+        The differentiation methods are selected as in :meth:`~.jacobian`.
+
+        Args:
+            device (.Device, .QubitDevice): a PennyLane device
+                that can execute quantum operations and return measurement statistics
+            params (list[Any]): The quantum tape operation parameters. If not provided,
+                the current tape parameter values are used (via :meth:`~.get_parameters`).
+            include_forward (bool): If ``True``, a copy of the tape evaluated at ``params``
+                is included as the first of the generated tapes, so that the tape output is
+                computed in the same batch as the Jacobian.
+
+        Keyword Args:
+            method="best" (str): The differentiation method. Must be one of ``"numeric"``,
+                ``"analytic"``, ``"best"``, or ``"device"``.
+            h=1e-7 (float): finite difference method step size
+            order=1 (int): The order of the finite difference method to use. ``1`` corresponds
+                to forward finite differences, ``2`` to centered finite differences.
+            shift=pi/2 (float): the size of the shift for two-term parameter-shift gradient computations
+
+        Returns:
+            tuple[list[QuantumTape], function]: A tuple containing the list of generated tapes,
+            in addition to a post-processing function mapping the list of their results to the
+            2-dimensional Jacobian of shape ``(tape.output_dim, tape.num_params)``.
+
+        **Example**
+
+        .. code-block:: python
+
+            with QubitParamShiftTape() as tape:
+                qml.RX(0.432, wires=0)
+                qml.RY(0.543, wires=0)
+                qml.expval(qml.PauliZ(0))
+
+        >>> dev = qml.device("default.qubit", wires=1)
+        >>> tapes, fn = tape.jacobian_tapes(dev)
+        >>> len(tapes)
+        4
+        >>> fn(dev.batch_execute(tapes))
+        array([[-0.35846484, -0.46923705]])
+        """
         if any([m.return_type is State for m in self.measurements]):
             raise ValueError("The jacobian method does not support circuits that return the state")
 
@@ -508,7 +764,7 @@ class JacobianTape(QuantumTape):
 
         if method == "device":
             # Using device mode; simply query the device for the Jacobian
-            return self.device_pd(device, params=params, **options)
+            return [], lambda results: self.device_pd(device, params=params, **options)
 
         # perform gradient method validation
         diff_methods = self._grad_method_validation(method)
@@ -516,15 +772,18 @@ class JacobianTape(QuantumTape):
         if not self._has_trainable_params(params, diff_methods):
             # Either all parameters have grad method 0, or there are no trainable
             # parameters. Simply return an empty Jacobian.
-            return np.zeros((self.output_dim, len(params)), dtype=float)
+            jac = np.zeros((self.output_dim, len(params)), dtype=float)
+            return [], lambda results: jac
 
         if method == "numeric" or "F" in diff_methods:
             # there exist parameters that will be differentiated numerically
 
-            if options.get("order", 1) == 1:
+            if options.get("order", 1) == 1 and not include_forward:
                 # First order (forward) finite-difference will be performed.
                 # Compute the value of the tape at the current parameters here. This ensures
                 # this computation is only performed once, for all parameters.
+                # If the unshifted tape is part of the batch, the unshifted tape generated
+                # for each parameter is instead deduplicated against it.
                 options["y0"] = np.asarray(self.execute_device(params, device))
 
         # some gradient methods need the device or the device wires
@@ -539,6 +798,11 @@ class JacobianTape(QuantumTape):
         processing_fns = []
         nonzero_grad_idx = []
 
+        if include_forward:
+            forward_tape = self.copy(copy_operations=True, tape_cls=QuantumTape)
+            forward_tape.set_parameters(params)
+            all_tapes.append(forward_tape)
+
         for trainable_idx, param_method in enumerate(diff_methods):
             if param_method == "0":
                 continue
@@ -561,29 +825,230 @@ class JacobianTape(QuantumTape):
             # to extract the correct result for this parameter later, remember the number of tapes
             reshape_info.append(len(tapes))
 
-        # execute all tapes at once
-        results = device.batch_execute(all_tapes)
+        def jacobian_processing_fn(results):
+            """Post-process the results with the appropriate function to
+            fill the Jacobian columns with gradients."""
+            jac = None
+            start = 1 if include_forward else 0
 
-        # post-process the results with the appropriate function to fill jacobian columns with gradients
-        jac = None
-        start = 0
+            for i, processing_fn, res_len in zip(nonzero_grad_idx, processing_fns, reshape_info):
+                # extract the correct results from the flat list
+                res = results[start : start + res_len]
+                start += res_len
 
-        for i, processing_fn, res_len in zip(nonzero_grad_idx, processing_fns, reshape_info):
-            # extract the correct results from the flat list
-            res = results[start : start + res_len]
-            start += res_len
+                # postprocess results to compute the gradient
+                g = self._flatten_processing_result(processing_fn(res))
 
-            # postprocess results to compute the gradient
-            g = self._flatten_processing_result(processing_fn(res))
+                if jac is None:
+                    # update the tape's output dimension
+                    self._output_dim = len(g)
+                    # create the Jacobian matrix
+                    jac = np.zeros((len(g), len(params)), dtype=float)
+
+                jac[:, i] = g
+
+            return jac
+
+        return all_tapes, jacobian_processing_fn
+
+    def execute_and_jacobian(self, device, params=None, **options):
+        """Evaluate the tape and compute its Jacobian, submitting the unshifted tape
+        and all tapes required for the Jacobian to the device in a single batch.
+
+        Compared to calling :meth:`~.execute_device` followed by :meth:`~.jacobian`,
+        this avoids a separate device execution for the tape output. When using first-order
+        finite differences, the output is also reused as the unshifted evaluation for every
+        parameter, rather than being computed separately.
+
+        Takes the same arguments as :meth:`~.jacobian`.
+
+        Returns:
+            tuple[array[float], array[float]]: the tape output, and the
+            2-dimensional Jacobian of shape ``(tape.output_dim, tape.num_params)``
+
+        **Example**
+
+        .. code-block:: python
+
+            with QubitParamShiftTape() as tape:
+                qml.RX(0.432, wires=0)
+                qml.RY(0.543, wires=0)
+                qml.expval(qml.PauliZ(0))
+
+        >>> dev = qml.device("default.qubit", wires=1)
+        >>> res, jac = tape.execute_and_jacobian(dev)
+        >>> res
+        array([0.77750694])
+        >>> jac
+        array([[-0.35846484, -0.46923704]])
+        """
+        if params is None:
+            params = self.get_parameters()
+
+        if not all(len(o.diagonalizing_gates()) == 0 for o in self._obs_sharing_wires):
+            # non-diagonal observables sharing wires are validated by execute_device
+            res = self.execute_device(params, device)
+            return res, self.jacobian(device, params=params, **options)
+
+        # the unshifted tapes generated during differentiation refer to the tape itself
+        saved_parameters = self.get_parameters()
+        self.set_parameters(params)
+
+        self._include_forward = True
+        self._forward_result = None
+
+        try:
+            jac = self.jacobian(device, params=params, **options)
+        finally:
+            self._include_forward = False
+            self.set_parameters(saved_parameters)
+
+        res = self._forward_result
+        self._forward_result = None
+
+        if res is None:
+            # the Jacobian was determined without executing any tapes
+            res = self.execute_device(params, device)
+
+        return res, jac
+
+    def _cached_execute_and_jacobian(self, device, params=None, **options):
+        """Evaluate the tape and compute its Jacobian in a single batch, memoising the
+        Jacobian as in :meth:`~._cached_jacobian`.
+
+        If the tape output cannot be differentiated (for example, if the tape
+        contains sampling or returns the state), the tape is simply evaluated.
+
+        Takes the same arguments as :meth:`~.jacobian`.
+
+        Returns:
+            tuple[array[float], array[float] or None]: the tape output, and its
+            Jacobian, or ``None`` if the Jacobian cannot be computed
+        """
+        if params is None:
+            params = self.get_parameters()
+
+        if self.is_sampled or any(m.return_type is State for m in self.measurements):
+            return self.execute_device(params, device), None
+
+        key = self._jacobian_cache_key(device, params, options)
+
+        jac = self._lookup_jacobian(key, device)
+
+        if jac is not None:
+            return self.execute_device(params, device), jac
+
+        res, jac = self.execute_and_jacobian(device, params=params, **options)
+        self._store_jacobian(key, device, jac)
+        return res, jac
+
+    def _lookup_jacobian(self, key, device):
+        """Look up a memoised Jacobian, marking it as the most recently used.
+
+        Args:
+            key (tuple or None): key returned by :meth:`~._jacobian_cache_key`
+            device (.Device): the device the Jacobian is computed on
+
+        Returns:
+            array[float] or None: the memoised Jacobian, or ``None`` if it is not stored
+        """
+        if key is None or key not in self._jacobian_cache:
+            return None
+
+        cached_device, jac = self._jacobian_cache[key]
+
+        if cached_device is not device:
+            # the key identifies the device by its id, which may be reused
+            # by a new device once the original device is garbage collected
+            return None
+
+        self._jacobian_cache.move_to_end(key)
+        return jac
+
+    def _store_jacobian(self, key, device, jac):
+        """Store a computed Jacobian in the memoisation cache, evicting the
+        least recently used Jacobian if the cache is full.
+
+        Args:
+            key (tuple or None): key returned by :meth:`~._jacobian_cache_key`;
+                if ``None``, the Jacobian is not stored
+            device (.Device): the device the Jacobian was computed on
+            jac (array[float]): the Jacobian
+        """
+        if key is None:
+            return
+
+        self._jacobian_cache[key] = (device, jac)
+
+        if len(self._jacobian_cache) > _JACOBIAN_CACHE_SIZE:
+            self._jacobian_cache.popitem(last=False)
+
+    def _jacobian_cache_key(self, device, params, options):
+        """Returns the key used to memoise the Jacobian of the tape.
+
+        The key identifies the device, the recorded circuit (including all parameter
+        values currently set on the tape), the parameter values and trainable parameters
+        with respect to which the Jacobian is computed, and the differentiation options.
+
+        Args:
+            device (.Device): a PennyLane device
+            params (list[Any]): the trainable tape parameter values
+            options (dict): keyword arguments passed to :meth:`~.jacobian`
+
+        Returns:
+            tuple or None: the hashable key, or ``None`` if the Jacobian should not be memoised
+        """
+        if not getattr(device, "analytic", True):
+            # Jacobians estimated from finite samples are not reused across evaluations
+            return None
+
+        tape_key = _tape_hash(self)
+        params_key = _values_key(params)
+
+        if tape_key is None or params_key is None:
+            return None
+
+        options_key = tuple(sorted((k, v) for k, v in options.items() if k != "eager_jacobian"))
+
+        try:
+            hash(options_key)
+        except TypeError:
+            return None
+
+        return (
+            id(device),
+            device.shots,
+            tape_key,
+            params_key,
+            tuple(sorted(self.trainable_params)),
+            options_key,
+        )
+
+    def _cached_jacobian(self, device, params=None, **options):
+        """Compute the Jacobian of the tape, memoising the result.
+
+        If the Jacobian has previously been computed on the same device, for the same
+        circuit, parameter values and differentiation options, the stored result is returned
+        without executing any tapes. The most recently used Jacobians are retained, up to a
+        maximum of ``_JACOBIAN_CACHE_SIZE`` per tape.
+
+        Takes the same arguments as :meth:`~.jacobian`.
+
+        Returns:
+            array[float]: 2-dimensional array of shape ``(tape.output_dim, tape.num_params)``
+        """
+        if params is None:
+            params = self.get_parameters()
+
+        key = self._jacobian_cache_key(device, params, options)
 
-            if jac is None:
-                # update the tape's output dimension
-                self._output_dim = len(g)
-                # create the Jacobian matrix
-                jac = np.zeros((len(g), len(params)), dtype=float)
+        jac = self._lookup_jacobian(key, device)
 
-            jac[:, i] = g
+        if jac is not None:
+            return jac
 
+        jac = self.jacobian(device, params=params, **options)
+        self._store_jacobian(key, device, jac)
         return jac
 
     def hessian(self, device, params=None, **options):
@@ -597,6 +1062,9 @@ class JacobianTape(QuantumTape):
         This can be modified by setting the :attr:`~.trainable_params` attribute of the tape.
 
         The Hessian can be currently computed using only the ``'analytic'`` method.
+        Since the Hessian is symmetric, only the upper triangular elements are computed,
+        and the circuits required for all elements are deduplicated and submitted to the
+        device as a single batch.
 
         Args:
             device (.Device, .QubitDevice): a PennyLane device
@@ -713,8 +1181,9 @@ class JacobianTape(QuantumTape):
             # to extract the correct result for this parameter later, remember the number of tapes
             reshape_info.append(len(tapes))
 
-        # execute all tapes at once
-        results = device.batch_execute(all_tapes)
+        # execute all tapes at once; the unshifted tape generated for each diagonal
+        # element, as well as any other coinciding shifts, is only evaluated once
+        results = _batch_execute_unique(device, all_tapes)
 
         hessian = None
         start = 0
@@ -113,7 +113,7 @@ class QubitParamShiftTape(JacobianTape):
 
         return super()._grad_method(idx, use_graph=use_graph, default_method=default_method)
 
-    def jacobian(self, device, params=None, **options):
+    def jacobian_tapes(self, device, params=None, include_forward=False, **options):
         # The parameter_shift_var method needs to evaluate the circuit
         # at the unshifted parameter values; the result is stored in the
         # self._evA_result attribute. As a result, we want the tape that computes
@@ -121,7 +121,7 @@ class QubitParamShiftTape(JacobianTape):
         # via the self._append_evA_tape attribute.
         self._append_evA_tape = True
         self._evA_result = None
-        return super().jacobian(device, params, **options)
+        return super().jacobian_tapes(device, params, include_forward, **options)
 
     def parameter_shift(self, idx, params, **options):
         """Generate the tapes and postprocessing methods required to compute the gradient of a
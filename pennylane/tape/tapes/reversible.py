@@ -239,14 +239,14 @@ class ReversibleTape(JacobianTape):
 
         return tapes, processing_fn
 
-    def jacobian(self, device, params=None, **options):
+    def jacobian_tapes(self, device, params=None, include_forward=False, **options):
         # The reversible_diff method needs to evaluate the circuit
         # at the unshifted parameter values; the pre-rotated statevector is then stored
         # in the self._state attribute. Here, we set the value of the attribute to None
 
         # before each Jacobian call, so that the statevector is calculated only once.
         self._final_state = None
-        return super().jacobian(device, params, **options)
+        return super().jacobian_tapes(device, params, include_forward, **options)
 
     def analytic_pd(self, idx, params, **options):
         device = options["device"]
@@ -17,7 +17,7 @@ This module contains the base quantum tape.
 # pylint: disable=too-many-instance-attributes,protected-access,too-many-branches,too-many-public-methods
 import contextlib
 import copy
-from collections import Counter
+from collections import Counter, OrderedDict
 from threading import RLock
 
 import numpy as np
@@ -99,62 +99,260 @@ def expand_tape(tape, depth=1, stop_at=None, expand_measurements=False):
         stop_at = lambda obj: False
 
     new_tape = tape.__class__()
+    _diagonalize_obs_sharing_wires(tape)
+
+    # The tape is expanded iteratively using a stack of (queue, object, depth) tuples,
+    # in reverse order, such that objects are popped in order of appearance.
+    stack = _queue_contents(tape, depth)
+
+    while stack:
+        queue, obj, obj_depth = stack.pop()
+
+        if obj_depth == 0:
+            # maximum expansion depth reached; append the object to the
+            # new tape without further expansion
+            getattr(new_tape, queue).append(obj)
+            continue
+
+        stop = stop_at(obj)
+
+        if not expand_measurements:
+            # Measurements should not be expanded; treat measurements
+            # as a stopping condition
+            stop = stop or isinstance(obj, qml.tape.measure.MeasurementProcess)
+
+        if stop:
+            # do not expand out the object; append it to the
+            # new tape, and continue to the next object in the queue
+            getattr(new_tape, queue).append(obj)
+            continue
+
+        if isinstance(obj, (qml.operation.Operation, qml.tape.measure.MeasurementProcess)):
+            # Object is an operation; query it for its expansion
+            try:
+                obj = _expand_object(obj)
+            except NotImplementedError:
+                # Object does not define an expansion; treat this as
+                # a stopping condition.
+                getattr(new_tape, queue).append(obj)
+                continue
 
-    # Check for observables acting on the same wire. If present, observables must be
-    # qubit-wise commuting Pauli words. In this case, the tape is expanded with joint
-    # rotations and the observables updated to the computational basis. Note that this
-    # expansion acts on the original tape in place.
-    if tape._obs_sharing_wires:
-        try:
-            rotations, diag_obs = diagonalize_qwc_pauli_words(tape._obs_sharing_wires)
-        except ValueError as e:
-            raise qml.QuantumFunctionError(
-                "Only observables that are qubit-wise commuting "
-                "Pauli words can be returned on the same wire"
-            ) from e
+        if obj_depth > 1:
+            _diagonalize_obs_sharing_wires(obj)
+
+        # add the contents of the newly created tape to the stack
+        stack.extend(_queue_contents(obj, obj_depth - 1))
+
+    # Update circuit info
+    new_tape._update_circuit_info()
+    return new_tape
+
+
+def _queue_contents(tape, depth):
+    """Returns the queued objects of a tape as (queue, object, depth) tuples,
+    in reverse order of appearance."""
+    return [
+        (queue, obj, depth)
+        for queue in ("_measurements", "_ops", "_prep")
+        for obj in reversed(getattr(tape, queue))
+    ]
+
+
+def _diagonalize_obs_sharing_wires(tape):
+    """Check for observables acting on the same wire. If present, observables must be
+    qubit-wise commuting Pauli words. In this case, the tape is expanded with joint
+    rotations and the observables updated to the computational basis. Note that this
+    expansion acts on the tape in place."""
+    if not tape._obs_sharing_wires:
+        return
+
+    try:
+        rotations, diag_obs = diagonalize_qwc_pauli_words(tape._obs_sharing_wires)
+    except ValueError as e:
+        raise qml.QuantumFunctionError(
+            "Only observables that are qubit-wise commuting "
+            "Pauli words can be returned on the same wire"
+        ) from e
+
+    tape._ops.extend(rotations)
+
+    for o, i in zip(diag_obs, tape._obs_sharing_wires_id):
+        new_m = qml.tape.measure.MeasurementProcess(tape.measurements[i].return_type, obs=o)
+        tape._measurements[i] = new_m
+
+
+_DECOMPOSITION_CACHE = OrderedDict()
+"""OrderedDict[tuple, list[tuple] or None]: Least-recently-used cache of operation
+decomposition recipes. Keys contain
+the operation class, decomposition method, number of wires, inversion status and parameter
+shapes of an operation, and values are the decomposition recipes returned by
+:func:`~._decomposition_recipe`, or ``None`` if the decomposition cannot be cached."""
+
+_DECOMPOSITION_CACHE_SIZE = 1000
+"""int: maximum number of decomposition recipes stored in the cache."""
+
+
+def _expand_object(obj):
+    """Expand an operation or measurement process into a quantum tape.
+
+    Operation decompositions that do not perform any processing of the operation
+    parameters are cached as parametrized recipes, keyed by the operation type, number of wires,
+    inversion status and parameter shapes. Subsequent expansions of operations matching a
+    cached recipe substitute the operation parameters and wires into the recipe, rather
+    than re-executing the decomposition.
+
+    Args:
+        obj (.Operation, .MeasurementProcess): the object to expand
+
+    Returns:
+        .QuantumTape: a quantum tape containing the expansion
+
+    Raises:
+        NotImplementedError: if the object does not define an expansion
+    """
+    if not isinstance(obj, qml.operation.Operation):
+        return obj.expand()
+
+    cls = obj.__class__
+    key = (
+        cls,
+        cls.decomposition,
+        cls.expand,
+        len(obj.wires),
+        obj.inverse,
+        tuple(tuple(np.shape(p)) for p in obj.data),
+    )
+
+    recipe = _DECOMPOSITION_CACHE.get(key, False)
+
+    if recipe is not False:
+        _DECOMPOSITION_CACHE.move_to_end(key)
+
+    if recipe:
+        params = obj.data
+        wires = obj.wires.labels
+
+        tape = QuantumTape()
+
+        for queue, op, p_idx, w_idx in recipe:
+            new_op = copy.copy(op)
+
+            if p_idx is not None:
+                new_op.data = [params[i] for i in p_idx]
 
-        tape._ops.extend(rotations)
+            new_op._wires = qml.wires.Wires([wires[i] for i in w_idx])
+            getattr(tape, queue).append(new_op)
 
-        for o, i in zip(diag_obs, tape._obs_sharing_wires_id):
-            new_m = qml.tape.measure.MeasurementProcess(tape.measurements[i].return_type, obs=o)
-            tape._measurements[i] = new_m
+        return tape
+
+    tape = obj.expand()
+
+    if recipe is False:
+        ids = Counter(id(p) for p in obj.data)
+
+        if all(count == 1 for count in ids.values()):
+            # parameter identity can only be used to determine the recipe if
+            # the operation parameters are distinct objects
+            _DECOMPOSITION_CACHE[key] = _decomposition_recipe(obj, tape)
+
+            if len(_DECOMPOSITION_CACHE) > _DECOMPOSITION_CACHE_SIZE:
+                _DECOMPOSITION_CACHE.popitem(last=False)
+
+    return tape
 
-    for queue in ("_prep", "_ops", "_measurements"):
+
+def _decomposition_recipe(op, tape):
+    """Determine a parametrized recipe for the decomposition of an operation.
+
+    The recipe is determined by object identity; every parameter of the decomposed
+    operations must be a parameter of the original operation, every parameter of the
+    original operation must appear in the decomposition, and the decomposed operations
+    may only act on the wires of the original operation.
+
+    Args:
+        op (.Operation): the decomposed operation
+        tape (.QuantumTape): the decomposition of the operation
+
+    Returns:
+        list[tuple] or None: a list of tuples ``(queue, op, param_indices, wire_indices)``
+        containing the queue the decomposed operation is appended to, a copy of the decomposed
+        operation, and the indices of its parameters and wires with respect to the original
+        operation.
+        If the original operation has no parameters, ``param_indices`` is ``None``, and the
+        parameters of the decomposed operation are treated as constants.
+        ``None`` is returned if the decomposition cannot be represented as a recipe.
+    """
+    if tape._measurements:
+        return None
+
+    param_indices = {id(p): i for i, p in enumerate(op.data)}
+    wire_indices = {w: i for i, w in enumerate(op.wires.labels)}
+
+    recipe = []
+    used_params = set()
+
+    for queue in ("_prep", "_ops"):
         for obj in getattr(tape, queue):
+            if isinstance(obj, QuantumTape) or not isinstance(obj, qml.operation.Operation):
+                return None
 
-            stop = stop_at(obj)
+            if any(w not in wire_indices for w in obj.wires.labels):
+                return None
 
-            if not expand_measurements:
-                # Measurements should not be expanded; treat measurements
-                # as a stopping condition
-                stop = stop or isinstance(obj, qml.tape.measure.MeasurementProcess)
+            if not op.data:
+                # the operation has no parameters; any parameters
+                # of the decomposed operations are constant
+                p_idx = None
 
-            if stop:
-                # do not expand out the object; append it to the
-                # new tape, and continue to the next object in the queue
-                getattr(new_tape, queue).append(obj)
-                continue
+            elif any(id(p) not in param_indices for p in obj.data):
+                return None
 
-            if isinstance(obj, (qml.operation.Operation, qml.tape.measure.MeasurementProcess)):
-                # Object is an operation; query it for its expansion
-                try:
-                    obj = obj.expand()
-                except NotImplementedError:
-                    # Object does not define an expansion; treat this as
-                    # a stopping condition.
-                    getattr(new_tape, queue).append(obj)
-                    continue
+            else:
+                p_idx = [param_indices[id(p)] for p in obj.data]
+                used_params.update(p_idx)
 
-            # recursively expand out the newly created tape
-            expanded_tape = expand_tape(obj, stop_at=stop_at, depth=depth - 1)
+            w_idx = [wire_indices[w] for w in obj.wires.labels]
 
-            new_tape._prep += expanded_tape._prep
-            new_tape._ops += expanded_tape._ops
-            new_tape._measurements += expanded_tape._measurements
+            # the recipe stores a copy, so that modifications of the returned decomposition
+            # do not affect later expansions; substituted parameters are not kept alive
+            template = copy.copy(obj)
 
-    # Update circuit info
-    new_tape._update_circuit_info()
-    return new_tape
+            if p_idx is not None:
+                template.data = [None] * len(p_idx)
+
+            recipe.append((queue, template, p_idx, w_idx))
+
+    if len(used_params) != len(op.data):
+        # the decomposition depends on the parameter values
+        return None
+
+    return recipe
+
+
+def _structure(obj):
+    """Returns a hashable representation of the structure of a queued object.
+
+    The representation includes the object type, the wires acted on, and the
+    shapes of any parameters, but not the parameter values themselves.
+
+    Args:
+        obj (.Operator, .MeasurementProcess, .QuantumTape): queued object
+
+    Returns:
+        tuple: hashable structure representation
+    """
+    if isinstance(obj, QuantumTape):
+        return ("QuantumTape",) + obj.get_structure()
+
+    if isinstance(obj, qml.tape.measure.MeasurementProcess):
+        eigvals = None if obj._eigvals is None else tuple(obj._eigvals)
+        obs = None if obj.obs is None else _structure(obj.obs)
+        return (obj.return_type, obs, obj.wires.labels, eigvals)
+
+    if isinstance(obj, qml.operation.Tensor):
+        return ("Tensor",) + tuple(_structure(o) for o in obj.obs)
+
+    return (obj.name, obj.wires.labels, tuple(tuple(np.shape(p)) for p in obj.data))
 
 
 # pylint: disable=too-many-public-methods
@@ -267,6 +465,11 @@ class QuantumTape(AnnotatedQueue):
         i.e., that do not have their own unique set of wires."""
         self._obs_sharing_wires_id = []
 
+        self._prefetched = None
+        """tuple[.Device, Any] or None: a device and the result of executing the tape on it,
+        evaluated ahead of time; consumed by the next call to :meth:`~.execute_device` on
+        that device"""
+
     def __repr__(self):
         return f"<{self.__class__.__name__}: wires={self.wires.tolist()}, params={self.num_params}>"
 
@@ -929,6 +1132,39 @@ class QuantumTape(AnnotatedQueue):
 
         return self._depth
 
+    def get_structure(self):
+        """Hashable representation of the structure of the quantum circuit.
+
+        Two tapes with the same structure contain the same state preparations,
+        operations, and measurements, acting on the same wires, with parameters
+        of the same shapes. The parameter values themselves are not taken into account.
+
+        Returns:
+            tuple: hashable structure representation
+
+        **Example**
+
+        .. code-block:: python3
+
+            with QuantumTape() as tape1:
+                qml.RX(0.1, wires=0)
+                qml.CNOT(wires=[0, 1])
+                qml.expval(qml.PauliZ(0))
+
+            with QuantumTape() as tape2:
+                qml.RX(0.7, wires=0)
+                qml.CNOT(wires=[0, 1])
+                qml.expval(qml.PauliZ(0))
+
+        >>> tape1.get_structure() == tape2.get_structure()
+        True
+        """
+        return (
+            tuple(_structure(op) for op in self._prep),
+            tuple(_structure(op) for op in self._ops),
+            tuple(_structure(m) for m in self._measurements),
+        )
+
     def draw(self, charset="unicode", wire_order=None, show_all_wires=False):
         """Draw the quantum tape as a circuit diagram.
 
@@ -1084,12 +1320,15 @@ class QuantumTape(AnnotatedQueue):
                 the current tape parameter values are used (via :meth:`~.get_parameters`).
         """
         if not all(len(o.diagonalizing_gates()) == 0 for o in self._obs_sharing_wires):
-            raise qml.QuantumFunctionError(
-                "Multiple observables are being evaluated on the same wire. Call tape.expand() "
-                "prior to execution to support this."
-            )
+            # devices may measure groups of observables on copies of the same prepared state
+            observable_groups = getattr(device, "observable_groups", None)
+            groups = observable_groups(self) if observable_groups is not None else None
 
-        device.reset()
+            if groups is None or len(groups) == 1:
+                raise qml.QuantumFunctionError(
+                    "Multiple observables are being evaluated on the same wire. Call tape.expand() "
+                    "prior to execution to support this."
+                )
 
         # backup the current parameters
         saved_parameters = self.get_parameters()
@@ -1097,9 +1336,18 @@ class QuantumTape(AnnotatedQueue):
         # temporarily mutate the in-place parameters
         self.set_parameters(params)
 
-        if isinstance(device, qml.QubitDevice):
+        if self._prefetched is not None and self._prefetched[0] is device:
+            # the tape has already been executed on the device, for example
+            # as part of a batch submitted by a QNodeCollection
+            res = self._prefetched[1]
+            self._prefetched = None
+
+        elif isinstance(device, qml.QubitDevice):
+            device.reset()
             res = device.execute(self)
+
         else:
+            device.reset()
             res = device.execute(self.operations, self.observables, {})
 
         # Update output dim if incorrect.
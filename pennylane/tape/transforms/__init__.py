@@ -15,4 +15,4 @@
 This subpackage contains tape transforms. These are functions that transform one or more tapes to
 other tapes are also provided.
 """
-from .metric_tensor import metric_tensor
+from .metric_tensor import metric_tensor, metric_tensor_layers
@@ -28,6 +28,61 @@ def _stopping_critera(obj):
     return False
 
 
+def metric_tensor_layers(tape, wrt=None):
+    """Expands a tape into the supported parametrized gates, and returns the
+    parametrized layers required to compute its block diagonal metric tensor.
+
+    Args:
+        tape (.QuantumTape): the tape to compute the metric tensor of
+        wrt (Sequence[int]): Indices of the tape parameters with which to
+            compute the metric tensor. Defaults to the tape's trainable
+            parameters.
+
+    Returns:
+        tuple[.QuantumTape, list[tuple[list[.Operation], list[.Observable], list[float]]]]:
+        the expanded tape, and, for each parametrized layer, a tuple containing the
+        operations preceding the layer, the generators of the layer operations,
+        and the coefficients of the generators
+    """
+    # For parametrized operations, only the RX, RY, RZ, and PhaseShift gates are supported.
+    # Expand out all other gates.
+    tape = tape.expand(depth=2, stop_at=_stopping_critera)
+
+    if wrt is not None:
+        tape.trainable_params = set(wrt)
+
+    layers = []
+
+    for queue, curr_ops, _, _ in tape.graph.iterate_parametrized_layers():
+        obs = []
+        coeffs = []
+
+        # for each operation in the layer, get the generator
+        for op in curr_ops:
+            gen, s = op.generator
+            w = op.wires
+            coeffs.append(s)
+
+            # get the observable corresponding to the generator of the current operation
+            if isinstance(gen, np.ndarray):
+                # generator is a Hermitian matrix
+                obs.append(qml.Hermitian(gen, w))
+
+            elif issubclass(gen, qml.operation.Observable):
+                # generator is an existing PennyLane operation
+                obs.append(gen(w))
+
+            else:
+                raise qml.qnodes.QuantumFunctionError(
+                    "Can't generate metric tensor, generator {}"
+                    "has no corresponding observable".format(gen)
+                )
+
+        layers.append((queue, obs, coeffs))
+
+    return tape, layers
+
+
 def metric_tensor(tape, diag_approx=False, wrt=None):
     """Returns a list of tapes, and a classical processing function, for computing the block
     diagronal metric tensor approximation of an input tape on hardware.
@@ -104,46 +159,15 @@ def metric_tensor(tape, diag_approx=False, wrt=None):
            [0.        , 0.        , 0.00244201, 0.01226071]])
     """
 
-    # For parametrized operations, only the RX, RY, RZ, and PhaseShift gates are supported.
-    # Expand out all other gates.
-    tape = tape.expand(depth=2, stop_at=_stopping_critera)
-
-    if wrt is not None:
-        tape.trainable_params = set(wrt)
-
-    # get the circuit graph
-    graph = tape.graph
+    tape, layers = metric_tensor_layers(tape, wrt=wrt)
 
     metric_tensor_tapes = []
     obs_list = []
     coeffs_list = []
-    params_list = []
-
-    for queue, curr_ops, param_idx, _ in graph.iterate_parametrized_layers():
-        params_list.append(param_idx)
-        coeffs_list.append([])
-        obs_list.append([])
 
-        # for each operation in the layer, get the generator
-        for op in curr_ops:
-            gen, s = op.generator
-            w = op.wires
-            coeffs_list[-1].append(s)
-
-            # get the observable corresponding to the generator of the current operation
-            if isinstance(gen, np.ndarray):
-                # generator is a Hermitian matrix
-                obs_list[-1].append(qml.Hermitian(gen, w))
-
-            elif issubclass(gen, qml.operation.Observable):
-                # generator is an existing PennyLane operation
-                obs_list[-1].append(gen(w))
-
-            else:
-                raise qml.qnodes.QuantumFunctionError(
-                    "Can't generate metric tensor, generator {}"
-                    "has no corresponding observable".format(gen)
-                )
+    for queue, obs, coeffs in layers:
+        obs_list.append(obs)
+        coeffs_list.append(coeffs)
 
         # Create a quantum tape with all operations
         # prior to the parametrized layer, and the rotations
@@ -152,7 +176,7 @@ def metric_tensor(tape, diag_approx=False, wrt=None):
             for op in queue:
                 op.queue()
 
-            for o in obs_list[-1]:
+            for o in obs:
                 o.diagonalizing_gates()
 
             qml.probs(wires=tape.wires)
@@ -135,6 +135,10 @@ class Hamiltonian:
     def simplify(self):
         r"""Simplifies the Hamiltonian by combining like-terms.
 
+        Like-terms are identified via a hashable key representing each observable
+        independently of the order of its tensor factors, such that simplification
+        scales linearly with the number of terms.
+
         **Example**
 
         >>> ops = [qml.PauliY(2), qml.PauliX(0) @ qml.Identity(1), qml.PauliX(0)]
@@ -143,30 +147,21 @@ class Hamiltonian:
         >>> print(H)
         (1.0) [Y2] + (-1.0) [X0]
         """
-
-        coeffs = []
-        ops = []
+        terms = {}
 
         for c, op in zip(self.coeffs, self.ops):
-            op = op if isinstance(op, Tensor) else Tensor(op)
-
-            ind = None
-            for i, other in enumerate(ops):
-                if op.compare(other):
-                    ind = i
-                    break
-
-            if ind is not None:
-                coeffs[ind] += c
-                if np.allclose([coeffs[ind]], [0]):
-                    del coeffs[ind]
-                    del ops[ind]
+            key = frozenset(op._obs_data())  # pylint: disable=protected-access
+
+            if key in terms:
+                terms[key][0] += c
+                if np.allclose([terms[key][0]], [0]):
+                    del terms[key]
             else:
-                ops.append(op.prune())
-                coeffs.append(c)
+                op = op if isinstance(op, Tensor) else Tensor(op)
+                terms[key] = [c, op.prune()]
 
-        self._coeffs = coeffs
-        self._ops = ops
+        self._coeffs = [c for c, _ in terms.values()]
+        self._ops = [op for _, op in terms.values()]
 
     def __str__(self):
         # Lambda function that formats the wires
@@ -389,7 +384,7 @@ class ExpvalCost:
         diff_method (str, None): The method of differentiation to use with the created cost function.
             Supports all differentiation methods supported by the :func:`~.qnode` decorator.
         optimize (bool): Whether to optimize the observables composing the Hamiltonian by
-            separating them into qubit-wise commuting groups. Each group can then be executed
+            separating them into commuting groups. Each group can then be executed
             within a single QNode, resulting in fewer QNodes to evaluate.
 
     Returns:
@@ -435,9 +430,11 @@ class ExpvalCost:
         **Optimizing observables:**
 
         Setting ``optimize=True`` can be used to decrease the number of device executions. The
-        observables composing the Hamiltonian can be separated into groups that are qubit-wise
+        observables composing the Hamiltonian can be separated into groups that are
         commuting using the :mod:`~.grouping` module. These groups can be executed together on a
-        *single* qnode, resulting in a lower device overhead:
+        *single* qnode, resulting in a lower device overhead. The observables of each group are
+        measured after a Clifford circuit that diagonalizes all of them, as found by
+        :func:`~.optimize_measurements`:
 
         .. code-block:: python
 
@@ -462,6 +459,14 @@ class ExpvalCost:
         Number of executions: 2
         >>> print("Number of executions (optimized):", ex_opt)
         Number of executions (optimized): 1
+
+        On devices supporting the ``supports_observable_groups`` capability, such as
+        ``default.qubit``, all observables are instead evaluated within a single execution,
+        without Clifford circuits. The ansatz is applied once, and the device partitions the
+        observables into groups itself, applying the diagonalizing rotations and measurements of
+        each group to a copy of the prepared state. When differentiating using
+        ``diff_method="adjoint"``, the gradients of all groups are then computed in a single
+        backward pass.
     """
 
     def __init__(
@@ -504,21 +509,35 @@ class ExpvalCost:
             if self._multiple_devices:
                 raise ValueError("Using multiple devices is not supported when optimize=True")
 
-            obs_groupings, coeffs_groupings = qml.grouping.group_observables(observables, coeffs)
             d = device[0] if self._multiple_devices else device
             w = d.wires.tolist()
 
             @qml.qnode(device, interface=interface, diff_method=diff_method, **kwargs)
-            def circuit(*qnode_args, obs, **qnode_kwargs):
+            def circuit(*qnode_args, obs, rotation, **qnode_kwargs):
                 """Converting ansatz into a full circuit including measurements"""
                 ansatz(*qnode_args, wires=w, **qnode_kwargs)
+
+                for op in rotation:
+                    op.queue()
+
                 return [qml.expval(o) for o in obs]
 
+            if d.capabilities().get("supports_observable_groups", False):
+                # The device measures each group on a copy of the same prepared state,
+                # so that all groups are evaluated within a single QNode execution
+                rotations, obs_groupings, coeffs_groupings = [[]], [observables], [coeffs]
+            else:
+                (
+                    rotations,
+                    obs_groupings,
+                    coeffs_groupings,
+                ) = qml.grouping.optimize_measurements(observables, coeffs, grouping="commuting")
+
             def cost_fn(*qnode_args, **qnode_kwargs):
                 """Combine results from grouped QNode executions with grouped coefficients"""
                 total = 0
-                for o, c in zip(obs_groupings, coeffs_groupings):
-                    res = circuit(*qnode_args, obs=o, **qnode_kwargs)
+                for u, o, c in zip(rotations, obs_groupings, coeffs_groupings):
+                    res = circuit(*qnode_args, obs=o, rotation=u, **qnode_kwargs)
                     total += sum([r * c_ for r, c_ in zip(res, c)])
                 return total
 
@@ -17,6 +17,7 @@ Unit tests for the :mod:`pennylane.circuit_graph` module.
 # pylint: disable=no-self-use,too-many-arguments,protected-access
 
 import pytest
+import networkx as nx
 import numpy as np
 
 import pennylane as qml
@@ -130,6 +131,37 @@ class TestCircuitGraph:
         descendants = circuit.descendants([all_ops[6]])
         assert descendants == set([all_ops[8]])
 
+    def test_reachability(self, ops, obs):
+        """Test that the reachability index agrees with the paths in the graph"""
+        circuit = CircuitGraph(ops, obs, Wires([0, 1, 2]))
+        all_ops = ops + obs
+
+        for op in all_ops:
+            expected = [ob for ob in obs if nx.has_path(circuit.graph, op, ob)]
+            assert circuit.observables_reachable(op) == expected
+
+        # the final PauliX on wire 1 only reaches the Hermitian observable
+        assert circuit.reachability[all_ops[6]] == 0b10
+        # the observables only reach themselves
+        assert circuit.reachability[all_ops[7]] == 0b01
+        assert circuit.reachability[all_ops[8]] == 0b10
+
+    def test_reachability_cached(self, ops, obs, mocker):
+        """Test that the reachability index is only computed once, and is
+        recomputed after a node is updated"""
+        circuit = CircuitGraph(ops, obs, Wires([0, 1, 2]))
+        spy = mocker.spy(nx, "topological_sort")
+
+        for op in ops:
+            circuit.observables_reachable(op)
+
+        assert spy.call_count == 1
+
+        new = qml.RX(0.1, wires=0)
+        circuit.update_node(ops[0], new)
+        assert circuit.observables_reachable(new) == obs
+        assert spy.call_count == 2
+
     def test_update_node(self, ops, obs):
         """Changing nodes in the graph."""
 
@@ -252,13 +252,12 @@ class TestEvalation:
         expected = onp.vstack([qnode1(params), qnode2(params)])
         assert np.all(res == expected)
 
-    @pytest.mark.xfail(raises=AttributeError, reason="Dask breaks the TF gradient tape")
     @pytest.mark.parametrize("interface", ["tf"])
     def test_grad_tf(self, qnodes, skip_if_no_tf_support, parallel, interface):
         """Test correct gradient of the QNodeCollection using
         the tf interface"""
-        if parallel and qml.tape_mode_active():
-            pytest.skip("There appears to be a race condition when constructing TF tapes in parallel")
+        if parallel and not qml.tape_mode_active():
+            pytest.xfail("Parallel execution in non-tape mode breaks the TF gradient tape")
 
         qnode1, qnode2 = qnodes
 
@@ -269,13 +268,7 @@ class TestEvalation:
         with tf.GradientTape() as tape:
             tape.watch(params)
 
-            if parallel:
-                with pytest.warns(UserWarning):
-                    cost = sum(qc(params, parallel=parallel))
-            else:
-                cost = sum(qc(params, parallel=parallel))
-
-            # the gradient will be None
+            cost = sum(qc(params, parallel=parallel))
             res = tape.gradient(cost, params).numpy()
 
         # calculate the gradient of the QNodes individually using tf
@@ -287,3 +280,106 @@ class TestEvalation:
             expected = tape.gradient(cost, params).numpy()
 
         assert np.all(res == expected)
+
+
+class TestBatchedEvaluation:
+    """Tests for the batched and asynchronous evaluation of QNodeCollections
+    in tape mode"""
+
+    @pytest.fixture(autouse=True)
+    def tape_mode_only(self, tape_mode):
+        """Skip the tests if tape mode is not active"""
+        if not qml.tape_mode_active():
+            pytest.skip("Batched evaluation is only available in tape mode")
+
+    @staticmethod
+    def make_qnodes(dev, num_qnodes, diff_method="parameter-shift"):
+        """Create QNodes on a shared device"""
+
+        def circuit(x, i):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1] * (i + 1), wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        return [
+            qml.QNode(lambda x, i=i: circuit(x, i), dev, diff_method=diff_method)
+            for i in range(num_qnodes)
+        ]
+
+    def test_shared_device_single_batch(self, mocker, tol):
+        """Test that the circuits of QNodes sharing a device are
+        submitted in a single batch"""
+        dev = qml.device("default.qubit", wires=2)
+        qnodes = self.make_qnodes(dev, 3)
+        qc = qml.QNodeCollection(qnodes)
+        params = np.array([0.5643, -0.45])
+
+        expected = np.vstack([q(params) for q in qnodes])
+
+        spy = mocker.spy(dev, "batch_execute")
+        spy_execute = mocker.spy(dev, "execute")
+        res = qc(params)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        spy.assert_called_once()
+        assert len(spy.call_args[0][0]) == 3
+        assert spy_execute.call_count == 3
+        assert all(q.qtape._prefetched is None for q in qnodes)
+
+    def test_shared_device_gradient(self, mocker, tol):
+        """Test that the gradient of QNodes sharing a device is correct"""
+        dev = qml.device("default.qubit", wires=2)
+        qnodes = self.make_qnodes(dev, 2)
+        qc = qml.QNodeCollection(qnodes)
+        params = np.array([0.5643, -0.45])
+
+        res = qml.jacobian(qc)(params)
+        expected = np.stack([qml.jacobian(q)(params) for q in qnodes])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("scheduler", ["threads", "processes"])
+    def test_schedulers(self, scheduler, tol):
+        """Test that the QNodeCollection can be evaluated asynchronously
+        using both threads and processes"""
+        dev1 = qml.device("default.qubit", wires=2)
+        dev2 = qml.device("default.qubit", wires=2)
+        qnodes = self.make_qnodes(dev1, 2) + self.make_qnodes(dev2, 2)
+        qc = qml.QNodeCollection(qnodes)
+        params = np.array([0.5643, -0.45])
+
+        res = qc(params, parallel=True, scheduler=scheduler, max_workers=2)
+        expected = qc(params)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_max_workers(self, mocker):
+        """Test that the number of workers is passed to the executor"""
+        spy = mocker.spy(qml.collections.qnode_collection.ThreadPoolExecutor, "__init__")
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.QNodeCollection(self.make_qnodes(dev, 2))
+        qc(np.array([0.5643, -0.45]), parallel=True, max_workers=3)
+
+        assert spy.call_args[1]["max_workers"] == 3
+
+    def test_unknown_scheduler(self):
+        """Test that an exception is raised if the scheduler is unknown"""
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.QNodeCollection(self.make_qnodes(dev, 2))
+
+        with pytest.raises(ValueError, match="Unknown scheduler 'dask'"):
+            qc(np.array([0.5643, -0.45]), parallel=True, scheduler="dask")
+
+    def test_backprop_not_batched(self, mocker, tol):
+        """Test that QNodes differentiated via backpropagation
+        execute their own tapes"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+        qnodes = self.make_qnodes(dev, 2, diff_method="backprop")
+        qc = qml.QNodeCollection(qnodes)
+        params = np.array([0.5643, -0.45], requires_grad=True)
+
+        spy = mocker.spy(dev, "batch_execute")
+        res = qml.jacobian(qc)(params)
+        expected = np.stack([qml.jacobian(q)(params) for q in qnodes])
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        spy.assert_not_called()
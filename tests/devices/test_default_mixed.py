@@ -450,6 +450,116 @@ class TestApplyDiagonal:
         assert np.allclose(dev._state, target_state, atol=tol, rtol=0)
 
 
+class TestApplySuperoperator:
+    """Unit tests for the methods `_get_superoperator()` and `_apply_superoperator()`"""
+
+    channels = [
+        AmplitudeDamping(0.3, wires=0),
+        qml.GeneralizedAmplitudeDamping(0.2, 0.4, wires=1),
+        qml.PhaseDamping(0.7, wires=0),
+        DepolarizingChannel(0.5, wires=1),
+        qml.QubitChannel(
+            [np.sqrt(0.9) * np.eye(2), np.sqrt(0.1) * np.array([[0, 1], [1, 0]])], wires=1
+        ),
+    ]
+
+    @pytest.mark.parametrize("op", channels)
+    def test_superoperator_root(self, op, tol):
+        """Tests that applying the superoperator of a channel is equivalent to applying
+        its Kraus operators"""
+        root = np.reshape(root_state(2), [2] * 4)
+
+        dev = qml.device("default.mixed", wires=2)
+        dev._state = root
+        dev._apply_channel(dev._get_kraus(op), op.wires)
+        expected = dev._state
+
+        dev._state = root
+        dev._apply_superoperator(dev._get_superoperator(op), op.wires)
+
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    def test_two_wire_superoperator(self, tol):
+        """Tests that the superoperator of a two-wire channel is applied to the correct wires"""
+        K = DepolarizingChannel(0.5, wires=0).kraus_matrices
+        op = qml.QubitChannel([np.kron(a, b) for a in K for b in K], wires=[2, 0])
+        state = np.reshape(root_state(3), [2] * 6)
+
+        dev = qml.device("default.mixed", wires=3)
+        dev._state = state
+        dev._apply_channel(dev._get_kraus(op), op.wires)
+        expected = dev._state
+
+        dev._state = state
+        dev._apply_superoperator(dev._get_superoperator(op), op.wires)
+
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    def test_superoperator_cached(self):
+        """Tests that the superoperator of a channel is cached for each parameter value"""
+        dev = qml.device("default.mixed", wires=1)
+
+        S1 = dev._get_superoperator(AmplitudeDamping(0.3, wires=0))
+        S2 = dev._get_superoperator(AmplitudeDamping(0.3, wires=0))
+        S3 = dev._get_superoperator(AmplitudeDamping(0.4, wires=0))
+
+        assert S1 is S2
+        assert S1 is not S3
+
+    def test_channel_apply_op(self, mocker):
+        """Tests that channels are applied using their superoperator"""
+        spy_channel = mocker.spy(DefaultMixed, "_apply_channel")
+        spy_superop = mocker.spy(DefaultMixed, "_apply_superoperator")
+        dev = qml.device("default.mixed", wires=1)
+        dev._apply_operation(AmplitudeDamping(0.5, wires=0))
+
+        spy_channel.assert_not_called()
+        spy_superop.assert_called_once()
+
+
+class TestApplyPauliChannel:
+    """Unit tests for the method `_apply_pauli_channel()`"""
+
+    @pytest.mark.parametrize("wire", [0, 1, 2])
+    @pytest.mark.parametrize("op", [qml.BitFlip, qml.PhaseFlip, DepolarizingChannel])
+    def test_pauli_channel_root(self, op, wire, tol):
+        """Tests that Pauli channels are applied equivalently to their Kraus operators"""
+        op = op(0.3, wires=wire)
+        root = np.reshape(root_state(3), [2] * 6)
+
+        dev = qml.device("default.mixed", wires=3)
+        dev._state = root
+        dev._apply_channel(dev._get_kraus(op), op.wires)
+        expected = dev._state
+
+        dev._state = root
+        dev._apply_operation(op)
+
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    def test_pauli_y(self, tol):
+        """Tests that a channel applying PauliY is applied correctly"""
+        dev = qml.device("default.mixed", wires=1)
+        root = np.reshape(root_state(1), [2, 2])
+        dev._state = root
+        dev._apply_pauli_channel((0, 0, 1, 0), Wires(0))
+
+        Y = np.array([[0, -1j], [1j, 0]])
+        assert np.allclose(dev._state, Y @ root @ Y, atol=tol, rtol=0)
+
+    def test_pauli_channel_apply_op(self, mocker):
+        """Tests that when applying a Pauli channel, only `_apply_pauli_channel` is called"""
+        spy_channel = mocker.spy(DefaultMixed, "_apply_channel")
+        spy_superop = mocker.spy(DefaultMixed, "_apply_superoperator")
+        spy_pauli = mocker.spy(DefaultMixed, "_apply_pauli_channel")
+        dev = qml.device("default.mixed", wires=1)
+        dev._apply_operation(DepolarizingChannel(0.5, wires=0))
+
+        spy_channel.assert_not_called()
+        spy_superop.assert_not_called()
+        spy_pauli.assert_called_once()
+
+
 class TestApplyBasisState:
     """Unit tests for the method `_apply_basis_state"""
 
@@ -681,6 +681,7 @@ class TestDefaultQubitIntegration:
             "supports_tensor_observables": True,
             "returns_probs": True,
             "returns_state": True,
+            "supports_observable_groups": True,
             "supports_reversible_diff": True,
             "supports_inverse_operations": True,
             "supports_analytic_computation": True,
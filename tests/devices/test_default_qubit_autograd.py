@@ -36,6 +36,7 @@ class TestQNodeIntegration:
             "supports_tensor_observables": True,
             "returns_probs": True,
             "returns_state": True,
+            "supports_observable_groups": True,
             "supports_reversible_diff": False,
             "supports_inverse_operations": True,
             "supports_analytic_computation": True,
@@ -420,3 +421,88 @@ class TestOps:
 
         assert np.all(res == state)
         spy.assert_called()
+
+
+class TestCheckpointing:
+    """Tests for gate-level checkpointing of the backward pass"""
+
+    @staticmethod
+    def circuit(dev):
+        """Returns a QNode with parametrized and non-parametrized operations"""
+
+        @qml.qnode(dev, diff_method="backprop", interface="autograd")
+        def circuit(x, y):
+            qml.Hadamard(wires=0)
+            qml.RX(x[0], wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.Rot(x[1], y, 0.4, wires=1)
+            qml.CRX(x[2], wires=[1, 2])
+            qml.RY(0.3, wires=2).inv()
+            qml.PauliY(wires=2)
+            return qml.expval(qml.PauliZ(2) @ qml.PauliX(0))
+
+        return circuit
+
+    @pytest.mark.parametrize("checkpoint_every", [1, 2, 3, 100])
+    def test_gradient(self, checkpoint_every, tol):
+        """Test that checkpointing does not change the result or gradient"""
+        x = np.array([0.1, 0.2, 0.3], requires_grad=True)
+        y = np.array(0.5, requires_grad=True)
+
+        circuit = self.circuit(qml.device("default.qubit.autograd", wires=3))
+        expected = circuit(x, y)
+        expected_grad = qml.grad(circuit)(x, y)
+
+        dev = qml.device("default.qubit.autograd", wires=3, checkpoint_every=checkpoint_every)
+        circuit = self.circuit(dev)
+
+        assert np.allclose(circuit(x, y), expected, atol=tol, rtol=0)
+
+        grad = qml.grad(circuit)(x, y)
+        assert np.allclose(grad[0], expected_grad[0], atol=tol, rtol=0)
+        assert np.allclose(grad[1], expected_grad[1], atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("checkpoint_every,num_segments", [(None, 0), (1, 6), (3, 3), (7, 2)])
+    def test_segments(self, checkpoint_every, num_segments, mocker):
+        """Test that the operations are applied in segments of the requested size. The
+        inverted ``RY`` gate has no Autograd implementation, and is applied between segments."""
+        dev = qml.device("default.qubit.autograd", wires=3, checkpoint_every=checkpoint_every)
+        spy = mocker.spy(dev, "_apply_segment")
+
+        self.circuit(dev)(np.array([0.1, 0.2, 0.3]), 0.5)
+        assert len([c for c in spy.call_args_list if c[0][1]]) == num_segments
+
+    def test_non_parametric_ops_split_segments(self, mocker):
+        """Test that operations with parameters but without an Autograd implementation
+        are applied outside of the checkpointed segments"""
+        dev = qml.device("default.qubit.autograd", wires=2, checkpoint_every=10)
+        spy = mocker.spy(dev, "_apply_segment")
+
+        @qml.qnode(dev, diff_method="backprop", interface="autograd")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.QubitUnitary(np.array([[0, 1], [1, 0]]), wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        x = np.array(0.3, requires_grad=True)
+        assert np.allclose(circuit(x), -np.cos(x))
+        assert np.allclose(qml.grad(circuit)(x), np.sin(x))
+
+        segments = [[op.name for op in c[0][1]] for c in spy.call_args_list if c[0][1]]
+        assert segments == [["RX"], ["CNOT"]] * 2
+
+    def test_recomputation(self, mocker):
+        """Test that the operations of a segment are applied again during the backward pass"""
+        dev = qml.device("default.qubit.autograd", wires=3, checkpoint_every=3)
+        circuit = self.circuit(dev)
+        x = np.array([0.1, 0.2, 0.3], requires_grad=True)
+        y = np.array(0.5, requires_grad=True)
+
+        spy = mocker.spy(dev, "_apply_operation")
+        circuit(x, y)
+        num_forward = spy.call_count
+
+        spy.reset_mock()
+        qml.grad(circuit)(x, y)
+        assert spy.call_count > num_forward
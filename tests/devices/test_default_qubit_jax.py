@@ -24,6 +24,7 @@ class TestQNodeIntegration:
             "supports_tensor_observables": True,
             "returns_probs": True,
             "returns_state": True,
+            "supports_observable_groups": True,
             "supports_reversible_diff": False,
             "supports_inverse_operations": True,
             "supports_analytic_computation": True,
@@ -500,3 +501,258 @@ class TestOps:
 
         assert jnp.all(res == state)
         spy.assert_called()
+
+
+class TestCompilation:
+    """Tests for the automatic compilation of circuit structures"""
+
+    @pytest.fixture(autouse=True)
+    def tape_mode_only(self, tape_mode):
+        """Skip the tests if tape mode is not active"""
+        if not qml.tape_mode_active():
+            pytest.skip("Compilation is only supported in tape mode.")
+
+    def test_structure_compiled_once(self, mocker, tol):
+        """Test that a circuit structure is compiled once, and reused for new parameter values"""
+        dev = qml.device("default.qubit.jax", wires=2)
+
+        @qml.qnode(dev, interface="jax", diff_method="backprop")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        spy = mocker.spy(jax, "jit")
+
+        for x in [jnp.array([0.1, 0.2]), jnp.array([0.5, -0.3])]:
+            res = circuit(x)
+            assert jnp.isclose(res, jnp.cos(x[0]) * jnp.cos(x[1]), atol=tol, rtol=0)
+
+        assert spy.call_count == 1
+        assert len(dev._compile_cache) == 1
+        assert dev.num_executions == 2
+
+    def test_gradient(self, tol):
+        """Test that compiled circuits can be differentiated"""
+        dev = qml.device("default.qubit.jax", wires=2)
+
+        @qml.qnode(dev, interface="jax", diff_method="backprop")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        x = jnp.array([0.1, 0.2])
+        res = jax.grad(circuit)(x)
+        expected = [-jnp.sin(x[0]) * jnp.cos(x[1]), -jnp.cos(x[0]) * jnp.sin(x[1])]
+
+        assert len(dev._compile_cache) == 1
+        assert jnp.allclose(res, jnp.array(expected), atol=tol, rtol=0)
+
+    def test_lru_cache(self):
+        """Test that the least recently used structure is removed from a full cache"""
+        dev = qml.device("default.qubit.jax", wires=1, jit_cache_size=2)
+
+        def make_tape(op):
+            with qml.tape.QuantumTape() as tape:
+                op(0.1, wires=0)
+                qml.expval(qml.PauliZ(0))
+            return tape
+
+        tapes = [make_tape(op) for op in [qml.RX, qml.RY, qml.RZ]]
+
+        dev.execute(tapes[0])
+        dev.execute(tapes[1])
+        dev.execute(tapes[0])
+        dev.execute(tapes[2])
+
+        assert list(dev._compile_cache) == [tapes[0].get_structure(), tapes[2].get_structure()]
+
+    def test_disabled(self, tol):
+        """Test that no circuits are compiled if the cache size is 0"""
+        dev = qml.device("default.qubit.jax", wires=1, jit_cache_size=0)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.3, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        res = dev.execute(tape)
+
+        assert not dev._compile_cache
+        assert jnp.allclose(res, jnp.cos(0.3), atol=tol, rtol=0)
+
+    def test_state(self, tol):
+        """Test that the device state is updated after executing a compiled circuit"""
+        dev = qml.device("default.qubit.jax", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RY(jnp.pi / 2, wires=0)
+            qml.expval(qml.PauliX(0))
+
+        dev.execute(tape)
+
+        assert len(dev._compile_cache) == 1
+        assert jnp.allclose(dev.state, jnp.array([1, 1]) / jnp.sqrt(2), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "op, measure",
+        [
+            (lambda: qml.RX(0.1, wires=0), qml.sample),
+            (lambda: qml.QubitStateVector(jnp.array([0, 1]), wires=0), qml.expval),
+            (lambda: qml.QubitUnitary(jnp.eye(2), wires=0), qml.expval),
+        ],
+    )
+    def test_not_compiled(self, op, measure):
+        """Test that unsupported circuits are executed operation by operation"""
+        dev = qml.device("default.qubit.jax", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            op()
+            measure(qml.PauliZ(0))
+
+        dev.execute(tape)
+        assert not dev._compile_cache
+
+    def test_vmap_execute(self, tol):
+        """Test that a circuit can be evaluated for a batch of parameter values"""
+        dev = qml.device("default.qubit.jax", wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.0, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(0.0, wires=1)
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(1))
+
+        x = jnp.array([0.1, 0.2, 0.3])
+        y = jnp.array([-0.4, 0.5, 0.6])
+        res = dev.vmap_execute(tape, [x, y])
+
+        expected = jnp.stack([jnp.cos(x), jnp.cos(x) * jnp.cos(y)], axis=1)
+
+        assert res.shape == (3, 2)
+        assert jnp.allclose(res, expected, atol=tol, rtol=0)
+        assert dev.num_executions == 3
+
+    def test_vmap_execute_unsupported(self):
+        """Test that an exception is raised if a circuit that cannot be
+        compiled is evaluated for a batch of parameter values"""
+        dev = qml.device("default.qubit.jax", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.0, wires=0)
+            qml.sample(qml.PauliZ(0))
+
+        with pytest.raises(qml.DeviceError, match="batch of parameter values"):
+            dev.vmap_execute(tape, [jnp.array([0.1, 0.2])])
+
+    def test_batch_execute(self, mocker, tol):
+        """Test that circuits of the same structure are evaluated using a single
+        vectorized call, and other circuits one-by-one"""
+        dev = qml.device("default.qubit.jax", wires=1)
+
+        def make_tape(op, x):
+            with qml.tape.QuantumTape() as tape:
+                op(x, wires=0)
+                qml.expval(qml.PauliZ(0))
+            return tape
+
+        tapes = [
+            make_tape(qml.RX, 0.1),
+            make_tape(qml.RY, 0.2),
+            make_tape(qml.RX, 0.3),
+            make_tape(qml.RX, 0.4),
+        ]
+
+        spy = mocker.spy(dev, "vmap_execute")
+        res = dev.batch_execute(tapes)
+
+        assert spy.call_count == 1
+        assert jnp.allclose(jnp.hstack(res), jnp.cos(jnp.array([0.1, 0.2, 0.3, 0.4])), atol=tol)
+        assert dev.num_executions == 4
+
+        # the device is left in the state of the final circuit
+        assert jnp.allclose(dev.state, jnp.array([jnp.cos(0.2), -1j * jnp.sin(0.2)]), atol=tol)
+
+    def test_prng_key_split(self):
+        """Test that a provided PRNG key is split on every execution"""
+
+        def sample(dev):
+            @qml.qnode(dev, interface="jax", diff_method="backprop")
+            def circuit():
+                qml.Hadamard(0)
+                return qml.sample(qml.PauliZ(wires=0))
+
+            return circuit
+
+        circuit1 = sample(qml.device("default.qubit.jax", wires=1, prng_key=jax.random.PRNGKey(0)))
+        circuit2 = sample(qml.device("default.qubit.jax", wires=1, prng_key=jax.random.PRNGKey(0)))
+
+        a = circuit1()
+        b = circuit1()
+
+        assert not np.all(a == b)
+        np.testing.assert_array_equal(a, circuit2())
+        np.testing.assert_array_equal(b, circuit2())
+
+    def test_prng_key_not_updated_in_jit(self):
+        """Test that the PRNG key of the device is not replaced by a tracer when
+        sampling within a traced function"""
+        key = jax.random.PRNGKey(0)
+        dev = qml.device("default.qubit.jax", wires=1, shots=10, analytic=False, prng_key=key)
+        probs = jnp.array([0.5, 0.5])
+
+        jax.jit(lambda p: dev.sample_basis_states(2, p))(probs)
+
+        assert not isinstance(dev._prng_key, jax.core.Tracer)
+        assert jnp.all(dev._prng_key == key)
+
+        # outside of a trace, the key is split
+        dev.sample_basis_states(2, probs)
+        assert not jnp.all(dev._prng_key == key)
+
+
+class TestCheckpointing:
+    """Tests for gate-level checkpointing of the backward pass"""
+
+    @staticmethod
+    def circuit(dev):
+        """Returns a QNode with parametrized and non-parametrized operations"""
+
+        @qml.qnode(dev, diff_method="backprop", interface="jax")
+        def circuit(x):
+            qml.Hadamard(wires=0)
+            qml.RX(x[0], wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.Rot(x[1], 0.1, 0.4, wires=1)
+            qml.CRX(x[2], wires=[1, 2])
+            qml.PauliY(wires=2)
+            return qml.expval(qml.PauliZ(2) @ qml.PauliX(0))
+
+        return circuit
+
+    @pytest.mark.parametrize("checkpoint_every", [1, 2, 100])
+    def test_gradient(self, checkpoint_every, tol):
+        """Test that checkpointing does not change the result or gradient"""
+        x = jnp.array([0.1, 0.2, 0.3])
+
+        circuit = self.circuit(qml.device("default.qubit.jax", wires=3))
+        expected = circuit(x)
+        expected_grad = jax.grad(lambda x: circuit(x).reshape(()))(x)
+
+        dev = qml.device("default.qubit.jax", wires=3, checkpoint_every=checkpoint_every)
+        circuit = self.circuit(dev)
+
+        assert jnp.allclose(circuit(x), expected, atol=tol, rtol=0)
+        res = jax.grad(lambda x: circuit(x).reshape(()))(x)
+        assert jnp.allclose(res, expected_grad, atol=tol, rtol=0)
+
+    def test_checkpoint(self, mocker):
+        """Test that each segment is wrapped using jax.checkpoint"""
+        dev = qml.device("default.qubit.jax", wires=3, checkpoint_every=2, jit_cache_size=0)
+        spy = mocker.spy(dev, "_checkpoint")
+
+        self.circuit(dev)(jnp.array([0.1, 0.2, 0.3]))
+        assert spy.call_count == 3
@@ -872,6 +872,7 @@ class TestQNodeIntegration:
             "supports_tensor_observables": True,
             "returns_probs": True,
             "returns_state": True,
+            "supports_observable_groups": True,
             "supports_reversible_diff": False,
             "supports_inverse_operations": True,
             "supports_analytic_computation": True,
@@ -1395,3 +1396,211 @@ class TestHighLevelIntegration:
 
         assert isinstance(grad, tf.Tensor)
         assert grad.shape == weights.shape
+
+
+@pytest.mark.usefixtures("tape_mode")
+class TestGraphMode:
+    """Tests for executing circuits traced into tf.function graphs"""
+
+    @pytest.fixture(autouse=True)
+    def tape_mode_only(self, tape_mode):
+        """Skip the tests if tape mode is not active"""
+        if not qml.tape_mode_active():
+            pytest.skip("Graph mode is only supported in tape mode.")
+
+    def test_disabled_by_default(self, tol):
+        """Test that circuits are executed eagerly by default"""
+        dev = qml.device("default.qubit.tf", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.3, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        res = dev.execute(tape)
+
+        assert not dev.graph_mode
+        assert not dev._compile_cache
+        assert np.allclose(res, np.cos(0.3), atol=tol, rtol=0)
+
+    def test_structure_traced_once(self, mocker, tol):
+        """Test that a circuit structure is traced once, and reused for new parameter values"""
+        dev = qml.device("default.qubit.tf", wires=2, graph_cache_size=4)
+
+        @qml.qnode(dev, interface="tf", diff_method="backprop")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        spy = mocker.spy(qml.devices.DefaultQubit, "execute")
+
+        for x in [tf.constant([0.1, 0.2]), tf.constant([0.5, -0.3])]:
+            res = circuit(x)
+            assert np.allclose(res, np.cos(x[0]) * np.cos(x[1]), atol=tol, rtol=0)
+
+        # the circuit is only executed operation by operation when traced
+        assert spy.call_count == 1
+        assert len(dev._compile_cache) == 1
+        assert dev.num_executions == 2
+
+    def test_gradient(self, tol):
+        """Test that traced circuits can be differentiated"""
+        dev = qml.device("default.qubit.tf", wires=2, graph_cache_size=4)
+
+        @qml.qnode(dev, interface="tf", diff_method="backprop")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        x = tf.Variable([0.1, 0.2], dtype=tf.float64)
+
+        with tf.GradientTape() as tape:
+            res = circuit(x)
+
+        grad = tape.gradient(res, x)
+        expected = [-np.sin(0.1) * np.cos(0.2), -np.cos(0.1) * np.sin(0.2)]
+
+        assert len(dev._compile_cache) == 1
+        assert np.allclose(grad, expected, atol=tol, rtol=0)
+
+    def test_lru_cache(self):
+        """Test that the least recently used structure is removed from a full cache"""
+        dev = qml.device("default.qubit.tf", wires=1, graph_cache_size=2)
+
+        def make_tape(op):
+            with qml.tape.QuantumTape() as tape:
+                op(0.1, wires=0)
+                qml.expval(qml.PauliZ(0))
+            return tape
+
+        tapes = [make_tape(op) for op in [qml.RX, qml.RY, qml.RZ]]
+
+        dev.execute(tapes[0])
+        dev.execute(tapes[1])
+        dev.execute(tapes[0])
+        dev.execute(tapes[2])
+
+        assert list(dev._compile_cache) == [tapes[0].get_structure(), tapes[2].get_structure()]
+
+    def test_state(self, tol):
+        """Test that the device state is updated after executing a traced circuit"""
+        dev = qml.device("default.qubit.tf", wires=1, graph_cache_size=4)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RY(np.pi / 2, wires=0)
+            qml.expval(qml.PauliX(0))
+
+        dev.execute(tape)
+
+        assert len(dev._compile_cache) == 1
+        assert np.allclose(dev.state, np.array([1, 1]) / np.sqrt(2), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "op, measure",
+        [
+            (lambda: qml.RX(0.1, wires=0), qml.sample),
+            (lambda: qml.QubitStateVector(np.array([0, 1]), wires=0), qml.expval),
+            (lambda: qml.QubitUnitary(np.eye(2), wires=0), qml.expval),
+        ],
+    )
+    def test_not_traced(self, op, measure):
+        """Test that unsupported circuits are executed eagerly"""
+        dev = qml.device("default.qubit.tf", wires=1, graph_cache_size=4)
+
+        with qml.tape.QuantumTape() as tape:
+            op()
+            measure(qml.PauliZ(0))
+
+        dev.execute(tape)
+        assert not dev._compile_cache
+
+    def test_vmap_execute(self, tol):
+        """Test that a circuit can be evaluated and differentiated for a batch of parameter
+        values"""
+        dev = qml.device("default.qubit.tf", wires=2, graph_cache_size=4)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.0, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(0.0, wires=1)
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(1))
+
+        x = tf.Variable([0.1, 0.2, 0.3], dtype=tf.float64)
+        y = tf.constant([-0.4, 0.5, 0.6], dtype=tf.float64)
+
+        with tf.GradientTape() as g:
+            res = dev.vmap_execute(tape, [x, y])
+            loss = tf.reduce_sum(res[:, 1])
+
+        expected = tf.stack([tf.cos(x), tf.cos(x) * tf.cos(y)], axis=1)
+
+        assert res.shape == (3, 2)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert np.allclose(g.gradient(loss, x), -tf.sin(x) * tf.cos(y), atol=tol, rtol=0)
+        assert dev.num_executions == 3
+
+    def test_vmap_execute_unsupported(self):
+        """Test that an exception is raised if a circuit is evaluated for a
+        batch of parameter values outside of graph mode"""
+        dev = qml.device("default.qubit.tf", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.0, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(qml.DeviceError, match="batch of parameter values"):
+            dev.vmap_execute(tape, [tf.constant([0.1, 0.2])])
+
+
+@pytest.mark.usefixtures("tape_mode")
+class TestCheckpointing:
+    """Tests for gate-level checkpointing of the backward pass"""
+
+    @staticmethod
+    def circuit(dev):
+        """Returns a QNode with parametrized and non-parametrized operations"""
+
+        @qml.qnode(dev, diff_method="backprop", interface="tf")
+        def circuit(x):
+            qml.Hadamard(wires=0)
+            qml.RX(x[0], wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.Rot(x[1], 0.1, 0.4, wires=1)
+            qml.CRX(x[2], wires=[1, 2])
+            qml.PauliY(wires=2)
+            return qml.expval(qml.PauliZ(2) @ qml.PauliX(0))
+
+        return circuit
+
+    @pytest.mark.parametrize("checkpoint_every", [1, 2, 100])
+    def test_gradient(self, checkpoint_every, tol):
+        """Test that checkpointing does not change the result or gradient"""
+        x = tf.Variable([0.1, 0.2, 0.3], dtype=tf.float64)
+
+        circuit = self.circuit(qml.device("default.qubit.tf", wires=3))
+
+        with tf.GradientTape() as tape:
+            expected = circuit(x)
+
+        expected_grad = tape.gradient(expected, x)
+
+        dev = qml.device("default.qubit.tf", wires=3, checkpoint_every=checkpoint_every)
+        circuit = self.circuit(dev)
+
+        with tf.GradientTape() as tape:
+            res = circuit(x)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert np.allclose(tape.gradient(res, x), expected_grad, atol=tol, rtol=0)
+
+    def test_recompute_grad(self, mocker):
+        """Test that each segment is wrapped using tf.recompute_grad"""
+        spy = mocker.spy(tf, "recompute_grad")
+        dev = qml.device("default.qubit.tf", wires=3, checkpoint_every=2)
+
+        self.circuit(dev)(tf.Variable([0.1, 0.2, 0.3], dtype=tf.float64))
+        assert spy.call_count == 3
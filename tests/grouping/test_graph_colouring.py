@@ -16,7 +16,13 @@ Unit tests for heuristic Pauli graph colouring functions in ``grouping/graph_col
 """
 import pytest
 import numpy as np
-from pennylane.grouping.graph_colouring import largest_first, recursive_largest_first
+import scipy.sparse
+from pennylane.grouping.graph_colouring import (
+    dsatur,
+    greedy,
+    largest_first,
+    recursive_largest_first,
+)
 
 
 class TestGraphcolouringFunctions:
@@ -72,9 +78,13 @@ class TestGraphcolouringFunctions:
         dummy_terms = np.reshape(list(range(n_terms)), (n_terms, 1))
         lf_colouring = largest_first(dummy_terms, adjacency_matrix)
         rlf_colouring = recursive_largest_first(dummy_terms, adjacency_matrix)
+        dsatur_colouring = dsatur(dummy_terms, adjacency_matrix)
+        greedy_colouring = greedy(dummy_terms, adjacency_matrix)
 
         assert self.verify_graph_colour_solution(adjacency_matrix, lf_colouring)
         assert self.verify_graph_colour_solution(adjacency_matrix, rlf_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, dsatur_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, greedy_colouring)
 
     term_counts = list(range(10))
 
@@ -87,6 +97,47 @@ class TestGraphcolouringFunctions:
         dummy_terms = np.reshape(list(range(n_terms)), (n_terms, 1))
         lf_colouring = largest_first(dummy_terms, adjacency_matrix)
         rlf_colouring = recursive_largest_first(dummy_terms, adjacency_matrix)
+        dsatur_colouring = dsatur(dummy_terms, adjacency_matrix)
+        greedy_colouring = greedy(dummy_terms, adjacency_matrix)
 
         assert self.verify_graph_colour_solution(adjacency_matrix, lf_colouring)
         assert self.verify_graph_colour_solution(adjacency_matrix, rlf_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, dsatur_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, greedy_colouring)
+
+    @pytest.mark.parametrize("colourer", [dsatur, greedy])
+    @pytest.mark.parametrize("n_terms", [20, 100])
+    def test_sparse_graph_colouring(self, colourer, n_terms):
+        """Tests that the adjacency list colouring methods give the same valid colouring for dense
+        and sparse adjacency matrices, with every vertex coloured exactly once."""
+        rng = np.random.default_rng(n_terms)
+        adjacency_matrix = np.triu(rng.integers(0, 2, (n_terms, n_terms)), 1)
+        adjacency_matrix += adjacency_matrix.T
+
+        dummy_terms = np.reshape(list(range(n_terms)), (n_terms, 1))
+        colouring = colourer(dummy_terms, adjacency_matrix)
+        sparse_colouring = colourer(dummy_terms, scipy.sparse.csr_matrix(adjacency_matrix))
+
+        assert self.verify_graph_colour_solution(adjacency_matrix, colouring)
+        assert sorted(t[0] for g in colouring.values() for t in g) == list(range(n_terms))
+        assert list(colouring) == list(range(1, len(colouring) + 1))
+        assert {k: [t[0] for t in v] for k, v in colouring.items()} == {
+            k: [t[0] for t in v] for k, v in sparse_colouring.items()
+        }
+
+    def test_dsatur_bipartite(self):
+        """Tests that DSATUR finds the optimal colouring of a crown graph, for which
+        the Largest First heuristic may require as many colours as there are vertex pairs."""
+        n = 6
+        adjacency_matrix = np.zeros((2 * n, 2 * n), dtype=int)
+
+        for i in range(n):
+            for j in range(n):
+                if i != j:
+                    adjacency_matrix[2 * i, 2 * j + 1] = adjacency_matrix[2 * j + 1, 2 * i] = 1
+
+        dummy_terms = np.reshape(list(range(2 * n)), (2 * n, 1))
+        colouring = dsatur(dummy_terms, adjacency_matrix)
+
+        assert self.verify_graph_colour_solution(adjacency_matrix, colouring)
+        assert len(colouring) == 2
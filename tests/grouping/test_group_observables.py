@@ -16,8 +16,9 @@ Unit tests for ``PauliGroupingStrategy`` and ``group_observables`` in ``grouping
 """
 import pytest
 import numpy as np
+import scipy.sparse
 from pennylane import Identity, PauliX, PauliY, PauliZ
-from pennylane.grouping.utils import are_identical_pauli_words
+from pennylane.grouping.utils import are_identical_pauli_words, is_qwc, pauli_to_binary
 from pennylane.grouping.group_observables import PauliGroupingStrategy, group_observables
 
 
@@ -81,6 +82,33 @@ class TestPauliGroupingStrategy:
             == anticommuting_complement_adjacency_matrix
         ).all()
 
+    @pytest.mark.parametrize(
+        "graph_colourer, sparse",
+        [("lf", False), ("rlf", False), ("dsatur", True), ("greedy", True)],
+    )
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    def test_sparse_complement_adj_matrix_for_operators(
+        self, graph_colourer, sparse, grouping_type
+    ):
+        """Tests that the complement graph adjacency matrix is sparse for the graph colouring
+        methods working on adjacency lists, and agrees with the dense adjacency matrix."""
+
+        observables = [PauliY(0), PauliZ(0) @ PauliZ(1), PauliY(0) @ PauliX(1)]
+
+        adj = PauliGroupingStrategy(
+            observables, grouping_type, graph_colourer
+        ).complement_adj_matrix_for_operator()
+        expected = PauliGroupingStrategy(
+            observables, grouping_type
+        ).complement_adj_matrix_for_operator()
+
+        assert scipy.sparse.issparse(adj) == sparse
+
+        if sparse:
+            adj = adj.toarray()
+
+        assert np.array_equal(adj, expected)
+
     trivial_ops = [
         [Identity(0), Identity(0), Identity(7)],
         [Identity("a") @ Identity(1), Identity("b"), Identity("b") @ Identity("c")],
@@ -281,6 +309,49 @@ class TestGroupObservables:
             for j, pauli in enumerate(partition):
                 assert are_identical_pauli_words(pauli, anticom_partitions_sol[i][j])
 
+    @pytest.mark.parametrize("method", ["lf", "rlf", "dsatur", "greedy"])
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    def test_colouring_methods(self, method, grouping_type):
+        """Tests that each graph colouring method gives a valid partitioning, with the
+        coefficients grouped alongside the observables."""
+        observables = observables_list[0]
+        coefficients = list(range(len(observables)))
+        wire_map = {0: 0, 1: 1, 2: 2}
+
+        partitions, coeffs = group_observables(
+            observables, coefficients, grouping_type=grouping_type, method=method
+        )
+
+        assert sorted(c for g in coeffs for c in g) == coefficients
+
+        for partition, coeff_group in zip(partitions, coeffs):
+            for pauli, c in zip(partition, coeff_group):
+                assert are_identical_pauli_words(pauli, observables[c])
+
+            binary = [pauli_to_binary(p, 3, wire_map=wire_map) for p in partition]
+
+            for i, b1 in enumerate(binary):
+                for b2 in binary[i + 1 :]:
+                    commute = (b1[:3] @ b2[3:] + b1[3:] @ b2[:3]) % 2 == 0
+
+                    if grouping_type == "qwc":
+                        assert is_qwc(b1, b2)
+                    else:
+                        assert commute == (grouping_type == "commuting")
+
+    def test_duplicate_observables_coefficients(self):
+        """Tests that identical Pauli words keep their own coefficients."""
+        observables = [PauliX(0), PauliZ(0) @ Identity(1), PauliX(0), PauliZ(0)]
+        coefficients = [0.1, 0.2, 0.3, 0.4]
+
+        partitions, coeffs = group_observables(observables, coefficients)
+
+        assert sorted(c for g in coeffs for c in g) == coefficients
+
+        for partition, coeff_group in zip(partitions, coeffs):
+            for pauli, c in zip(partition, coeff_group):
+                assert are_identical_pauli_words(pauli, PauliX(0) if c in (0.1, 0.3) else PauliZ(0))
+
     def test_group_observables_exception(self):
         """Tests that the ``group_observables`` function raises an exception if
         the lengths of coefficients and observables do not agree."""
@@ -291,7 +362,7 @@ class TestGroupObservables:
 
     def test_binary_repr_custom_wire_map(self):
         """Tests that the ``binary_repr`` method sets a custom
-         wire map correctly."""
+        wire map correctly."""
 
         observables = [Identity("alice"), Identity("bob"), Identity("charlie")]
         grouping_instance = PauliGroupingStrategy(observables, "anticommuting")
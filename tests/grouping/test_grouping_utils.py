@@ -16,6 +16,8 @@ Unit tests for the :mod:`grouping` utility functions in ``grouping/utils.py``.
 """
 import pytest
 import numpy as np
+import scipy.sparse
+import pennylane as qml
 from pennylane import Identity, PauliX, PauliY, PauliZ, Hadamard, Hermitian, U3
 from pennylane.operation import Tensor
 from pennylane.wires import Wires
@@ -26,7 +28,10 @@ from pennylane.grouping.utils import (
     binary_to_pauli,
     is_qwc,
     observables_to_binary_matrix,
+    binary_matrix_to_observables,
     qwc_complement_adj_matrix,
+    commuting_complement_adj_matrix,
+    anticommuting_complement_adj_matrix,
 )
 
 
@@ -162,6 +167,81 @@ class TestGroupingUtils:
             ValueError, observables_to_binary_matrix, observables, n_qubits_invalid
         )
 
+    def test_observables_to_binary_matrix_pauli_to_binary(self):
+        """Tests that the rows of the binary matrix agree with ``pauli_to_binary`` for
+        a shared wire map."""
+        observables = [op for op, _ in self.ops_to_vecs_abstract_wires] + [
+            PauliY("a") @ Identity("b") @ PauliX("c"),
+            Identity("c"),
+        ]
+        wire_map = {"a": 0, "b": 1, "c": 2, 6: 3}
+
+        binary_observables = observables_to_binary_matrix(observables, wire_map=wire_map)
+
+        for row, (_, vec) in zip(binary_observables, self.ops_to_vecs_abstract_wires):
+            assert np.array_equal(row, vec)
+
+        for row, op in zip(binary_observables, observables):
+            assert np.array_equal(row, pauli_to_binary(op, n_qubits=4, wire_map=wire_map))
+
+    @pytest.mark.parametrize("non_pauli_word", non_pauli_words)
+    def test_observables_to_binary_matrix_non_pauli_word_catch(self, non_pauli_word):
+        """Tests TypeError raise for when a non-Pauli word is given to
+        observables_to_binary_matrix."""
+
+        with pytest.raises(TypeError, match="Expected a Pauli word"):
+            observables_to_binary_matrix([PauliX(0), non_pauli_word])
+
+    def test_observables_to_binary_matrix_missing_wire(self):
+        """Tests that an exception is raised if a wire is not contained in the wire map."""
+
+        with pytest.raises(qml.wires.WireError, match="No mapping for wire label b"):
+            observables_to_binary_matrix([PauliX("a"), PauliZ("b")], wire_map={"a": 0})
+
+    @pytest.mark.parametrize("wire_map", [None, {"alice": 0, "bob": 1, "ancilla": 2}])
+    def test_binary_matrix_to_observables(self, wire_map):
+        """Tests that the conversion of a binary matrix agrees with ``binary_to_pauli`` for each
+        row, and is the inverse of ``observables_to_binary_matrix``."""
+        binary_matrix = np.array([vec for vec, _ in self.vecs_to_ops_abstract_wires])
+
+        observables = binary_matrix_to_observables(binary_matrix, wire_map=wire_map)
+
+        assert len(observables) == len(binary_matrix)
+
+        for row, op in zip(binary_matrix, observables):
+            assert are_identical_pauli_words(op, binary_to_pauli(row, wire_map=wire_map))
+
+        wire_map = wire_map or {0: 0, 1: 1, 2: 2}
+        assert np.array_equal(
+            observables_to_binary_matrix(observables, n_qubits=3, wire_map=wire_map),
+            binary_matrix,
+        )
+
+    def test_binary_matrix_to_observables_single_factor(self):
+        """Tests that rows with a single non-identity factor are converted to Pauli operations."""
+        observables = binary_matrix_to_observables([[0, 1, 0, 1], [0, 0, 0, 0]])
+
+        assert isinstance(observables[0], PauliY)
+        assert observables[0].wires == Wires(1)
+        assert isinstance(observables[1], Identity)
+
+    @pytest.mark.parametrize(
+        "binary_matrix", [[1, 0, 1, 0], [[1, 0, 1]], [[2, 0, 0, 1]], [[0.1, 4.3, 2.0, 1.3]]]
+    )
+    def test_binary_matrix_to_observables_illegal_matrix(self, binary_matrix):
+        """Tests ValueError raise for inputs that are not matrices of even-dimensional binary
+        vectors."""
+
+        assert pytest.raises(ValueError, binary_matrix_to_observables, binary_matrix)
+
+    @pytest.mark.parametrize("binary_vec,wire_map", binary_vecs_with_invalid_wire_maps)
+    def test_binary_matrix_to_observables_invalid_wire_map(self, binary_vec, wire_map):
+        """Tests ValueError raise when wire_map values are not integers 0 to N, for input 2N
+        dimensional binary vectors."""
+
+        with pytest.raises(ValueError, match="The values of wire_map"):
+            binary_matrix_to_observables([binary_vec], wire_map)
+
     def test_is_qwc(self):
         """Determining if two Pauli words are qubit-wise commuting."""
 
@@ -288,3 +368,76 @@ class TestGroupingUtils:
 
         with pytest.raises(ValueError, match="Expected a binary array, instead got"):
             qwc_complement_adj_matrix(not_binary_observables)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_qwc_complement_adj_matrix_pairwise(self, chunk_size):
+        """Tests that the ``qwc_complement_adj_matrix`` function agrees with pairwise
+        ``is_qwc`` comparisons, independently of the chunk size"""
+        rng = np.random.default_rng(1967)
+        binary_observables = rng.integers(0, 2, (20, 8))
+
+        adj = qwc_complement_adj_matrix(binary_observables, chunk_size=chunk_size)
+        expected = [
+            [int(not is_qwc(a, b)) for b in binary_observables] for a in binary_observables
+        ]
+
+        assert np.array_equal(adj, expected)
+
+    def test_commuting_complement_adj_matrix(self):
+        """Tests that the ``commuting_complement_adj_matrix`` function returns the correct
+        adjacency matrix."""
+        binary_observables = np.array(
+            [
+                [1.0, 0.0, 0.0, 0.0],  # X0
+                [0.0, 0.0, 1.0, 0.0],  # Z0
+                [1.0, 1.0, 1.0, 1.0],  # Y0 Y1
+                [1.0, 1.0, 0.0, 0.0],  # X0 X1
+            ]
+        )
+        adj = commuting_complement_adj_matrix(binary_observables)
+        expected = np.array([[0, 1, 1, 0], [1, 0, 1, 1], [1, 1, 0, 0], [0, 1, 0, 0]])
+        assert np.array_equal(adj, expected)
+
+        adj = commuting_complement_adj_matrix(binary_observables, chunk_size=3)
+        assert np.array_equal(adj, expected)
+
+    def test_anticommuting_complement_adj_matrix(self):
+        """Tests that the ``anticommuting_complement_adj_matrix`` function connects distinct
+        commuting Pauli words."""
+        binary_observables = np.array(
+            [
+                [1.0, 0.0, 0.0, 0.0],  # X0
+                [0.0, 0.0, 1.0, 0.0],  # Z0
+                [1.0, 1.0, 1.0, 1.0],  # Y0 Y1
+                [1.0, 1.0, 0.0, 0.0],  # X0 X1
+            ]
+        )
+        adj = anticommuting_complement_adj_matrix(binary_observables, chunk_size=3)
+        expected = np.array([[0, 0, 0, 1], [0, 0, 0, 0], [0, 0, 0, 1], [1, 0, 1, 0]])
+        assert np.array_equal(adj, expected)
+
+    @pytest.mark.parametrize(
+        "adj_fn",
+        [
+            qwc_complement_adj_matrix,
+            commuting_complement_adj_matrix,
+            anticommuting_complement_adj_matrix,
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_sparse_complement_adj_matrix(self, adj_fn, chunk_size):
+        """Tests that the complement adjacency matrices returned as ``scipy.sparse`` matrices
+        agree with the dense adjacency matrices."""
+        rng = np.random.default_rng(1967)
+        binary_observables = rng.integers(0, 2, (20, 8))
+
+        adj = adj_fn(binary_observables, chunk_size=chunk_size, sparse=True)
+
+        assert scipy.sparse.issparse(adj)
+        assert np.array_equal(adj.toarray(), adj_fn(binary_observables))
+
+    def test_commuting_complement_adj_matrix_exception(self):
+        """Tests that the ``commuting_complement_adj_matrix`` function raises an exception if
+        the matrix is not binary."""
+        with pytest.raises(ValueError, match="Expected a binary array"):
+            commuting_complement_adj_matrix([[1.0, 0.5], [0.0, 1.0]])
@@ -15,7 +15,9 @@
 Unit tests for ``optimize_measurements`` function in ``grouping/optimize_measurements.py``.
 """
 import pytest
+import numpy as np
 from pennylane import Identity, PauliX, PauliY, PauliZ
+from pennylane.utils import expand
 from pennylane.grouping.utils import are_identical_pauli_words
 from pennylane.grouping.optimize_measurements import optimize_measurements
 
@@ -111,8 +113,51 @@ class TestOptimizeMeasurements:
             grouped_coeffs[i] == grouped_coeffs_sol[i] for i in range(len(grouped_coeffs_sol))
         )
 
+    def test_optimize_measurements_commuting(self):
+        """Tests that commuting partitions are diagonalized, with the signs of the diagonalized
+        Pauli words absorbed into the coefficients."""
+        observables = [
+            PauliX(0) @ PauliX(1),
+            PauliZ(0) @ PauliZ(1),
+            PauliY(0) @ PauliY(1),
+            PauliX(0),
+            PauliZ(1),
+        ]
+        coefficients = [0.5, 0.2, 0.1, -0.3, 0.7]
+        wires = [0, 1]
+
+        rotations, groupings, grouped_coeffs = optimize_measurements(
+            observables, coefficients, grouping="commuting"
+        )
+
+        qwc_groupings = optimize_measurements(observables, coefficients, grouping="qwc")[1]
+        assert len(groupings) < len(qwc_groupings)
+
+        # the rotated Hamiltonian is equal to the sum of the grouped diagonal observables
+        hamiltonian = sum(
+            c * expand(o.matrix, o.wires, wires) for c, o in zip(coefficients, observables)
+        )
+        res = 0
+
+        for rotation, grouping, coeffs in zip(rotations, groupings, grouped_coeffs):
+            u = np.eye(4)
+            for op in rotation:
+                u = expand(op.matrix, op.wires, wires) @ u
+
+            for o, c in zip(grouping, coeffs):
+                res = res + c * u.conj().T @ expand(o.matrix, o.wires, wires) @ u
+
+        assert np.allclose(res, hamiltonian)
+
+    def test_optimize_measurements_commuting_without_coefficients(self):
+        """Tests that a ValueError is raised if no coefficients are specified for
+        ``'commuting'`` grouping."""
+        with pytest.raises(ValueError, match="Coefficients must be specified"):
+            optimize_measurements([PauliX(0), PauliZ(1)], grouping="commuting")
+
     def test_optimize_measurements_not_implemented_catch(self):
-        """Tests that NotImplementedError is raised for methods other than ``'qwc'``."""
+        """Tests that NotImplementedError is raised for methods other than ``'qwc'`` and
+        ``'commuting'``."""
 
         observables = [PauliY(0), PauliX(0) @ PauliX(1), PauliZ(1)]
         grouping = "anticommuting"
@@ -0,0 +1,196 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :class:`PauliSentence` class in ``grouping/pauli_sentence.py``.
+"""
+import functools
+
+import pytest
+import numpy as np
+
+import pennylane as qml
+from pennylane import Identity, PauliX, PauliY, PauliZ, Hadamard
+from pennylane.grouping import PauliSentence
+
+PAULI_MATRICES = {
+    (0, 0): np.eye(2),
+    (1, 0): np.array([[0, 1], [1, 0]]),
+    (1, 1): np.array([[0, -1j], [1j, 0]]),
+    (0, 1): np.array([[1, 0], [0, -1]]),
+}
+
+
+def sentence_matrix(ps):
+    """Returns the matrix of a Pauli sentence"""
+    return sum(
+        c
+        * functools.reduce(
+            np.kron, [PAULI_MATRICES[(int(b_x), int(b_z))] for b_x, b_z in zip(x, z)], [[1]]
+        )
+        for c, x, z in zip(ps.coeffs, ps.x, ps.z)
+    )
+
+
+def random_sentence(seed, num_terms=6, wires=(0, 1, 2)):
+    """Returns a random Pauli sentence"""
+    rng = np.random.default_rng(seed)
+    x = rng.integers(0, 2, (num_terms, len(wires)))
+    z = rng.integers(0, 2, (num_terms, len(wires)))
+    return PauliSentence(x, z, rng.normal(size=num_terms), wires)
+
+
+H1 = qml.Hamiltonian(
+    [0.5, -0.2, 0.3],
+    [PauliX(0) @ PauliZ(1), PauliY(1), Identity(0)],
+)
+
+
+class TestPauliSentence:
+    """Tests for the PauliSentence class"""
+
+    def test_from_hamiltonian(self):
+        """Test that a Pauli sentence is correctly created from a Hamiltonian"""
+        ps = PauliSentence.from_hamiltonian(H1)
+
+        assert np.array_equal(ps.x, [[1, 0], [0, 1], [0, 0]])
+        assert np.array_equal(ps.z, [[0, 1], [0, 1], [0, 0]])
+        assert np.allclose(ps.coeffs, [0.5, -0.2, 0.3])
+        assert ps.wires == qml.wires.Wires([0, 1])
+        assert len(ps) == 3
+
+    def test_from_hamiltonian_wires(self):
+        """Test that the wires of a Pauli sentence can be specified"""
+        ps = PauliSentence.from_hamiltonian(H1, wires=["a", 1, 0])
+
+        assert np.array_equal(ps.x, [[0, 0, 1], [0, 1, 0], [0, 0, 0]])
+        assert np.array_equal(ps.z, [[0, 1, 0], [0, 1, 0], [0, 0, 0]])
+
+    def test_from_hamiltonian_non_pauli(self):
+        """Test that an exception is raised if the Hamiltonian contains non-Pauli words"""
+        H = qml.Hamiltonian([1.0], [PauliX(0) @ Hadamard(1)])
+
+        with pytest.raises(ValueError, match="Expected a Hamiltonian of Pauli words"):
+            PauliSentence.from_hamiltonian(H)
+
+    def test_from_hamiltonian_missing_wires(self):
+        """Test that an exception is raised if the wires do not contain the Hamiltonian wires"""
+        with pytest.raises(ValueError, match="do not contain"):
+            PauliSentence.from_hamiltonian(H1, wires=[0])
+
+    @pytest.mark.parametrize(
+        "args, msg",
+        [
+            (([[1, 0]], [[1]], [1.0], [0, 1]), "same shape"),
+            (([[1, 0]], [[1, 0]], [1.0, 2.0], [0, 1]), "Expected 1 coefficients"),
+            (([[1, 0]], [[1, 0]], [1.0], [0]), "Expected 2 wires"),
+        ],
+    )
+    def test_invalid_arguments(self, args, msg):
+        """Test that an exception is raised for inconsistent arguments"""
+        with pytest.raises(ValueError, match=msg):
+            PauliSentence(*args)
+
+    def test_to_hamiltonian(self):
+        """Test that the conversion to and from a Hamiltonian is lossless"""
+        H = PauliSentence.from_hamiltonian(H1).to_hamiltonian()
+
+        assert H.compare(H1)
+        assert H.coeffs == [0.5, -0.2, 0.3]
+
+    def test_to_hamiltonian_no_wires(self):
+        """Test that the identity terms of a Pauli sentence without wires
+        act on wire 0 of the Hamiltonian"""
+        ps = PauliSentence(np.zeros((1, 0)), np.zeros((1, 0)), [0.7], [])
+        H = ps.to_hamiltonian()
+
+        assert H.compare(qml.Hamiltonian([0.7], [qml.Identity(0)]))
+        assert H.coeffs == [0.7]
+
+    def test_to_hamiltonian_complex(self):
+        """Test that an exception is raised if the coefficients are not real"""
+        ps = PauliSentence([[1]], [[0]], [1j], [0])
+
+        with pytest.raises(ValueError, match="coefficients are not real-valued"):
+            ps.to_hamiltonian()
+
+    def test_simplify(self):
+        """Test that like-terms are combined and vanishing terms removed"""
+        ps = PauliSentence(
+            [[1, 0], [0, 1], [1, 0], [0, 0]],
+            [[0, 1], [0, 0], [0, 1], [1, 1]],
+            [0.5, 0.2, 0.25, 0.0],
+            [0, 1],
+        )
+        ps.simplify()
+
+        expected = PauliSentence([[1, 0], [0, 1]], [[0, 1], [0, 0]], [0.75, 0.2], [0, 1])
+
+        assert len(ps) == 2
+        assert np.allclose(sentence_matrix(ps), sentence_matrix(expected))
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_add_sub(self, seed):
+        """Test the addition and subtraction of Pauli sentences"""
+        ps1 = random_sentence(seed)
+        ps2 = random_sentence(seed + 10)
+
+        assert np.allclose(sentence_matrix(ps1 + ps2), sentence_matrix(ps1) + sentence_matrix(ps2))
+        assert np.allclose(sentence_matrix(ps1 - ps2), sentence_matrix(ps1) - sentence_matrix(ps2))
+        assert len(ps1 - ps1) == 0
+
+    def test_add_different_wires(self):
+        """Test the addition of Pauli sentences acting on different wires"""
+        ps1 = PauliSentence([[1]], [[0]], [1.0], ["a"])
+        ps2 = PauliSentence([[0]], [[1]], [2.0], ["b"])
+        res = ps1 + ps2
+
+        assert res.wires == qml.wires.Wires(["a", "b"])
+        assert res.to_hamiltonian().compare(qml.Hamiltonian([1, 2], [PauliX("a"), PauliZ("b")]))
+
+    def test_add_hamiltonian(self):
+        """Test the addition of a Pauli sentence and a Hamiltonian"""
+        ps = PauliSentence.from_hamiltonian(H1)
+        res = ps + qml.Hamiltonian([-0.5], [PauliZ(1) @ PauliX(0)])
+
+        assert res.to_hamiltonian().compare(qml.Hamiltonian([-0.2, 0.3], [PauliY(1), Identity(0)]))
+
+    @pytest.mark.parametrize("a", [2, -0.5, 1j])
+    def test_scalar_mul(self, a):
+        """Test the multiplication of a Pauli sentence by a scalar"""
+        ps = random_sentence(0)
+        assert np.allclose(sentence_matrix(a * ps), a * sentence_matrix(ps))
+        assert np.allclose(sentence_matrix(ps * a), a * sentence_matrix(ps))
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matmul(self, seed):
+        """Test the operator product of Pauli sentences, including phases"""
+        ps1 = random_sentence(seed)
+        ps2 = random_sentence(seed + 10)
+
+        assert np.allclose(sentence_matrix(ps1 @ ps2), sentence_matrix(ps1) @ sentence_matrix(ps2))
+
+    def test_matmul_anticommuting(self):
+        """Test that the products of anticommuting Pauli words cancel"""
+        ps = PauliSentence.from_hamiltonian(qml.Hamiltonian([0.5, -0.2], [PauliX(0), PauliZ(0)]))
+        res = ps @ ps
+
+        assert len(res) == 1
+        assert np.array_equal(res.x, [[0]]) and np.array_equal(res.z, [[0]])
+        assert np.allclose(res.coeffs, [0.29])
+
+    @pytest.mark.parametrize("op", ["__add__", "__sub__", "__mul__", "__matmul__"])
+    def test_invalid_operand(self, op):
+        """Test that an exception is raised for unsupported operands"""
+        with pytest.raises(ValueError, match="Cannot"):
+            getattr(random_sentence(0), op)("a")
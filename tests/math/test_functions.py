@@ -1146,6 +1146,52 @@ class TestCovMatrix:
         expected = self.expected_grad(weights)
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
+    def test_unordered_wires(self, in_tape_mode, tol):
+        """Test that the covariance matrix computes the correct
+        result when the observables are not ordered by wire"""
+        dev = qml.device("default.qubit", wires=3)
+        obs_list = self.obs_list[::-1]
+
+        @qml.qnode(dev, interface="autograd")
+        def circuit(weights):
+            """Returns the shared probability distribution of ansatz
+            in the joint basis for obs_list"""
+            self.ansatz(weights, wires=dev.wires)
+
+            for o in obs_list:
+                o.diagonalizing_gates()
+
+            return qml.probs(wires=dev.wires)
+
+        weights = np.array([0.1, 0.2, 0.3])
+        res = fn.cov_matrix(circuit(weights), obs_list)
+        expected = self.expected_cov(weights)[::-1, ::-1]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_interleaved_wires(self, in_tape_mode, tol):
+        """Test that the covariance matrix computes the correct
+        result when the wires of the observables are interleaved"""
+        dev = qml.device("default.qubit", wires=3)
+        A = np.diag([1.0, 2.0, 3.0, 5.0])
+        obs_list = [qml.Hermitian(A, wires=[0, 2]), qml.PauliZ(1)]
+
+        @qml.qnode(dev, interface="autograd")
+        def circuit(weights):
+            self.ansatz(weights, wires=dev.wires)
+            return qml.probs(wires=dev.wires)
+
+        weights = np.array([0.1, 0.2, 0.3])
+        probs = circuit(weights)
+        res = fn.cov_matrix(probs, obs_list)
+
+        # eigenvalues of A and PauliZ(1) on the computational basis states |z0 z1 z2>
+        a = np.diag(A).reshape(2, 1, 2)
+        z = np.array([1.0, -1.0]).reshape(1, 2, 1)
+        p = probs.reshape(2, 2, 2)
+        expected = np.sum(a * z * p) - np.sum(a * p) * np.sum(z * p)
+        assert np.allclose(res[0, 1], expected, atol=tol, rtol=0)
+        assert np.allclose(res[1, 0], expected, atol=tol, rtol=0)
+
     def test_autograd(self, in_tape_mode, tol):
         """Test that the covariance matrix computes the correct
         result, and is differentiable, using the Autograd interface"""
@@ -481,6 +481,201 @@ class TestKerasLayer:
         assert grad is not None
         spy.assert_not_called()
 
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_call_batch_single_execution(self, mocker):
+        """Test that the forward and backward passes of a batched input each submit a
+        single batch of circuits to the device, and agree with evaluating each datapoint"""
+        if not qml.tape_mode_active():
+            pytest.skip("This functionality is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="tf", diff_method="parameter-shift")
+        def circuit(inputs, weights):
+            qml.templates.AngleEmbedding(inputs, wires=range(2))
+            qml.templates.BasicEntanglerLayers(weights, wires=range(2))
+            return [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))]
+
+        layer = KerasLayer(circuit, {"weights": (1, 2)}, output_dim=2)
+        x = tf.Variable([[0.1, 0.2], [0.3, -0.4], [1.2, 0.7]], dtype=tf.keras.backend.floatx())
+
+        spy = mocker.spy(dev, "batch_execute")
+
+        with tf.GradientTape() as tape:
+            out = layer(x)
+            loss = tf.reduce_sum(out)
+
+        assert out.shape == (3, 2)
+        assert spy.call_count == 1
+        assert len(spy.call_args[0][0]) == 3
+
+        grad_x, grad_weights = tape.gradient(loss, [x, layer.trainable_weights[0]])
+
+        # two shifted circuits for each of the four gate parameters, for each datapoint
+        assert spy.call_count == 2
+        assert len(spy.call_args[0][0]) == 3 * 8
+
+        weights = layer.trainable_weights[0]
+
+        with tf.GradientTape() as tape:
+            expected = tf.stack([circuit(x_, 1.0 * weights) for x_ in tf.unstack(x)])
+            loss = tf.reduce_sum(expected)
+
+        expected_grad_x, expected_grad_weights = tape.gradient(loss, [x, weights])
+
+        assert np.allclose(out, expected)
+        assert np.allclose(grad_x, expected_grad_x)
+        assert np.allclose(grad_weights, expected_grad_weights)
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_call_batch_backprop_graph_mode(self, mocker):
+        """Test that a batched input to a backprop QNode on a device in graph mode is
+        evaluated using a single vectorized call, and agrees with evaluating each datapoint"""
+        if not qml.tape_mode_active():
+            pytest.skip("This functionality is only supported in tape mode.")
+
+        dev = qml.device("default.qubit.tf", wires=2, graph_cache_size=4)
+
+        @qml.qnode(dev, interface="tf", diff_method="backprop")
+        def circuit(inputs, weights):
+            qml.templates.AngleEmbedding(inputs, wires=range(2))
+            qml.templates.BasicEntanglerLayers(weights, wires=range(2))
+            qml.RX(0.4, wires=0)
+            return [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))]
+
+        layer = KerasLayer(circuit, {"weights": (1, 2)}, output_dim=2)
+        x = tf.Variable([[0.1, 0.2], [0.3, -0.4], [1.2, 0.7]], dtype=tf.keras.backend.floatx())
+
+        spy = mocker.spy(dev, "vmap_execute")
+
+        with tf.GradientTape() as tape:
+            out = layer(x)
+            loss = tf.reduce_sum(out)
+
+        assert spy.call_count == 1
+        assert out.shape == (3, 2)
+
+        grad_x, grad_weights = tape.gradient(loss, [x, layer.trainable_weights[0]])
+        weights = layer.trainable_weights[0]
+
+        with tf.GradientTape() as tape:
+            expected = tf.stack([circuit(x_, 1.0 * weights) for x_ in tf.unstack(x)])
+            loss = tf.reduce_sum(expected)
+
+        expected_grad_x, expected_grad_weights = tape.gradient(loss, [x, weights])
+
+        assert np.allclose(out, expected, atol=1e-6)
+        assert np.allclose(grad_x, expected_grad_x, atol=1e-6)
+        assert np.allclose(grad_weights, expected_grad_weights, atol=1e-6)
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_call_batch_reversible(self):
+        """Test that the gradients of a batched input agree with evaluating each datapoint
+        when using the reversible method, whose gradient tapes share operations with the
+        tape being differentiated"""
+        if not qml.tape_mode_active():
+            pytest.skip("This functionality is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="tf", diff_method="reversible")
+        def circuit(inputs, weights):
+            qml.templates.BasicEntanglerLayers(weights[:1], wires=range(2))
+            qml.templates.AngleEmbedding(inputs, wires=range(2))
+            qml.templates.BasicEntanglerLayers(weights[1:], wires=range(2))
+            return [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))]
+
+        layer = KerasLayer(circuit, {"weights": (2, 2)}, output_dim=2)
+        x = tf.Variable([[0.1, 0.2], [0.3, -0.4], [1.2, 0.7]], dtype=tf.keras.backend.floatx())
+
+        with tf.GradientTape() as tape:
+            out = layer(x)
+            loss = tf.reduce_sum(out)
+
+        weights = layer.trainable_weights[0]
+        grad_x, grad_weights = tape.gradient(loss, [x, weights])
+
+        with tf.GradientTape() as tape:
+            expected = tf.stack([circuit(x_, 1.0 * weights) for x_ in tf.unstack(x)])
+            loss = tf.reduce_sum(expected)
+
+        expected_grad_x, expected_grad_weights = tape.gradient(loss, [x, weights])
+
+        assert np.allclose(out, expected)
+        assert np.allclose(grad_x, expected_grad_x)
+        assert np.allclose(grad_weights, expected_grad_weights)
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_call_batch_scalar_output(self):
+        """Test that a batched input to a QNode returning a single
+        expectation value results in a one-dimensional output"""
+        if not qml.tape_mode_active():
+            pytest.skip("This functionality is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="tf", diff_method="parameter-shift")
+        def circuit(inputs, weights):
+            qml.templates.AngleEmbedding(inputs, wires=range(2))
+            qml.templates.BasicEntanglerLayers(weights, wires=range(2))
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        layer = KerasLayer(circuit, {"weights": (1, 2)}, output_dim=1)
+        x = tf.constant([[0.1, 0.2], [0.3, -0.4], [1.2, 0.7]])
+
+        out = layer(x)
+        weights = layer.trainable_weights[0]
+        expected = tf.stack([circuit(x_, 1.0 * weights) for x_ in tf.unstack(x)])
+
+        assert out.shape == (3,)
+        assert np.allclose(out, expected)
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_call_tf_function(self, mocker):
+        """Test that batched evaluation of the layer can be traced by tf.function, for
+        an unknown batch size, and agrees with eager evaluation"""
+        if not qml.tape_mode_active():
+            pytest.skip("This functionality is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="tf", diff_method="parameter-shift")
+        def circuit(inputs, weights):
+            qml.RX(inputs[0], wires=0)
+            qml.RX(inputs[1], wires=1)
+            qml.RY(weights[0], wires=0)
+            qml.RY(weights[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))]
+
+        layer = KerasLayer(circuit, {"weights": 2}, output_dim=2, dynamic=False)
+        dtype = tf.keras.backend.floatx()
+
+        @tf.function(input_signature=[tf.TensorSpec([None, 2], dtype=dtype)])
+        def loss_and_grad(x):
+            with tf.GradientTape() as tape:
+                loss = tf.reduce_sum(layer(x) ** 2)
+
+            return loss, tape.gradient(loss, layer.trainable_weights)
+
+        x = tf.constant([[0.1, 0.2], [0.3, -0.4], [1.2, 0.7]], dtype=dtype)
+        spy = mocker.spy(dev, "batch_execute")
+
+        loss, grad = loss_and_grad(x)
+        assert spy.call_count == 2
+
+        # the traced function is reused for a different batch size
+        loss_and_grad(x[:2])
+        assert spy.call_count == 4
+
+        with tf.GradientTape() as tape:
+            expected_loss = tf.reduce_sum(layer(x) ** 2)
+
+        expected_grad = tape.gradient(expected_loss, layer.trainable_weights)
+
+        assert np.allclose(loss, expected_loss)
+        assert np.allclose(grad[0], expected_grad[0])
+
 
 @pytest.mark.parametrize("interface", ["autograd", "torch", "tf"])
 @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
@@ -385,6 +385,105 @@ class TestTorchLayer:
         layer_out = layer.forward(x)
         assert layer_out.shape == torch.Size((2, output_dim))
 
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_forward_batch_single_execution(self, mocker):
+        """Test that the forward and backward passes of a batched input each submit a
+        single batch of circuits to the device, and agree with evaluating each datapoint"""
+        if not qml.tape_mode_active():
+            pytest.skip("This functionality is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="torch")
+        def circuit(inputs, weights):
+            qml.templates.AngleEmbedding(inputs, wires=range(2))
+            qml.templates.BasicEntanglerLayers(weights, wires=range(2))
+            return [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))]
+
+        layer = TorchLayer(circuit, {"weights": (1, 2)})
+        x = torch.tensor([[0.1, 0.2], [0.3, -0.4], [1.2, 0.7]], requires_grad=True)
+
+        spy = mocker.spy(dev, "batch_execute")
+        out = layer(x)
+
+        assert out.shape == (3, 2)
+        assert spy.call_count == 1
+        assert len(spy.call_args[0][0]) == 3
+
+        out.sum().backward()
+
+        # two shifted circuits for each of the four gate parameters, for each datapoint
+        assert spy.call_count == 2
+        assert len(spy.call_args[0][0]) == 3 * 8
+
+        grad_x = x.grad.clone()
+        grad_weights = layer.weights.grad.clone()
+        x.grad = None
+        layer.weights.grad = None
+
+        expected = torch.stack([layer(x_) for x_ in x])
+        expected.sum().backward()
+
+        assert torch.allclose(out, expected)
+        assert torch.allclose(grad_x, x.grad)
+        assert torch.allclose(grad_weights, layer.weights.grad)
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_forward_batch_reversible(self):
+        """Test that the gradients of a batched input agree with evaluating each datapoint
+        when using the reversible method, whose gradient tapes share operations with the
+        tape being differentiated"""
+        if not qml.tape_mode_active():
+            pytest.skip("This functionality is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="torch", diff_method="reversible")
+        def circuit(inputs, weights):
+            qml.templates.BasicEntanglerLayers(weights[:1], wires=range(2))
+            qml.templates.AngleEmbedding(inputs, wires=range(2))
+            qml.templates.BasicEntanglerLayers(weights[1:], wires=range(2))
+            return [qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))]
+
+        layer = TorchLayer(circuit, {"weights": (2, 2)})
+        x = torch.tensor([[0.1, 0.2], [0.3, -0.4], [1.2, 0.7]], requires_grad=True)
+
+        out = layer(x)
+        out.sum().backward()
+
+        grad_x = x.grad.clone()
+        grad_weights = layer.weights.grad.clone()
+        x.grad = None
+        layer.weights.grad = None
+
+        expected = torch.stack([layer(x_) for x_ in x])
+        expected.sum().backward()
+
+        assert torch.allclose(out, expected)
+        assert torch.allclose(grad_x, x.grad)
+        assert torch.allclose(grad_weights, layer.weights.grad)
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_forward_batch_scalar_output(self):
+        """Test that a batched input to a QNode returning a single
+        expectation value results in a one-dimensional output"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="torch")
+        def circuit(inputs, weights):
+            qml.templates.AngleEmbedding(inputs, wires=range(2))
+            qml.templates.BasicEntanglerLayers(weights, wires=range(2))
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        layer = TorchLayer(circuit, {"weights": (1, 2)})
+        x = torch.tensor([[0.1, 0.2], [0.3, -0.4], [1.2, 0.7]])
+
+        out = layer(x)
+        expected = torch.stack([layer(x_) for x_ in x])
+
+        assert out.shape == (3,)
+        assert torch.allclose(out, expected)
+
     @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
     def test_str_repr(self, get_circuit):
         """Test the __str__ and __repr__ representations"""
@@ -119,6 +119,35 @@ class TestAutogradQuantumTape:
         expected = [[-np.sin(a), 0], [np.sin(a) * np.sin(b), -np.cos(a) * np.cos(b)]]
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
+    def test_jacobian_single_batch(self, mocker, tol):
+        """Test that the output and the Jacobian are evaluated in a single batch
+        when the tape is being differentiated"""
+        spy = mocker.spy(JacobianTape, "jacobian")
+
+        x = np.array([0.1, 0.2], requires_grad=True)
+
+        def cost(x, device):
+            with AutogradInterface.apply(JacobianTape()) as tape:
+                qml.RY(x[0], wires=0)
+                qml.RX(x[1], wires=1)
+                qml.CNOT(wires=[0, 1])
+                qml.expval(qml.PauliZ(0))
+                qml.expval(qml.PauliY(1))
+            return tape.execute(device)
+
+        dev = qml.device("default.qubit", wires=2)
+        res = qml.jacobian(cost)(x, device=dev)
+        a, b = x
+
+        # the Jacobian is computed once, and reused for each output
+        spy.assert_called_once()
+
+        # the unshifted tape is shared between the output and the finite differences
+        assert dev.num_executions == 3
+
+        expected = [[-np.sin(a), 0], [np.sin(a) * np.sin(b), -np.cos(a) * np.cos(b)]]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
     def test_jacobian_options(self, mocker, tol):
         """Test setting jacobian options"""
         spy = mocker.spy(JacobianTape, "numeric_pd")
@@ -20,7 +20,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.tape import JacobianTape
-from pennylane.tape.interfaces.tf import TFInterface
+from pennylane.tape.interfaces.tf import TFInterface, batch_execute
 
 
 class TestTFQuantumTape:
@@ -120,6 +120,55 @@ class TestTFQuantumTape:
 
         spy.assert_called()
 
+    def test_jacobian_reused_between_gradients(self, mocker, tol):
+        """Test that the Jacobian is only computed once when computing
+        multiple gradients of the same result"""
+        spy = mocker.spy(JacobianTape, "jacobian")
+        a = tf.Variable(0.1, dtype=tf.float64)
+
+        dev = qml.device("default.qubit", wires=1)
+
+        with tf.GradientTape(persistent=True) as tape:
+            with TFInterface.apply(JacobianTape()) as qtape:
+                qml.RX(a, wires=0)
+                qml.expval(qml.PauliZ(0))
+
+            res = qtape.execute(dev)
+            loss1 = 2 * res
+            loss2 = res ** 2
+
+        grad1 = tape.gradient(loss1, a)
+        grad2 = tape.gradient(loss2, a)
+
+        assert spy.call_count == 1
+        assert np.allclose(grad1, -2 * np.sin(0.1), atol=tol, rtol=0)
+        assert np.allclose(grad2, -2 * np.cos(0.1) * np.sin(0.1), atol=tol, rtol=0)
+
+    def test_eager_jacobian(self, mocker, tol):
+        """Test that the Jacobian is computed during the forward pass
+        if the eager_jacobian option is set"""
+        spy = mocker.spy(JacobianTape, "jacobian")
+        a = tf.Variable(0.1, dtype=tf.float64)
+
+        dev = qml.device("default.qubit", wires=1)
+
+        with tf.GradientTape() as tape:
+            with TFInterface.apply(JacobianTape()) as qtape:
+                qml.RX(a, wires=0)
+                qml.expval(qml.PauliZ(0))
+
+            qtape.jacobian_options = {"eager_jacobian": True}
+            res = qtape.execute(dev)
+
+        assert spy.call_count == 1
+
+        # the output and the Jacobian are computed in a single batch
+        assert dev.num_executions == 2
+
+        grad = tape.gradient(res, a)
+        assert spy.call_count == 1
+        assert np.allclose(grad, -np.sin(0.1), atol=tol, rtol=0)
+
     def test_jacobian_dtype(self, tol):
         """Test calculating the jacobian with a different datatype. Here, we
         specify tf.float32, as opposed to the default value of tf.float64."""
@@ -782,3 +831,95 @@ class TestTFPassthru:
 
         assert res.shape == (2, 10)
         assert isinstance(res, tf.Tensor)
+
+
+class TestBatchExecute:
+    """Tests for evaluating a TF quantum tape for a batch of parameter values"""
+
+    @pytest.mark.parametrize("tape_cls", [JacobianTape, qml.tape.QubitParamShiftTape])
+    def test_batch(self, tape_cls, mocker, tol):
+        """Test that a tape can be evaluated and differentiated for a batch of
+        parameter values, using one device batch for each of the forward and backward pass"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with TFInterface.apply(tape_cls()) as tape:
+            qml.RX(0.0, wires=0)
+            qml.RY(0.0, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RX(0.3, wires=1)
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(1))
+
+        tape.trainable_params = {0, 1}
+
+        x = tf.Variable([0.1, 0.5, -0.3], dtype=tf.float64)
+        y = tf.Variable(0.2, dtype=tf.float64)
+
+        spy = mocker.spy(dev, "batch_execute")
+
+        with tf.GradientTape() as g:
+            res = batch_execute(tape, tf.stack([x, y * x], axis=1), dev)
+            loss = tf.reduce_sum(res)
+
+        assert spy.call_count == 1
+        assert res.shape == (3, 2)
+
+        expected = tf.stack([tf.cos(x), tf.cos(x) * tf.cos(y * x) * np.cos(0.3)], axis=1)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        grad = g.gradient(loss, [x, y])
+        assert spy.call_count == 2
+
+        with tf.GradientTape() as g:
+            expected = tf.stack([tf.cos(x), tf.cos(x) * tf.cos(y * x) * np.cos(0.3)], axis=1)
+            loss = tf.reduce_sum(expected)
+
+        expected_grad = g.gradient(loss, [x, y])
+
+        atol = 1e-6 if tape_cls is JacobianTape else tol
+        assert np.allclose(grad[0], expected_grad[0], atol=atol, rtol=0)
+        assert np.allclose(grad[1], expected_grad[1], atol=atol, rtol=0)
+
+    def test_variance(self, tol):
+        """Test that tapes returning variances are differentiated correctly"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with TFInterface.apply(qml.tape.QubitParamShiftTape()) as tape:
+            qml.RX(0.0, wires=0)
+            qml.var(qml.PauliZ(0))
+
+        tape.trainable_params = {0}
+        x = tf.Variable([[0.1], [0.5], [-0.3]], dtype=tf.float64)
+
+        with tf.GradientTape() as g:
+            res = batch_execute(tape, x, dev)
+
+        assert np.allclose(res, tf.sin(x) ** 2, atol=tol, rtol=0)
+        assert np.allclose(g.gradient(res, x), tf.sin(2 * x), atol=tol, rtol=0)
+
+    def test_tf_function(self, tol):
+        """Test that batched evaluation can be traced by tf.function for an unknown batch size"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with TFInterface.apply(qml.tape.QubitParamShiftTape()) as tape:
+            qml.RX(0.0, wires=0)
+            qml.RY(0.2, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        tape.trainable_params = {0}
+
+        @tf.function(input_signature=[tf.TensorSpec([None, 1], dtype=tf.float64)])
+        def grad_fn(x):
+            with tf.GradientTape() as g:
+                g.watch(x)
+                res = batch_execute(tape, x, dev)
+
+            return res, g.gradient(res, x)
+
+        for batch_size in [3, 5]:
+            x = tf.reshape(tf.linspace(tf.constant(-1.0, tf.float64), 1.0, batch_size), [-1, 1])
+            res, grad = grad_fn(x)
+
+            assert res.shape == (batch_size, 1)
+            assert np.allclose(res, tf.cos(x) * np.cos(0.2), atol=tol, rtol=0)
+            assert np.allclose(grad, -tf.sin(x) * np.cos(0.2), atol=tol, rtol=0)
@@ -20,7 +20,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.tape import JacobianTape
-from pennylane.tape.interfaces.torch import TorchInterface
+from pennylane.tape.interfaces.torch import TorchInterface, batch_execute
 
 
 class TestTorchQuantumTape:
@@ -144,6 +144,74 @@ class TestTorchQuantumTape:
             assert args[1]["order"] == 2
             assert args[1]["h"] == 1e-8
 
+    def test_jacobian_reused_between_backward_passes(self, mocker, tol):
+        """Test that the Jacobian is only computed once when performing multiple
+        backward passes through the same graph"""
+        spy = mocker.spy(JacobianTape, "jacobian")
+
+        a = torch.tensor(0.1, requires_grad=True)
+        dev = qml.device("default.qubit", wires=1)
+
+        with TorchInterface.apply(JacobianTape()) as tape:
+            qml.RX(a, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        res = tape.execute(dev)
+        res.backward(retain_graph=True)
+        res.backward()
+
+        assert spy.call_count == 1
+        assert np.allclose(a.grad, -2 * np.sin(0.1), atol=tol, rtol=0)
+
+    def test_jacobian_memoised(self, mocker, tol):
+        """Test that the Jacobian is memoised across forward passes
+        with the same parameter values"""
+        spy = mocker.spy(JacobianTape, "jacobian")
+
+        a = torch.tensor(0.1, requires_grad=True)
+        dev = qml.device("default.qubit", wires=1)
+
+        with TorchInterface.apply(JacobianTape()) as tape:
+            qml.RX(a, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        tape.execute(dev).backward()
+        tape.execute(dev).backward()
+        assert spy.call_count == 1
+
+        # new parameter values require a new Jacobian
+        b = torch.tensor(0.2, requires_grad=True)
+        tape.execute(dev, params=[b]).backward()
+        assert spy.call_count == 2
+        assert np.allclose(b.grad, -np.sin(0.2), atol=tol, rtol=0)
+
+    def test_eager_jacobian(self, mocker, tol):
+        """Test that the Jacobian is computed during the forward pass
+        if the eager_jacobian option is set"""
+        spy = mocker.spy(JacobianTape, "jacobian")
+
+        a = torch.tensor(0.1, requires_grad=True)
+        dev = qml.device("default.qubit", wires=1)
+
+        with TorchInterface.apply(JacobianTape()) as tape:
+            qml.RX(a, wires=0)
+            qml.RY(torch.tensor(0.2), wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        tape.jacobian_options = {"eager_jacobian": True}
+
+        res = tape.execute(dev)
+        assert spy.call_count == 1
+
+        # the output and the Jacobian are computed in a single batch
+        assert dev.num_executions == 2
+
+        res.backward()
+        assert spy.call_count == 1
+
+        expected = -np.sin(0.1) * np.cos(0.2)
+        assert np.allclose(a.grad, expected, atol=tol, rtol=0)
+
     def test_jacobian_dtype(self, tol):
         """Test calculating the jacobian with a different datatype"""
         a_val = 0.1
@@ -454,3 +522,58 @@ class TestTorchQuantumTape:
             m.setattr(qml.tape.interfaces.torch, "COMPLEX_SUPPORT", False)
             with pytest.raises(qml.QuantumFunctionError, match="Version 1.6.0 or above of PyTorch"):
                 TorchInterface.apply(JacobianTape(), dtype=torch.complex128)
+
+
+class TestBatchExecute:
+    """Tests for evaluating a batch of Torch quantum tapes"""
+
+    @pytest.mark.parametrize("tape_cls", [JacobianTape, qml.tape.QubitParamShiftTape])
+    def test_repeated_tape(self, tape_cls, mocker, tol):
+        """Test that a single tape can be evaluated and differentiated for a batch of
+        parameter values, using one device batch for each of the forward and backward pass"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with TorchInterface.apply(tape_cls()) as tape:
+            qml.RX(torch.tensor(0.0, requires_grad=True), wires=0)
+            qml.RY(torch.tensor(0.0, requires_grad=True), wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(1))
+
+        x = torch.tensor([0.1, 0.5, -0.3], requires_grad=True)
+        y = torch.tensor(0.2, requires_grad=True)
+
+        spy = mocker.spy(dev, "batch_execute")
+        res = batch_execute([tape] * 3, [[x_, y * x_] for x_ in x], dev)
+
+        assert spy.call_count == 1
+        assert res.shape == (3, 2)
+
+        expected = torch.stack([torch.cos(x), torch.cos(x) * torch.cos(y * x)], dim=1)
+        assert np.allclose(res.detach(), expected.detach(), atol=tol, rtol=0)
+
+        res.sum().backward()
+        assert spy.call_count == 2
+
+        grad_x, grad_y = x.grad, y.grad
+        x.grad, y.grad = None, None
+        expected.sum().backward()
+
+        atol = 1e-6 if tape_cls is JacobianTape else tol
+        assert np.allclose(grad_x, x.grad, atol=atol, rtol=0)
+        assert np.allclose(grad_y, y.grad, atol=atol, rtol=0)
+
+    def test_variance(self, tol):
+        """Test that tapes returning variances are differentiated correctly"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with TorchInterface.apply(qml.tape.QubitParamShiftTape()) as tape:
+            qml.RX(torch.tensor(0.0, requires_grad=True), wires=0)
+            qml.var(qml.PauliZ(0))
+
+        x = torch.tensor([0.1, 0.5, -0.3], requires_grad=True)
+        res = batch_execute([tape] * 3, [[x_] for x_ in x], dev)
+        res.sum().backward()
+
+        assert np.allclose(res.detach().flatten(), torch.sin(x).detach() ** 2, atol=tol, rtol=0)
+        assert np.allclose(x.grad, torch.sin(2 * x).detach(), atol=tol, rtol=0)
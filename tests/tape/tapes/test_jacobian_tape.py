@@ -17,6 +17,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.tape import JacobianTape, QuantumTape
+from pennylane.tape.tapes.jacobian_tape import _batch_execute_unique
 
 
 class TestConstruction:
@@ -99,6 +100,30 @@ class TestGradMethod:
         tape._graph = None
         assert tape._grad_method(1, use_graph=False) == "F"
 
+    def test_reachability_computed_once(self, mocker):
+        """Test that the gradient information of all parameters is determined
+        from a single reachability sweep of the circuit graph, rather than
+        a path search per parameter and observable"""
+        with JacobianTape() as tape:
+            for i in range(10):
+                qml.RX(0.1 * i, wires=[i % 3])
+                qml.CNOT(wires=[0, 1])
+            qml.RY(0.5, wires=[3])
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(1))
+
+        spy = mocker.spy(tape.graph, "has_path")
+        sweep = mocker.spy(qml.tape.circuit_graph.nx, "topological_sort")
+
+        tape._update_gradient_info()
+
+        spy.assert_not_called()
+        assert sweep.call_count == 1
+
+        # rotations on wires 2 and 3 do not affect the measured wires
+        methods = [info["grad_method"] for info in tape._par_info.values()]
+        assert methods == ["0" if i % 3 == 2 else "F" for i in range(10)] + ["0"]
+
 
 class TestJacobian:
     """Unit tests for the jacobian method"""
@@ -411,6 +436,295 @@ class TestJacobian:
         assert np.allclose(j1, [exp, 0])
         assert np.allclose(j2, [0, exp])
 
+    def test_duplicate_tapes_executed_once(self, mocker, tol):
+        """Test that identical tapes generated for different parameters
+        are only executed once"""
+        dev = qml.device("default.qubit", wires=2)
+
+        class RX(qml.RX):
+            """RX gate with a gradient recipe that includes the unshifted value"""
+
+            grad_recipe = ([[1, 1, np.pi / 2], [-0.5, 1, 0], [-0.5, 1, np.pi]],)
+
+        x, y = 0.543, -0.654
+
+        with qml.tape.QubitParamShiftTape() as tape:
+            RX(x, wires=[0])
+            RX(y, wires=[1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        spy = mocker.spy(dev, "batch_execute")
+        res = tape.jacobian(dev, method="analytic")
+
+        # 6 tapes are generated, but the unshifted tape is shared by both parameters
+        assert len(spy.call_args[0][0]) == 5
+
+        expected = [-np.sin(x) * np.cos(y), -np.cos(x) * np.sin(y)]
+        assert np.allclose(res, [expected], atol=tol, rtol=0)
+
+    def test_tapes_differing_in_observable_parameters(self, mocker, tol):
+        """Test that tapes that only differ in the parameters of their
+        observables are not treated as duplicates"""
+        dev = qml.device("default.qubit", wires=1)
+        spy = mocker.spy(dev, "batch_execute")
+
+        with JacobianTape() as tape1:
+            qml.RX(0.1, wires=[0])
+            qml.expval(qml.Hermitian(np.diag([1, 2]), wires=0))
+
+        with JacobianTape() as tape2:
+            qml.RX(0.1, wires=[0])
+            qml.expval(qml.Hermitian(np.diag([1, 3]), wires=0))
+
+        res = _batch_execute_unique(dev, [tape1, tape2, tape1])
+
+        assert len(spy.call_args[0][0]) == 2
+        assert np.allclose(res[0], res[2], atol=tol, rtol=0)
+        assert not np.allclose(res[0], res[1], atol=tol, rtol=0)
+
+    def test_non_analytic_not_deduplicated(self, mocker):
+        """Test that identical tapes are executed separately on a non-analytic device,
+        so that their estimates are independent"""
+        dev = qml.device("default.qubit", wires=1, analytic=False, shots=10)
+        spy = mocker.spy(dev, "batch_execute")
+
+        with JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        _batch_execute_unique(dev, [tape, tape, tape])
+        assert len(spy.call_args[0][0]) == 3
+
+    def test_sampled_not_deduplicated(self, mocker):
+        """Test that identical tapes returning samples are executed separately"""
+        dev = qml.device("default.qubit", wires=1, shots=10)
+        spy = mocker.spy(dev, "batch_execute")
+
+        with JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.sample(qml.PauliZ(0))
+
+        _batch_execute_unique(dev, [tape, tape])
+        assert len(spy.call_args[0][0]) == 2
+
+
+class TestCachedJacobian:
+    """Tests for the memoised Jacobian"""
+
+    def test_cache_bounded(self, mocker, monkeypatch):
+        """Test that the most recently used Jacobians are retained, up to
+        the maximum cache size"""
+        monkeypatch.setattr(qml.tape.tapes.jacobian_tape, "_JACOBIAN_CACHE_SIZE", 2)
+        dev = qml.device("default.qubit", wires=1)
+
+        with JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        spy = mocker.spy(tape, "jacobian")
+
+        for x in [0.1, 0.2, 0.1, 0.3]:
+            tape.set_parameters([x])
+            tape._cached_jacobian(dev)
+
+        # 0.1 was reused, 0.2 was evicted by 0.3
+        assert spy.call_count == 3
+        assert len(tape._jacobian_cache) == 2
+
+        tape.set_parameters([0.2])
+        res = tape._cached_jacobian(dev)
+        assert spy.call_count == 4
+        assert np.allclose(res, -np.sin(0.2))
+
+    def test_options_and_devices_distinguished(self, mocker):
+        """Test that Jacobians computed with different options or on different
+        devices are not reused"""
+        dev1 = qml.device("default.qubit", wires=1)
+        dev2 = qml.device("default.qubit", wires=1)
+
+        with JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        spy = mocker.spy(tape, "jacobian")
+
+        tape._cached_jacobian(dev1)
+        tape._cached_jacobian(dev1, order=2)
+        tape._cached_jacobian(dev2)
+        assert spy.call_count == 3
+
+        tape._cached_jacobian(dev1, order=2)
+        assert spy.call_count == 3
+
+    def test_reused_device_id(self, mocker):
+        """Test that a Jacobian is not reused for a different device with the same key,
+        as happens when a new device reuses the id of a garbage collected device"""
+        dev1 = qml.device("default.qubit", wires=1)
+        dev2 = qml.device("default.qubit", wires=1)
+
+        with JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        mocker.patch.object(tape, "_jacobian_cache_key", return_value=("key",))
+        spy = mocker.spy(tape, "jacobian")
+
+        tape._cached_jacobian(dev1)
+        tape._cached_jacobian(dev2)
+        assert spy.call_count == 2
+
+        tape._cached_jacobian(dev2)
+        assert spy.call_count == 2
+
+    def test_sampled_device_not_memoised(self, mocker):
+        """Test that Jacobians estimated from finite samples are not memoised"""
+        dev = qml.device("default.qubit", wires=1, shots=10, analytic=False)
+
+        with JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        spy = mocker.spy(tape, "jacobian")
+
+        tape._cached_jacobian(dev)
+        tape._cached_jacobian(dev)
+        assert spy.call_count == 2
+        assert not tape._jacobian_cache
+
+
+class TestExecuteAndJacobian:
+    """Tests for evaluating the tape and its Jacobian in a single batch"""
+
+    def test_parameter_shift_single_batch(self, mocker, tol):
+        """Test that the tape output and the parameter-shift Jacobian are
+        computed using a single batch execution"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QubitParamShiftTape() as tape:
+            qml.RX(0.432, wires=0)
+            qml.RY(0.543, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(1))
+
+        expected_res = tape.execute(dev)
+        expected_jac = tape.jacobian(dev)
+
+        spy_batch = mocker.spy(dev, "batch_execute")
+        spy_execute = mocker.spy(tape, "execute_device")
+
+        res, jac = tape.execute_and_jacobian(dev)
+
+        spy_batch.assert_called_once()
+        spy_execute.assert_not_called()
+        assert len(spy_batch.call_args[0][0]) == 1 + 2 * 2
+
+        assert np.allclose(res, expected_res, atol=tol, rtol=0)
+        assert np.allclose(jac, expected_jac, atol=tol, rtol=0)
+
+    def test_finite_differences(self, tol):
+        """Test that forward finite differences reuse the tape output
+        as the unshifted evaluation for every parameter"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with JacobianTape() as tape:
+            qml.RX(0.432, wires=0)
+            qml.RY(0.543, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        params = [0.1, 0.2]
+        res, jac = tape.execute_and_jacobian(dev, params=params)
+
+        assert dev.num_executions == len(params) + 1
+        assert tape.get_parameters() == [0.432, 0.543]
+
+        assert np.allclose(res, np.cos(0.1) * np.cos(0.2), atol=tol, rtol=0)
+        expected = [[-np.sin(0.1) * np.cos(0.2), -np.cos(0.1) * np.sin(0.2)]]
+        assert np.allclose(jac, expected, atol=tol, rtol=0)
+
+    def test_no_trainable_parameters(self, tol):
+        """Test that the tape output is still computed if the Jacobian
+        does not require any device executions"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with JacobianTape() as tape:
+            qml.RX(0.432, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        tape.trainable_params = {}
+        res, jac = tape.execute_and_jacobian(dev)
+
+        assert np.allclose(res, np.cos(0.432), atol=tol, rtol=0)
+        assert jac.shape == (1, 0)
+
+
+class TestJacobianTapes:
+    """Tests for generating the tapes required for the Jacobian without executing them"""
+
+    def test_agrees_with_jacobian(self, tol):
+        """Test that post-processing the executed tapes results in the Jacobian"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QubitParamShiftTape() as tape:
+            qml.RX(0.432, wires=0)
+            qml.RY(0.543, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tapes, fn = tape.jacobian_tapes(dev)
+
+        assert len(tapes) == 4
+        assert dev.num_executions == 0
+
+        res = fn(dev.batch_execute(tapes))
+        assert np.allclose(res, tape.jacobian(dev), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("method", ["analytic", "numeric"])
+    def test_include_forward(self, method, tol):
+        """Test that the tape output is the first of the generated tapes if requested"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.QubitParamShiftTape() as tape:
+            qml.RX(0.432, wires=0)
+            qml.RY(0.543, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        params = [0.1, 0.2]
+        tapes, fn = tape.jacobian_tapes(dev, params=params, include_forward=True, method=method)
+        results = dev.batch_execute(tapes)
+
+        assert dev.num_executions == len(tapes)
+        assert np.allclose(results[0], np.cos(0.1) * np.cos(0.2), atol=tol, rtol=0)
+
+        expected = [[-np.sin(0.1) * np.cos(0.2), -np.cos(0.1) * np.sin(0.2)]]
+        assert np.allclose(fn(results), expected, atol=1e-6 if method == "numeric" else tol, rtol=0)
+
+    def test_several_tapes(self, tol):
+        """Test that the tapes required for the Jacobians of several
+        tapes can be executed in a single batch"""
+        dev = qml.device("default.qubit", wires=1)
+        all_tapes = []
+        fns = []
+
+        for x in [0.1, 0.2, 0.3]:
+            with JacobianTape() as tape:
+                qml.RX(x, wires=0)
+                qml.expval(qml.PauliZ(0))
+
+            tapes, fn = tape.jacobian_tapes(dev, include_forward=True)
+            all_tapes.extend(tapes)
+            fns.append((len(tapes), fn))
+
+        results = dev.batch_execute(all_tapes)
+        start = 0
+
+        for x, (num_tapes, fn) in zip([0.1, 0.2, 0.3], fns):
+            res = results[start : start + num_tapes]
+            start += num_tapes
+
+            assert np.allclose(res[0], np.cos(x), atol=tol, rtol=0)
+            assert np.allclose(fn(res), -np.sin(x), atol=1e-6, rtol=0)
+
 
 class TestJacobianIntegration:
     """Integration tests for the Jacobian method"""
@@ -274,12 +274,13 @@ class TestTapeConstruction:
         expected = qn.qtape.execute(dev)
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-        # when called, a new quantum tape is constructed
+        # when called with an unchanged circuit structure,
+        # the previously constructed quantum tape is reused
         old_tape = qn.qtape
         res2 = qn(x, y)
 
         assert np.allclose(res, res2, atol=tol, rtol=0)
-        assert qn.qtape is not old_tape
+        assert qn.qtape is old_tape
 
     def test_jacobian(self, tol):
         """Test the jacobian computation"""
@@ -713,12 +714,13 @@ class TestDecorator:
         expected = func.qtape.execute(dev)
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-        # when called, a new quantum tape is constructed
+        # when called with an unchanged circuit structure,
+        # the previously constructed quantum tape is reused
         old_tape = func.qtape
         res2 = func(x, y)
 
         assert np.allclose(res, res2, atol=tol, rtol=0)
-        assert func.qtape is not old_tape
+        assert func.qtape is old_tape
 
 
 class TestQNodeCollection:
@@ -915,3 +917,135 @@ class TestMutability:
         # test differentiability. The circuit will assume an RZ gate
         grad = qml.grad(circuit)(-0.5)
         np.testing.assert_allclose(grad, 0, atol=tol, rtol=0)
+
+
+class TestStructureCaching:
+    """Tests for the reuse of constructed tapes when the circuit structure is unchanged"""
+
+    def test_tape_reused(self, mocker, tol):
+        """Test that the constructed tape is reused and not re-expanded
+        if the structure of the quantum function does not change"""
+        from pennylane import numpy as anp
+
+        dev = qml.device("default.qubit", wires=2)
+
+        class MyRot(qml.operation.Operation):
+            num_params = 3
+            num_wires = 1
+            par_domain = "R"
+            grad_method = "A"
+
+            @staticmethod
+            def decomposition(a, b, c, wires):
+                return [qml.RZ(a, wires=wires), qml.RY(b, wires=wires), qml.RZ(c, wires=wires)]
+
+        @qnode(dev)
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            MyRot(y[0], y[1], y[2], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        def expected(x, y):
+            return np.cos(x) * np.cos(y[1])
+
+        spy = mocker.spy(JacobianTape, "expand")
+
+        x = anp.array(0.1, requires_grad=True)
+        y = anp.array([0.2, 0.3, 0.4], requires_grad=True)
+        res = circuit(x, y)
+        tape = circuit.qtape
+
+        assert np.allclose(res, expected(x, y), atol=tol, rtol=0)
+        assert [op.name for op in tape.operations] == ["RX", "RZ", "RY", "RZ", "CNOT"]
+        spy.assert_called_once()
+
+        x = anp.array(-0.5, requires_grad=True)
+        y = anp.array([1.2, -0.6, 0.1], requires_grad=True)
+        res = circuit(x, y)
+
+        assert circuit.qtape is tape
+        assert np.allclose(res, expected(x, y), atol=tol, rtol=0)
+        spy.assert_called_once()
+
+        # test differentiability
+        grad = qml.grad(circuit)(x, y)
+        expected_grad = [-np.sin(x) * np.cos(y[1]), [0, -np.cos(x) * np.sin(y[1]), 0]]
+        assert np.allclose(grad[0], expected_grad[0], atol=tol, rtol=0)
+        assert np.allclose(grad[1], expected_grad[1], atol=tol, rtol=0)
+
+    def test_trainability_updated(self, tol):
+        """Test that the trainable parameters of a reused tape are updated"""
+        from pennylane import numpy as anp
+
+        dev = qml.device("default.qubit", wires=1)
+
+        @qnode(dev, diff_method="parameter-shift")
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        x = anp.array(0.1, requires_grad=False)
+        y = anp.array(0.2, requires_grad=True)
+        circuit(x, y)
+        tape = circuit.qtape
+        assert tape.trainable_params == {1}
+
+        grad = qml.grad(circuit)(x, y)
+        assert np.allclose(grad, -np.cos(x) * np.sin(y), atol=tol, rtol=0)
+
+        x = anp.array(0.3, requires_grad=True)
+        y = anp.array(0.4, requires_grad=True)
+        circuit(x, y)
+        assert circuit.qtape is tape
+        assert tape.trainable_params == {0, 1}
+
+        grad = qml.grad(circuit)(x, y)
+        expected = [-np.sin(x) * np.cos(y), -np.cos(x) * np.sin(y)]
+        assert np.allclose(grad, expected, atol=tol, rtol=0)
+
+    def test_structure_change(self, tol):
+        """Test that the tape is reconstructed if the structure changes"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qnode(dev)
+        def circuit(x, wire):
+            qml.RX(x, wires=wire)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit(0.5, wire=0)
+        tape = circuit.qtape
+
+        res = circuit(0.5, wire=1)
+        assert circuit.qtape is not tape
+        assert circuit.qtape.operations[0].wires.tolist() == [1]
+        assert np.allclose(res, 1, atol=tol, rtol=0)
+
+    def test_processed_parameters_not_cached(self, tol):
+        """Test that a tape is not reused if the device expansion
+        performs classical processing of the recorded parameters"""
+        dev = qml.device("default.qubit", wires=1)
+
+        class DoubleRX(qml.operation.Operation):
+            num_params = 1
+            num_wires = 1
+            par_domain = "R"
+            grad_method = "A"
+
+            @staticmethod
+            def decomposition(x, wires):
+                return [qml.RX(2 * x, wires=wires)]
+
+        @qnode(dev)
+        def circuit(x):
+            DoubleRX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        res = circuit(0.1)
+        tape = circuit.qtape
+        assert np.allclose(res, np.cos(0.2), atol=tol, rtol=0)
+
+        res = circuit(0.3)
+        assert circuit.qtape is not tape
+        assert np.allclose(res, np.cos(0.6), atol=tol, rtol=0)
@@ -579,6 +579,47 @@ class TestHessian:
 
         assert np.allclose(autograd_val, manualgrad_val, atol=tol, rtol=0)
 
+    def test_hessian_single_deduplicated_batch(self, mocker, tol):
+        """Test that the Hessian is computed from a single batch execution over the
+        upper triangle, with the unshifted tape of the diagonal elements
+        only executed once."""
+        dev = qml.device("default.qubit", wires=3)
+        params = np.array([0.1, -0.4, 0.8])
+
+        with QubitParamShiftTape() as tape:
+            qml.RX(params[0], wires=[0])
+            qml.RY(params[1], wires=[1])
+            qml.RX(params[2], wires=[2])
+            qml.CNOT(wires=[0, 1])
+            qml.CNOT(wires=[1, 2])
+            qml.expval(qml.PauliZ(2))
+
+        spy = mocker.spy(dev, "batch_execute")
+        res = tape.hessian(dev)
+
+        spy.assert_called_once()
+
+        # 4 tapes for each of the 3 off-diagonal elements, 1 shifted tape per diagonal
+        # element, and a single unshifted tape
+        P = len(params)
+        assert len(spy.call_args[0][0]) == 2 * P ** 2 - P + 1
+
+        assert np.allclose(res, res.T, atol=tol, rtol=0)
+
+        shift = np.eye(P) * np.pi / 2
+        expected = np.zeros([P, P])
+
+        for i in range(P):
+            for j in range(P):
+                expected[i, j] = (
+                    tape.execute(dev, params=params + shift[i] + shift[j])
+                    - tape.execute(dev, params=params - shift[i] + shift[j])
+                    - tape.execute(dev, params=params + shift[i] - shift[j])
+                    + tape.execute(dev, params=params - shift[i] - shift[j])
+                ) / 4
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
     def test_no_trainable_params_hessian(self):
         """Test that an empty Hessian is returned when there are no trainable
         parameters."""
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Unit tests for the QuantumTape"""
 import copy
+from collections import OrderedDict
 
 import numpy as np
 import pytest
@@ -306,6 +307,74 @@ class TestGraph:
         spy.assert_called_once()
 
 
+class TestStructure:
+    """Tests for the hashable tape structure"""
+
+    @staticmethod
+    def make_tape(x, y, wire=0):
+        """Construct a tape with the given parameter values"""
+        with QuantumTape() as tape:
+            qml.BasisState(np.array([1, 0]), wires=[0, 1])
+            qml.RX(x, wires=wire)
+            qml.Rot(*y, wires=1)
+
+            with QuantumTape():
+                qml.CNOT(wires=[0, 1])
+
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+            qml.probs(wires=[0, 1])
+
+        return tape
+
+    def test_parameter_values_ignored(self):
+        """Test that tapes differing only in parameter values have the same structure"""
+        tape1 = self.make_tape(0.1, [0.2, 0.3, 0.4])
+        tape2 = self.make_tape(-0.5, np.array([1.2, 0.1, 0.0]))
+
+        assert tape1.get_structure() == tape2.get_structure()
+        assert hash(tape1.get_structure()) == hash(tape2.get_structure())
+
+    def test_wires_change_structure(self):
+        """Test that tapes acting on different wires have different structures"""
+        tape1 = self.make_tape(0.1, [0.2, 0.3, 0.4], wire=0)
+        tape2 = self.make_tape(0.1, [0.2, 0.3, 0.4], wire=1)
+        assert tape1.get_structure() != tape2.get_structure()
+
+    def test_operations_change_structure(self):
+        """Test that tapes with different operations or measurements
+        have different structures"""
+        with QuantumTape() as tape1:
+            qml.RX(0.1, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with QuantumTape() as tape2:
+            qml.RY(0.1, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with QuantumTape() as tape3:
+            qml.RX(0.1, wires=0)
+            qml.var(qml.PauliZ(0))
+
+        with QuantumTape() as tape4:
+            qml.RX(0.1, wires=0).inv()
+            qml.expval(qml.PauliZ(0))
+
+        structures = {t.get_structure() for t in [tape1, tape2, tape3, tape4]}
+        assert len(structures) == 4
+
+    def test_parameter_shapes_change_structure(self):
+        """Test that tapes with parameters of different shapes have different structures"""
+        with QuantumTape() as tape1:
+            qml.QubitUnitary(np.eye(2), wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with QuantumTape() as tape2:
+            qml.QubitUnitary(np.eye(4), wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        assert tape1.get_structure() != tape2.get_structure()
+
+
 class TestResourceEstimation:
     """Tests for verifying resource counts and depths of tapes."""
 
@@ -861,6 +930,173 @@ class TestExpand:
 
             assert qnode.qtape.is_sampled
 
+    def test_deeply_nested_expansion(self):
+        """Test that deeply nested tapes can be expanded without
+        exceeding the recursion limit"""
+        inner = QuantumTape()
+        inner._ops = [qml.RX(0.1, wires=0, do_queue=False)]
+
+        for _ in range(3000):
+            outer = QuantumTape()
+            outer._ops = [inner]
+            inner = outer
+
+        new_tape = outer.expand(depth=4000)
+        assert len(new_tape.operations) == 1
+        assert new_tape.operations[0].name == "RX"
+        assert new_tape.get_parameters() == [0.1]
+
+
+class TestDecompositionCache:
+    """Tests for the caching of operation decompositions during tape expansion"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, monkeypatch):
+        """Use an empty decomposition cache"""
+        monkeypatch.setattr(qml.tape.tapes.tape, "_DECOMPOSITION_CACHE", OrderedDict())
+
+    def test_cached_decomposition(self, mocker):
+        """Test that the decomposition of an operation is only
+        executed once for operations of the same type and number of wires"""
+        spy = mocker.spy(qml.Rot, "decomposition")
+
+        with QuantumTape() as tape:
+            qml.Rot(0.1, 0.2, 0.3, wires=0)
+            qml.Rot(0.4, 0.5, 0.6, wires="a")
+
+        new_tape = tape.expand()
+        spy.assert_called_once()
+
+        assert [op.name for op in new_tape.operations] == ["RZ", "RY", "RZ"] * 2
+        assert [op.wires.tolist() for op in new_tape.operations] == [[0]] * 3 + [["a"]] * 3
+        assert new_tape.get_parameters() == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+
+        # expanding again reuses the cached decomposition
+        new_tape = tape.expand()
+        spy.assert_called_once()
+        assert new_tape.get_parameters() == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+
+        # expanded operations are new objects
+        new_tape.set_parameters([1, 2, 3, 4, 5, 6])
+        assert tape.get_parameters() == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+
+    @pytest.mark.parametrize(
+        "op,modify,names,params",
+        [
+            (
+                qml.S(wires=0),
+                lambda t: t.set_parameters([0.123], trainable_only=False),
+                ["PhaseShift"],
+                [np.pi / 2],
+            ),
+            (
+                qml.Rot(0.1, 0.2, 0.3, wires=0),
+                lambda t: [op.inv() for op in t.operations],
+                ["RZ", "RY", "RZ"],
+                [0.1, 0.2, 0.3],
+            ),
+        ],
+    )
+    def test_modified_decomposition_not_cached(self, op, modify, names, params):
+        """Test that modifying the first expansion of an operation does not
+        affect later expansions of operations of the same type"""
+        tape = QuantumTape()
+        tape._ops = [op]
+
+        modify(tape.expand())
+        new_tape = tape.expand()
+
+        assert [o.name for o in new_tape.operations] == names
+        assert np.allclose(new_tape.get_parameters(trainable_only=False), params)
+
+    def test_cache_least_recently_used(self, monkeypatch):
+        """Test that the least recently used decomposition recipe is evicted"""
+        monkeypatch.setattr(qml.tape.tapes.tape, "_DECOMPOSITION_CACHE_SIZE", 2)
+        cache = qml.tape.tapes.tape._DECOMPOSITION_CACHE
+
+        def expand(op):
+            tape = QuantumTape()
+            tape._ops = [op]
+            tape.expand()
+
+        expand(qml.Rot(0.1, 0.2, 0.3, wires=0))
+        expand(qml.S(wires=0))
+        expand(qml.Rot(0.4, 0.5, 0.6, wires=0))
+        expand(qml.T(wires=0))
+
+        assert [key[0] for key in cache] == [qml.Rot, qml.T]
+
+    def test_cached_inverse_decomposition(self):
+        """Test that inverted operations are cached separately"""
+        with QuantumTape() as tape:
+            qml.Rot(0.1, 0.2, 0.3, wires=0)
+            qml.Rot(0.4, 0.5, 0.6, wires=0).inv()
+            qml.Rot(0.7, 0.8, 0.9, wires=0).inv()
+
+        new_tape = tape.expand()
+
+        assert [op.name for op in new_tape.operations] == [
+            "RZ",
+            "RY",
+            "RZ",
+            "RZ.inv",
+            "RY.inv",
+            "RZ.inv",
+            "RZ.inv",
+            "RY.inv",
+            "RZ.inv",
+        ]
+        assert new_tape.get_parameters() == [0.1, 0.2, 0.3, 0.6, 0.5, 0.4, 0.9, 0.8, 0.7]
+
+    def test_cached_decomposition_wire_mapping(self):
+        """Test that the wires of cached multi-qubit decompositions are correctly mapped"""
+        with QuantumTape() as tape:
+            qml.CSWAP(wires=[0, 1, 2])
+            qml.CSWAP(wires=["c", "b", "a"])
+
+        new_tape = tape.expand()
+        ops = new_tape.operations
+        n = len(ops) // 2
+
+        wire_map = {0: "c", 1: "b", 2: "a"}
+        assert [op.name for op in ops[:n]] == [op.name for op in ops[n:]]
+        assert [[wire_map[w] for w in op.wires.labels] for op in ops[:n]] == [
+            list(op.wires.labels) for op in ops[n:]
+        ]
+
+    def test_parameter_processing_not_cached(self, mocker):
+        """Test that decompositions that process the operation
+        parameters are not cached"""
+        spy = mocker.spy(qml.CRot, "decomposition")
+
+        with QuantumTape() as tape:
+            qml.CRot(0.1, 0.2, 0.3, wires=[0, 1])
+            qml.CRot(0.4, 0.5, 0.6, wires=[0, 1])
+
+        new_tape = tape.expand()
+        assert spy.call_count == 2
+
+        expected = qml.CRot.decomposition(0.1, 0.2, 0.3, wires=[0, 1])
+        expected += qml.CRot.decomposition(0.4, 0.5, 0.6, wires=[0, 1])
+        assert [op.name for op in new_tape.operations] == [op.name for op in expected]
+        assert np.allclose(
+            new_tape.get_parameters(trainable_only=False), [p for op in expected for p in op.data]
+        )
+
+    def test_parameter_values_not_cached(self):
+        """Test that decompositions that depend on parameter values are not cached"""
+        with QuantumTape() as tape:
+            qml.BasisState(np.array([1, 0]), wires=[0, 1])
+
+        new_tape = tape.expand()
+        assert [op.wires.tolist() for op in new_tape.operations] == [[0]]
+
+        with QuantumTape() as tape:
+            qml.BasisState(np.array([0, 1]), wires=[0, 1])
+
+        new_tape = tape.expand()
+        assert [op.wires.tolist() for op in new_tape.operations] == [[1]]
+
 class TestExecution:
     """Tests for tape execution"""
 
@@ -1119,6 +1355,38 @@ class TestExecution:
         new_tape = tape.expand()
         new_tape.execute(dev)
 
+    def test_non_pauli_observables_same_wire(self, tol):
+        """Test that an error is raised when observables that are not Pauli words are
+        evaluated on the same wire of a device supporting observable groups, without
+        first running tape.expand()."""
+        dev = qml.device("default.qubit", wires=1)
+
+        with QuantumTape() as tape:
+            qml.RY(0.3, wires=0)
+            qml.expval(qml.Hermitian(np.diag([1, -1]), wires=0))
+            qml.expval(qml.PauliX(0))
+
+        with pytest.raises(qml.QuantumFunctionError, match="Multiple observables are being"):
+            tape.execute(dev)
+
+    def test_observable_groups_same_wire(self, tol):
+        """Test that devices supporting observable groups evaluate observables that are not
+        qubit-wise commuting on the same wire, without first running tape.expand()."""
+        dev = qml.device("default.qubit", wires=2)
+
+        with QuantumTape() as tape:
+            qml.RY(0.4, wires=0)
+            qml.RX(0.2, wires=1)
+            qml.expval(qml.PauliX(0) @ qml.PauliZ(1))
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliY(1))
+
+        res = tape.execute(dev)
+        expected = [np.sin(0.4) * np.cos(0.2), np.cos(0.4), -np.sin(0.2)]
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert dev.num_executions == 1
+
 
 class TestCVExecution:
     """Tests for CV tape execution"""
@@ -538,6 +538,112 @@ class TestMetricTensor:
         assert np.allclose(G, G_expected, atol=tol, rtol=0)
 
 
+def layered_circuit(params):
+    """Circuit with several parametrized layers, including a Hermitian generator,
+    and parametrized layers that do not depend on all of the preceding operations"""
+    qml.RX(params[0], wires=0)
+    qml.RY(params[1], wires=1)
+    qml.CNOT(wires=[0, 1])
+    qml.PhaseShift(params[2], wires=2)
+    qml.RZ(params[3], wires=0)
+    qml.CNOT(wires=[1, 2])
+    qml.Rot(params[4], params[5], params[6], wires=1)
+    qml.CZ(wires=[2, 0])
+    qml.RY(params[7], wires=0)
+    qml.RX(params[8], wires=2)
+    return qml.expval(qml.PauliZ(0) @ qml.PauliX(2))
+
+
+class TestSinglePassMetricTensor:
+    """Tests for the single pass evaluation of the metric tensor on state-vector simulators"""
+
+    params = np.array([0.1, -0.7, 1.1, 0.3, 0.5, 1.2, -1.3, 0.4, -0.2])
+
+    @pytest.mark.parametrize("diag_approx", [False, True])
+    @pytest.mark.parametrize("diff_method", ["parameter-shift", "backprop"])
+    def test_agrees_with_transform(self, diag_approx, diff_method, tol):
+        """Test that the single pass metric tensor agrees with
+        the metric tensor tape transform"""
+        dev = qml.device("default.qubit", wires=3)
+        circuit = qml.QNode(layered_circuit, dev, diff_method=diff_method)
+
+        expected = qml.metric_tensor(circuit, diag_approx=diag_approx)(self.params)
+        res = qml.metric_tensor(circuit, diag_approx=diag_approx, differentiable=False)(
+            self.params
+        )
+
+        assert res.shape == (9, 9)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_device_method(self, tol):
+        """Test that the device method agrees with the tape transform, and
+        simulates the circuit without executing any further tapes"""
+        dev = qml.device("default.qubit", wires=3)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.BasisState(np.array([1, 0, 1]), wires=[0, 1, 2])
+            layered_circuit(self.params)
+
+        tapes, fn = qml.tape.transforms.metric_tensor(tape)
+        expected = fn([t.execute(dev) for t in tapes])
+
+        num_executions = dev.num_executions
+        res = dev.metric_tensor(tape)
+
+        assert dev.num_executions == num_executions
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_wrt(self, tol):
+        """Test that the metric tensor can be restricted to a subset of the parameters"""
+        dev = qml.device("default.qubit", wires=3)
+
+        with qml.tape.QuantumTape() as tape:
+            layered_circuit(self.params)
+
+        tapes, fn = qml.tape.transforms.metric_tensor(tape, wrt=[1, 3, 4])
+        expected = fn([t.execute(dev) for t in tapes])
+        res = dev.metric_tensor(tape, wrt=[1, 3, 4])
+
+        assert res.shape == (3, 3)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_tapes_not_executed(self, mocker):
+        """Test that no metric tensor tapes are constructed or executed"""
+        dev = qml.device("default.qubit", wires=3)
+        circuit = qml.QNode(layered_circuit, dev, diff_method="parameter-shift")
+
+        spy = mocker.spy(qml.tape.transforms, "metric_tensor")
+        spy_device = mocker.spy(dev, "metric_tensor")
+        qml.metric_tensor(circuit, differentiable=False)(self.params)
+
+        spy.assert_not_called()
+        spy_device.assert_called_once()
+
+    def test_non_analytic_device(self, mocker):
+        """Test that the tape transform is used on non-analytic devices"""
+        dev = qml.device("default.qubit", wires=3, analytic=False)
+        circuit = qml.QNode(layered_circuit, dev, diff_method="parameter-shift")
+
+        spy = mocker.spy(qml.tape.transforms, "metric_tensor")
+        qml.metric_tensor(circuit, differentiable=False)(self.params)
+
+        spy.assert_called_once()
+
+    def test_qng_optimizer(self, mocker):
+        """Test that the QNG optimizer uses the single pass metric tensor"""
+        dev = qml.device("default.qubit", wires=3)
+
+        circuit = qml.QNode(layered_circuit, dev)
+        spy = mocker.spy(qml.devices.DefaultQubit, "metric_tensor")
+
+        opt = qml.QNGOptimizer(stepsize=0.1, lam=0.01)
+        opt.step(circuit, self.params)
+
+        spy.assert_called_once()
+        expected = qml.metric_tensor(circuit)(self.params) + 0.01 * np.identity(9)
+        assert np.allclose(opt.metric_tensor, expected)
+
+
 @pytest.mark.parametrize("diff_method", ["parameter-shift", "backprop"])
 class TestDifferentiability:
     """Test for metric tensor differentiability"""
@@ -15,14 +15,22 @@
 Unit tests for the circuit implementations required in measurement optimization found in
 `grouping/transformations.py`.
 """
+import functools
+
 import pytest
 import numpy as np
 from pennylane import PauliX, PauliY, PauliZ, Identity, Hadamard, Hermitian, RX, RY, U3
+from pennylane.operation import Tensor
+from pennylane.utils import expand
+from pennylane.wires import Wires
 from pennylane.grouping.utils import are_identical_pauli_words
 from pennylane.grouping.transformations import (
     qwc_rotation,
     diagonalize_pauli_word,
     diagonalize_qwc_pauli_words,
+    commuting_rotation,
+    diagonalize_commuting_pauli_words,
+    diagonalize_commuting_groupings,
 )
 
 
@@ -183,3 +191,102 @@ class TestMeasurementTransformations:
         qubit-wise commuting Pauli words."""
 
         assert pytest.raises(ValueError, diagonalize_qwc_pauli_words, not_qwc_grouping)
+
+
+BITS_PAULI = {(0, 0): Identity, (1, 0): PauliX, (1, 1): PauliY, (0, 1): PauliZ}
+
+
+def random_commuting_grouping(seed, n_qubits=4, n_words=6):
+    """Returns a random list of distinct, mutually commuting Pauli words."""
+    rng = np.random.default_rng(seed)
+    binary = []
+
+    while len(binary) < n_words:
+        x, z = rng.integers(0, 2, (2, n_qubits))
+        commutes = all((x @ z_b + z @ x_b) % 2 == 0 for x_b, z_b in binary)
+        new = not any(np.array_equal(x, x_b) and np.array_equal(z, z_b) for x_b, z_b in binary)
+
+        if (x | z).any() and commutes and new:
+            binary.append((x, z))
+
+    return [
+        Tensor(*[BITS_PAULI[(x_i, z_i)](i) for i, (x_i, z_i) in enumerate(zip(x, z))])
+        for x, z in binary
+    ]
+
+
+def full_matrix(ops, wires):
+    """Returns the matrix of a sequence of operations, or of an observable, acting on ``wires``."""
+    if not isinstance(ops, list):
+        return expand(ops.matrix, ops.wires, wires)
+
+    return functools.reduce(
+        lambda u, op: expand(op.matrix, op.wires, wires) @ u, ops, np.eye(2 ** len(wires))
+    )
+
+
+class TestCommutingTransformations:
+    """Tests for the Clifford circuits diagonalizing groupings of fully commuting Pauli words."""
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_diagonalize_commuting_pauli_words(self, seed):
+        """Tests that the rotated Pauli words are equal to the signed diagonal observables."""
+        grouping = random_commuting_grouping(seed)
+        wires = Wires(range(4))
+
+        unitary, diag_terms, signs = diagonalize_commuting_pauli_words(grouping)
+        u = full_matrix(unitary, wires)
+
+        assert all(op.name in ("Hadamard", "S", "CNOT") for op in unitary)
+
+        for pauli, diag, sign in zip(grouping, diag_terms, signs):
+            assert all(o.name in ("PauliZ", "Identity") for o in getattr(diag, "obs", [diag]))
+            rotated = u @ full_matrix(pauli, wires) @ u.conj().T
+            assert np.allclose(rotated, sign * full_matrix(diag, wires))
+
+    def test_signs(self):
+        """Tests that a sign is returned for Pauli words whose product carries a phase."""
+        grouping = [PauliX(0) @ PauliX(1), PauliZ(0) @ PauliZ(1), PauliY(0) @ PauliY(1)]
+        _, diag_terms, signs = diagonalize_commuting_pauli_words(grouping)
+
+        assert are_identical_pauli_words(diag_terms[2], PauliZ(0) @ PauliZ(1))
+        assert signs == [1, 1, -1]
+
+    def test_wire_labels(self):
+        """Tests that the rotation and diagonal observables act on the wires of the Pauli words."""
+        grouping = [PauliX("a") @ PauliX("b"), PauliZ("a") @ PauliZ("b")]
+        unitary, diag_terms, _ = diagonalize_commuting_pauli_words(grouping)
+
+        assert [op.wires for op in unitary] == [Wires(["a", "b"]), Wires(["a"])]
+        assert are_identical_pauli_words(diag_terms[0], PauliZ("a"))
+        assert are_identical_pauli_words(diag_terms[1], PauliZ("b"))
+
+    def test_qwc_grouping(self):
+        """Tests that qubit-wise commuting Pauli words are diagonalized by single-qubit gates."""
+        grouping = [PauliX(0) @ PauliZ(1), PauliX(0) @ PauliY(2), PauliY(2)]
+        unitary = commuting_rotation(grouping)
+
+        assert all(len(op.wires) == 1 for op in unitary)
+
+    def test_diagonalize_commuting_groupings(self):
+        """Tests that each grouping is diagonalized separately."""
+        groupings = [random_commuting_grouping(0), random_commuting_grouping(1)]
+        rotations, diag_groupings, sign_groupings = diagonalize_commuting_groupings(groupings)
+
+        for i, grouping in enumerate(groupings):
+            unitary, diag_terms, signs = diagonalize_commuting_pauli_words(grouping)
+
+            assert [op.name for op in rotations[i]] == [op.name for op in unitary]
+            assert all(
+                are_identical_pauli_words(d1, d2) for d1, d2 in zip(diag_groupings[i], diag_terms)
+            )
+            assert sign_groupings[i] == signs
+
+    @pytest.mark.parametrize(
+        "grouping",
+        [[PauliX("a"), PauliY("a")], [PauliX(0) @ PauliZ(1), PauliZ(0) @ PauliZ(1)]],
+    )
+    def test_not_commuting_catch(self, grouping):
+        """Tests that a ValueError is raised if the Pauli words do not commute."""
+        with pytest.raises(ValueError, match="not mutually commuting"):
+            diagonalize_commuting_pauli_words(grouping)
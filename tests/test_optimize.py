@@ -849,3 +849,217 @@ class TestOverOpts:
         assert x_seperate == pytest.approx(args_new[0], abs=tol)
         assert y_seperate == pytest.approx(args_new[1], abs=tol)
         assert z_seperate == pytest.approx(args_new[2], abs=tol)
+
+
+class TestBatchedRotoOptimizers:
+    """Tests for the Jacobi sweeps and batched evaluation of the Rotosolve
+    and Rotoselect optimizers"""
+
+    @staticmethod
+    def jacobi_step(f, x):
+        """Helper function updating all parameters simultaneously"""
+        x = onp.array(x, dtype=float)
+        x_new = x.copy()
+
+        for d, _ in enumerate(x):
+            H = []
+
+            for theta in [0, np.pi / 2, -np.pi / 2]:
+                x_shifted = x.copy()
+                x_shifted[d] = theta
+                H.append(float(f(x_shifted)))
+
+            x_new[d] = -np.pi / 2 - onp.arctan2(2 * H[0] - H[1] - H[2], H[1] - H[2])
+
+            if x_new[d] <= -np.pi:
+                x_new[d] += 2 * np.pi
+        return x_new
+
+    @staticmethod
+    def circuit():
+        """Returns a QNode with three parameters, and a cost function evaluating it"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RX(x[2], wires=1)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        return dev, circuit
+
+    @pytest.mark.parametrize("x_start", [[1.2, 0.2, -0.3], [-0.62, -2.1, 0.9]])
+    def test_rotosolve_jacobi(self, x_start, tol):
+        """Test that a Jacobi sweep updates all parameters simultaneously"""
+        f = multivariate_funcs[0]
+        opt = RotosolveOptimizer(jacobi=True)
+
+        x_onestep = opt.step(lambda x: f(x[:2]), x_start)
+        x_onestep_target = self.jacobi_step(lambda x: f(x[:2]), x_start)
+
+        assert np.allclose(x_onestep, x_onestep_target, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("jacobi, num_batches", [(False, 3), (True, 1)])
+    def test_rotosolve_batched(self, jacobi, num_batches, mocker, tol):
+        """Test that the circuits of a Rotosolve step are submitted in batches when the
+        objective function is a QNode, and agree with evaluating the QNode"""
+        if not qml.tape_mode_active():
+            pytest.skip("Batched evaluation is only supported in tape mode.")
+
+        dev, circuit = self.circuit()
+        x = np.array([0.3, -0.6, 1.1])
+
+        spy = mocker.spy(dev, "batch_execute")
+        res = RotosolveOptimizer(jacobi=jacobi).step(circuit, x)
+
+        assert spy.call_count == num_batches
+        assert sum(len(call[0][0]) for call in spy.call_args_list) == 9
+
+        expected = RotosolveOptimizer(jacobi=jacobi).step(lambda x: circuit(x), x)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_rotosolve_batched_constructs_once(self, mocker):
+        """Test that each evaluated point of a batched Rotosolve step is constructed once"""
+        if not qml.tape_mode_active():
+            pytest.skip("Batched evaluation is only supported in tape mode.")
+
+        _, circuit = self.circuit()
+        spy = mocker.spy(circuit, "construct")
+
+        RotosolveOptimizer(jacobi=True).step(circuit, np.array([0.3, -0.6, 1.1]))
+        assert spy.call_count == 9
+
+    @pytest.mark.parametrize("jacobi, num_batches", [(False, 3), (True, 1)])
+    def test_rotosolve_batched_expval_cost(self, jacobi, num_batches, mocker, tol):
+        """Test that the circuits of all Hamiltonian terms of an ExpvalCost are submitted
+        in batches, and agree with evaluating the ExpvalCost"""
+        if not qml.tape_mode_active():
+            pytest.skip("Batched evaluation is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+        H = qml.Hamiltonian([0.4, -0.7], [qml.PauliZ(0) @ qml.PauliX(1), qml.PauliY(1)])
+
+        def ansatz(x, **kwargs):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RX(x[2], wires=1)
+
+        cost = qml.ExpvalCost(ansatz, H, dev, diff_method="parameter-shift")
+        x = np.array([0.3, -0.6, 1.1])
+
+        spy = mocker.spy(dev, "batch_execute")
+        res = RotosolveOptimizer(jacobi=jacobi).step(cost, x)
+
+        assert spy.call_count == num_batches
+        assert sum(len(call[0][0]) for call in spy.call_args_list) == 18
+
+        expected = RotosolveOptimizer(jacobi=jacobi).step(lambda x: cost(x), x)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_rotosolve_batched_interface(self, mocker, tol):
+        """Test that the batched results of a QNode using a non-NumPy interface
+        are post-processed by the QNode"""
+        if not qml.tape_mode_active():
+            pytest.skip("Batched evaluation is only supported in tape mode.")
+
+        torch = pytest.importorskip("torch")
+        dev, circuit = self.circuit()
+        circuit.to_torch()
+
+        x = np.array([0.3, -0.6, 1.1])
+        spy = mocker.spy(circuit, "_execute_tape")
+        res = RotosolveOptimizer(jacobi=True).step(circuit, x)
+
+        assert spy.call_count == 9
+        assert isinstance(spy.spy_return, torch.Tensor)
+
+        expected = self.jacobi_step(lambda x: circuit(torch.tensor(x)).item(), x)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_rotosolve_backprop_not_batched(self, mocker, tol):
+        """Test that a QNode which must execute its tapes itself, as it is differentiated
+        via backpropagation, is evaluated point by point"""
+        if not qml.tape_mode_active():
+            pytest.skip("Batched evaluation is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, diff_method="backprop")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        x = np.array([0.3, -0.6])
+        spy = mocker.spy(circuit.device, "batch_execute")
+        res = RotosolveOptimizer(jacobi=True).step(circuit, x)
+
+        assert spy.call_count == 0
+        assert np.allclose(res, self.jacobi_step(circuit, x), atol=tol, rtol=0)
+
+    def test_rotosolve_batched_jacobi_agrees(self, tol):
+        """Test that the batched Jacobi sweep of a QNode agrees with the helper function"""
+        _, circuit = self.circuit()
+        x = np.array([0.3, -0.6, 1.1])
+
+        res = RotosolveOptimizer(jacobi=True).step(circuit, x)
+        expected = self.jacobi_step(circuit, x)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("jacobi, num_batches", [(False, 4), (True, 2)])
+    def test_rotoselect_batched(self, jacobi, num_batches, mocker, tol):
+        """Test that the circuits of a Rotoselect step are submitted in batches when the
+        objective function is a QNode, and agree with evaluating the QNode"""
+        if not qml.tape_mode_active():
+            pytest.skip("Batched evaluation is only supported in tape mode.")
+
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(params, generators=None):
+            generators[0](params[0], wires=0)
+            generators[1](params[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0) @ qml.PauliY(1))
+
+        x = np.array([0.3, -0.6])
+        spy = mocker.spy(dev, "batch_execute")
+
+        opt = RotoselectOptimizer(jacobi=jacobi)
+        res, generators = opt.step(circuit, x, [qml.RX, qml.RX])
+
+        assert spy.call_count == num_batches
+
+        cost_fn = lambda params, generators: circuit(params, generators=generators)
+        expected, expected_generators = opt.step(cost_fn, x, [qml.RX, qml.RX])
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert generators == expected_generators
+
+    def test_rotoselect_jacobi(self, tol):
+        """Test that a Jacobi sweep of the Rotoselect optimizer chooses the
+        optimal parameter and generator at each position independently"""
+
+        def cost_fn(params, generators):
+            # a separable cost function, for which both sweeps take the same step
+            costs = {qml.RX: np.cos, qml.RY: lambda t: 2 * np.sin(t), qml.RZ: lambda t: 0 * t}
+            return sum(costs[gen](p) for p, gen in zip(params, generators))
+
+        x = [0.4, -1.2, 0.5]
+        generators = [qml.RX, qml.RZ, qml.RY]
+
+        res, res_generators = RotoselectOptimizer(jacobi=True).step(
+            cost_fn, list(x), list(generators)
+        )
+        expected, expected_generators = RotoselectOptimizer().step(
+            cost_fn, list(x), list(generators)
+        )
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert res_generators == expected_generators == [qml.RY] * 3
+        assert np.allclose(res, [-np.pi / 2] * 3, atol=tol, rtol=0)
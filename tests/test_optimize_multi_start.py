@@ -0,0 +1,232 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the multi-start optimizer"""
+import copy
+
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.optimize import (
+    AdamOptimizer,
+    GradientDescentOptimizer,
+    MomentumOptimizer,
+    MultiStartOptimizer,
+    QNGOptimizer,
+    RotosolveOptimizer,
+)
+
+
+pytestmark = pytest.mark.usefixtures("tape_mode")
+
+
+def make_circuit(diff_method="parameter-shift", measurement="expval"):
+    """Returns a device and a QNode with classical processing of its parameters"""
+    dev = qml.device("default.qubit", wires=2)
+    measurement = getattr(qml, measurement)
+
+    @qml.qnode(dev, diff_method=diff_method)
+    def circuit(x):
+        qml.RX(x[0], wires=0)
+        qml.RY(2 * x[1], wires=1)
+        qml.CNOT(wires=[0, 1])
+        qml.RX(x[2], wires=1)
+        qml.RY(x[0], wires=0)
+        return measurement(qml.PauliZ(0) @ qml.PauliX(1))
+
+    return dev, circuit
+
+
+def classical_cost(x):
+    """A classical cost function"""
+    return np.sin(x[0]) * np.cos(x[1]) + 0.1 * x[2] ** 2
+
+
+def independent_runs(opt, objective_fn, X, num_steps):
+    """Helper function optimizing each parameter set independently"""
+    X = X.copy()
+    costs = np.zeros(len(X))
+
+    for i, x in enumerate(X):
+        member_opt = copy.deepcopy(opt)
+
+        for _ in range(num_steps):
+            x, costs[i] = member_opt.step_and_cost(objective_fn, x)
+
+        X[i] = x
+
+    return X, costs
+
+
+starts = np.array(
+    [[0.1, 0.2, -0.3], [1.4, -0.6, 0.9], [-2.1, 0.3, 1.2], [0.5, 2.5, -1.0]], requires_grad=True
+)
+
+
+class TestMultiStartOptimizer:
+    """Tests for the MultiStartOptimizer"""
+
+    def test_invalid_optimizer(self):
+        """Test that an exception is raised if the optimizer is not gradient-based"""
+        with pytest.raises(ValueError, match="requires a gradient-based optimizer"):
+            MultiStartOptimizer(RotosolveOptimizer())
+
+    @pytest.mark.parametrize(
+        "opt", [GradientDescentOptimizer(0.1), MomentumOptimizer(0.1), AdamOptimizer(0.1)]
+    )
+    @pytest.mark.parametrize(
+        "diff_method", ["parameter-shift", "finite-diff", "reversible", "backprop"]
+    )
+    def test_qnode(self, opt, diff_method, tol):
+        """Test that optimizing a population of parameter sets agrees with
+        optimizing each parameter set independently"""
+        if diff_method == "backprop" and not qml.tape_mode_active():
+            pytest.skip("The backprop method is only supported in tape mode.")
+
+        _, circuit = make_circuit(diff_method)
+        multi_opt = MultiStartOptimizer(opt)
+
+        X = starts
+
+        for _ in range(3):
+            X, costs = multi_opt.step_and_cost(circuit, X)
+
+        expected, expected_costs = independent_runs(opt, circuit, starts, 3)
+
+        atol = 1e-5 if diff_method == "finite-diff" else tol
+        assert np.allclose(X, expected, atol=atol, rtol=0)
+        assert np.allclose(costs, expected_costs, atol=atol, rtol=0)
+
+    def test_classical_cost(self, tol):
+        """Test that a population is optimized when the objective
+        function is a classical function"""
+        opt = AdamOptimizer(0.2)
+        multi_opt = MultiStartOptimizer(opt)
+
+        X = starts
+
+        for _ in range(4):
+            X = multi_opt.step(classical_cost, X)
+
+        expected, _ = independent_runs(opt, classical_cost, starts, 4)
+        assert np.allclose(X, expected, atol=tol, rtol=0)
+
+    def test_single_batch(self, mocker):
+        """Test that the tapes of all members are submitted to the
+        device in a single batch on every step"""
+        if not qml.tape_mode_active():
+            pytest.skip("Batched evaluation is only supported in tape mode.")
+
+        dev, circuit = make_circuit()
+        spy = mocker.spy(dev, "batch_execute")
+
+        multi_opt = MultiStartOptimizer(GradientDescentOptimizer(0.1))
+        multi_opt.step(circuit, starts)
+        multi_opt.step(circuit, starts)
+
+        assert spy.call_count == 2
+
+        # one forward tape and two shifted tapes per gate parameter, for each member
+        assert len(spy.call_args_list[0][0][0]) == len(starts) * 9
+
+    def test_variance_fallback(self, tol):
+        """Test that a QNode which does not return a single expectation value
+        is evaluated for each member separately"""
+        _, circuit = make_circuit(measurement="var")
+        opt = GradientDescentOptimizer(0.1)
+
+        X, costs = MultiStartOptimizer(opt).step_and_cost(circuit, starts)
+        expected, expected_costs = independent_runs(opt, circuit, starts, 1)
+
+        assert np.allclose(X, expected, atol=tol, rtol=0)
+        assert np.allclose(costs, expected_costs, atol=tol, rtol=0)
+
+    def test_no_trainable_parameters_fallback(self, tol):
+        """Test that a QNode without trainable gate parameters is evaluated
+        for each member separately, with a zero gradient"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(x):
+            qml.RX(0.3, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        with pytest.warns(UserWarning, match="Output seems independent of input"):
+            X, costs = MultiStartOptimizer(GradientDescentOptimizer(0.1)).step_and_cost(
+                circuit, starts
+            )
+
+        assert np.allclose(X, starts, atol=tol, rtol=0)
+        assert np.allclose(costs, np.cos(0.3), atol=tol, rtol=0)
+
+    def test_convergence(self, mocker):
+        """Test that converged members are no longer evaluated or updated"""
+        multi_opt = MultiStartOptimizer(GradientDescentOptimizer(0.5), tol=1e-3)
+
+        # the second member is a stationary point of the cost function
+        X = np.array([[0.4, 0.1, 0.2], [-np.pi / 2, 0.0, 0.0]], requires_grad=True)
+        spy = mocker.spy(GradientDescentOptimizer, "compute_grad")
+
+        X_new, costs = multi_opt.step_and_cost(classical_cost, X)
+
+        assert np.all(multi_opt.converged == [False, True])
+        assert np.allclose(X_new[1], X[1])
+        assert not np.allclose(X_new[0], X[0])
+        assert np.allclose(costs[1], -1)
+        assert spy.call_count == 2
+
+        X_newer, new_costs = multi_opt.step_and_cost(classical_cost, X_new)
+
+        # only the unconverged member is evaluated
+        assert spy.call_count == 3
+        assert np.allclose(X_newer[1], X[1])
+        assert np.allclose(new_costs[1], -1)
+
+        for _ in range(100):
+            X_newer = multi_opt.step(classical_cost, X_newer)
+
+        assert np.all(multi_opt.converged)
+
+    def test_population_size_change(self):
+        """Test that the optimizer state is reset if the population size changes"""
+        multi_opt = MultiStartOptimizer(MomentumOptimizer(0.1), tol=10)
+
+        multi_opt.step(classical_cost, starts)
+        assert np.all(multi_opt.converged)
+
+        multi_opt.step(classical_cost, starts[:2])
+        assert len(multi_opt.converged) == 2
+
+        multi_opt.reset()
+        assert multi_opt.converged is None
+
+    def test_qng(self, tol):
+        """Test that a population can be optimized using the QNG optimizer"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RX(x[2], wires=1)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        opt = QNGOptimizer(0.1, lam=1e-3)
+
+        X, costs = MultiStartOptimizer(opt).step_and_cost(circuit, starts)
+        expected, expected_costs = independent_runs(opt, circuit, starts, 1)
+
+        assert np.allclose(X, expected, atol=tol, rtol=0)
+        assert np.allclose(costs, expected_costs, atol=tol, rtol=0)
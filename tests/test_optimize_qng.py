@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for the QNG optimizer"""
+import numpy as onp
 import pytest
 import scipy as sp
 
@@ -213,3 +214,111 @@ class TestOptimize:
 
         # check final cost
         assert np.allclose(cost_fn(theta), -1.41421356, atol=tol, rtol=0)
+
+
+class TestRecomputePolicy:
+    """Test the policies for recomputing the metric tensor"""
+
+    @staticmethod
+    def circuit():
+        """Returns a single-qubit rotation QNode"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev)
+        def circuit(params):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        return circuit
+
+    def test_recompute_every(self, mocker):
+        """Test that the metric tensor is recomputed every recompute_every steps"""
+        circuit = self.circuit()
+        spy = mocker.spy(qml, "metric_tensor")
+
+        opt = qml.QNGOptimizer(stepsize=0.1, recompute_every=3)
+        theta = np.array([0.5, 0.1])
+
+        for _ in range(7):
+            theta = opt.step(circuit, theta)
+
+        assert spy.call_count == 3
+
+    @pytest.mark.parametrize(
+        "recompute_tol, expected", [(np.inf, [1]), (0.0, [5]), (0.3, [2, 3, 4])]
+    )
+    def test_recompute_tol(self, recompute_tol, expected, mocker):
+        """Test that the metric tensor is recomputed once the variables have
+        moved further than recompute_tol from the last evaluation"""
+        circuit = self.circuit()
+        spy = mocker.spy(qml, "metric_tensor")
+
+        opt = qml.QNGOptimizer(stepsize=0.1, recompute_every=None, recompute_tol=recompute_tol)
+        theta = np.array([0.5, 0.1])
+
+        for _ in range(5):
+            theta = opt.step(circuit, theta)
+
+        assert spy.call_count in expected
+
+    def test_recompute_tensor_false(self, mocker):
+        """Test that the metric tensor is never recomputed if recompute_tensor=False,
+        regardless of the recompute policy"""
+        circuit = self.circuit()
+        spy = mocker.spy(qml, "metric_tensor")
+
+        opt = qml.QNGOptimizer(stepsize=0.1, recompute_tol=0.0)
+        theta = np.array([0.5, 0.1])
+
+        for _ in range(3):
+            theta = opt.step(circuit, theta, recompute_tensor=False)
+
+        assert spy.call_count == 1
+
+    def test_factorization_reused(self, mocker, tol):
+        """Test that the factorization of the metric tensor is reused until the
+        metric tensor is recomputed, and gives the natural gradient"""
+        circuit = self.circuit()
+        spy = mocker.spy(qml.optimize.qng, "cho_factor")
+
+        opt = qml.QNGOptimizer(stepsize=0.1, recompute_every=2)
+        theta = np.array([0.5, 0.1])
+
+        for _ in range(4):
+            grad = np.ravel(qml.grad(circuit)(theta))
+            theta_new = opt.step(circuit, theta)
+
+            expected = theta - 0.1 * np.linalg.solve(opt.metric_tensor, grad)
+            assert np.allclose(theta_new, expected, atol=tol, rtol=0)
+            theta = theta_new
+
+        assert spy.call_count == 2
+
+    def test_indefinite_metric_tensor(self, tol):
+        """Test that a non-singular metric tensor which is not positive definite
+        is solved using an eigendecomposition"""
+        circuit = self.circuit()
+        metric_tensor = np.array([[1.0, 2.0], [2.0, 1.0]])
+
+        opt = qml.QNGOptimizer(stepsize=0.1)
+        theta = np.array([0.5, 0.1])
+        grad = np.ravel(qml.grad(circuit)(theta))
+
+        theta_new = opt.step(circuit, theta, metric_tensor_fn=lambda x: metric_tensor)
+        expected = theta - 0.1 * np.linalg.solve(metric_tensor, grad)
+
+        assert opt._factorization[0] == "eigh"
+        assert np.allclose(theta_new, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "metric_tensor", [np.diag([1.0, 0.0]), np.outer([0.1, 0.3], [0.1, 0.3])]
+    )
+    def test_singular_metric_tensor(self, metric_tensor):
+        """Test that an exception is raised if the metric tensor is singular,
+        including when its zero eigenvalues are subject to round-off error"""
+        circuit = self.circuit()
+        opt = qml.QNGOptimizer(stepsize=0.1)
+
+        with pytest.raises(onp.linalg.LinAlgError, match="Singular matrix"):
+            opt.step(circuit, np.array([0.5, 0.1]), metric_tensor_fn=lambda x: metric_tensor)
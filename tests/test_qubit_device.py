@@ -802,6 +802,83 @@ class TestExecution:
         assert orig_hash != new_hash
 
 
+class TestObservableGroups:
+    """Tests for measuring groups of qubit-wise commuting observables"""
+
+    with QuantumTape() as tape:
+        qml.RX(0.4, wires=0)
+        qml.expval(qml.PauliX(0) @ qml.PauliZ(1))
+        qml.expval(qml.PauliZ(0))
+        qml.expval(qml.PauliZ(1))
+
+    def test_observable_groups(self):
+        """Test that the observables are partitioned into qubit-wise commuting groups"""
+        dev = qml.device("default.qubit", wires=2)
+        groups = dev.observable_groups(self.tape)
+
+        assert sorted(sorted(g) for g in groups) == [[0, 2], [1]]
+
+    def test_observable_groups_cached(self, mocker):
+        """Test that the groups are only computed once for the same observables"""
+        dev = qml.device("default.qubit", wires=2)
+        spy = mocker.spy(qml.grouping, "group_observables")
+
+        groups = dev.observable_groups(self.tape)
+        assert dev.observable_groups(self.tape.copy(copy_operations=True)) == groups
+        spy.assert_called_once()
+
+    def test_observable_groups_cache_evicts(self, mocker, monkeypatch):
+        """Test that the least recently used groupings are evicted once the cache is full"""
+        monkeypatch.setattr(qml._qubit_device, "_OBSERVABLE_GROUPS_CACHE_SIZE", 2)
+        dev = qml.device("default.qubit", wires=2)
+
+        tapes = []
+        for obs in [qml.PauliX, qml.PauliY, qml.PauliZ]:
+            with QuantumTape() as tape:
+                qml.expval(obs(0) @ qml.PauliZ(1))
+                qml.expval(qml.PauliX(0))
+            tapes.append(tape)
+
+        dev.observable_groups(tapes[0])
+        dev.observable_groups(tapes[1])
+        dev.observable_groups(tapes[0])
+        dev.observable_groups(tapes[2])
+        assert len(dev._observable_groups) == 2
+
+        spy = mocker.spy(qml.grouping, "group_observables")
+
+        # tapes[1] was the least recently used and has been evicted
+        dev.observable_groups(tapes[2])
+        spy.assert_not_called()
+        dev.observable_groups(tapes[1])
+        spy.assert_called_once()
+
+    def test_no_capability(self, mock_qubit_device):
+        """Test that no groups are returned if the device does not support them"""
+        dev = mock_qubit_device(wires=2)
+        assert dev.observable_groups(self.tape) is None
+
+    def test_not_sharing_wires(self):
+        """Test that no groups are returned if the observables can be measured jointly"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with QuantumTape() as tape:
+            qml.expval(qml.PauliX(0))
+            qml.expval(qml.PauliY(1))
+
+        assert dev.observable_groups(tape) is None
+
+    def test_not_expectation(self):
+        """Test that no groups are returned if not all measurements are expectation values"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with QuantumTape() as tape:
+            qml.expval(qml.PauliX(0))
+            qml.var(qml.PauliZ(0))
+
+        assert dev.observable_groups(tape) is None
+
+
 class TestBatchExecution:
     """Tests for the batch_execute method."""
 
@@ -554,6 +554,30 @@ class TestHamiltonian:
         old_H.simplify()
         assert old_H.compare(new_H)
 
+    def test_simplify_no_pairwise_comparison(self, mocker):
+        """Tests that the simplify method identifies like-terms without comparing
+        pairs of terms"""
+        spy = mocker.spy(qml.operation.Observable, "compare")
+
+        ops = [qml.PauliX(i % 5) @ qml.PauliZ(5 + i % 3) for i in range(100)]
+        ops += [qml.PauliZ(5 + i % 3) @ qml.PauliX(i % 5) for i in range(100)]
+        H = qml.Hamiltonian([1.0] * 200, ops)
+        H.simplify()
+
+        spy.assert_not_called()
+        assert len(H.ops) == 15
+        assert np.allclose(sorted(H.coeffs), [12] * 5 + [14] * 10)
+
+    def test_simplify_cancelled_term_reappears(self):
+        """Tests that a term whose coefficient cancels is removed, and appended
+        again if it reappears later in the Hamiltonian"""
+        ops = [qml.PauliX(0), qml.PauliZ(1), qml.PauliX(0) @ qml.Identity(2), qml.PauliX(0)]
+        H = qml.Hamiltonian([1, 2, -1, 3], ops)
+        H.simplify()
+
+        assert H.coeffs == [2, 3]
+        assert [op.name for op in H.ops] == ["PauliZ", "PauliX"]
+
     def test_data(self):
         """Tests the obs_data method"""
 
@@ -790,11 +814,64 @@ class TestVQE:
         c2 = cost2(w)
         exec_no_opt = dev.num_executions
 
-        assert exec_opt == 5  # Number of groups in the Hamiltonian
+        assert exec_opt == 1  # All groups are measured on copies of the same prepared state
         assert exec_no_opt == 15
 
         assert np.allclose(c1, c2)
 
+    def test_optimize_without_observable_groups(self):
+        """Test that an ExpvalCost with observable optimization executes each commuting group
+        separately on devices that do not support measuring observable groups."""
+        if not qml.tape_mode_active():
+            pytest.skip("This test is only intended for tape mode")
+
+        dev = qml.device("default.mixed", wires=4)
+        hamiltonian = big_hamiltonian
+
+        cost = qml.ExpvalCost(
+            qml.templates.StronglyEntanglingLayers,
+            hamiltonian,
+            dev,
+            optimize=True,
+            diff_method="parameter-shift"
+        )
+        cost2 = qml.ExpvalCost(
+            qml.templates.StronglyEntanglingLayers,
+            hamiltonian,
+            dev,
+            optimize=False,
+            diff_method="parameter-shift"
+        )
+
+        w = qml.init.strong_ent_layers_uniform(2, 4, seed=1967)
+
+        c1 = cost(w)
+        assert dev.num_executions == 2  # Number of commuting groups in the Hamiltonian
+        assert len(qml.grouping.group_observables(hamiltonian.ops, grouping_type="qwc")) == 5
+
+        assert np.allclose(c1, cost2(w))
+
+    def test_optimize_grad_without_observable_groups(self):
+        """Test that the gradient of ExpvalCost is correct when using observable optimization
+        with Clifford diagonalizing circuits for the commuting groups."""
+        if not qml.tape_mode_active():
+            pytest.skip("This test is only intended for tape mode")
+
+        dev = qml.device("default.mixed", wires=4)
+
+        cost = qml.ExpvalCost(
+            qml.templates.StronglyEntanglingLayers,
+            big_hamiltonian,
+            dev,
+            optimize=True,
+            diff_method="parameter-shift",
+        )
+
+        w = qml.init.strong_ent_layers_uniform(2, 4, seed=1967)
+        dc = qml.grad(cost)(w)
+
+        assert np.allclose(dc, big_hamiltonian_grad)
+
     def test_optimize_grad(self):
         """Test that the gradient of ExpvalCost is accessible and correct when using observable
         optimization and the autograd interface."""
@@ -824,6 +901,29 @@ class TestVQE:
         assert np.allclose(dc, big_hamiltonian_grad)
         assert np.allclose(dc2, big_hamiltonian_grad)
 
+    def test_optimize_grad_adjoint(self, mocker):
+        """Test that the gradient of ExpvalCost is correct when using observable optimization
+        and the adjoint method, and that all groups are differentiated in a single
+        backward pass."""
+        if not qml.tape_mode_active():
+            pytest.skip("This test is only intended for tape mode")
+
+        dev = qml.device("default.qubit", wires=4)
+        hamiltonian = big_hamiltonian
+
+        cost = qml.ExpvalCost(
+            qml.templates.StronglyEntanglingLayers, hamiltonian, dev, optimize=True, diff_method="adjoint"
+        )
+
+        w = qml.init.strong_ent_layers_uniform(2, 4, seed=1967)
+
+        spy = mocker.spy(dev, "adjoint_jacobian")
+        dc = qml.grad(cost)(w)
+
+        assert np.allclose(dc, big_hamiltonian_grad)
+        spy.assert_called_once()
+        assert len(spy.call_args[0][0].observables) == len(hamiltonian.ops)
+
     def test_optimize_grad_torch(self, torch_support):
         """Test that the gradient of ExpvalCost is accessible and correct when using observable
         optimization and the Torch interface."""